@@ -6,6 +6,7 @@ import plotly.graph_objects as go
 
 
 from src.data_loader import load_crypto_data
+from src.eda_data_loader import load_eda_data
 from src.preprocessing import preprocess_crypto_data
 
 # --------------------------------------------------
@@ -383,17 +384,12 @@ elif page == "Exploratory Data Analysis (EDA)":
 
 
     DATA_PATH = f"data/eda/{coin}.csv"
-    df = pd.read_csv(DATA_PATH)
 
-
-    # ---------------- CLEAN & VALIDATE ----------------
-    df["Date"] = pd.to_datetime(df["Date"])
-    df.set_index("Date", inplace=True)
+    # ---------------- LOAD, CLEAN & VALIDATE ----------------
+    # Typed read with a binary sidecar cache (no re-parsing on reruns)
+    df = load_eda_data(DATA_PATH)
 
     numeric_cols = ["Open", "High", "Low", "Close", "Volume"]
-    df[numeric_cols] = df[numeric_cols].astype(float)
-
-    df = df.sort_index()
 
     # ---------------- TABS ----------------
     tabs = st.tabs([
@@ -701,7 +697,7 @@ elif page == "Forecasting Models":
 
     # Historical Fit
     with col1:
-        hist = prophet_forecast(df)
+        hist = prophet_forecast(df, symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(df["Date"], df["Close"], label="Actual", alpha=0.6)
         ax.plot(hist["Date"], hist["Prophet_Forecast"], label="Prophet")
@@ -710,7 +706,7 @@ elif page == "Forecasting Models":
 
     # Future Forecast
     with col2:
-        fut = prophet_forecast_30_days(df)
+        fut = prophet_forecast_30_days(df, symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(fut["Date"], fut["Forecast"], label="30-Day Forecast")
         format_axes(fig, ax, "Future Forecast")
@@ -734,7 +730,7 @@ elif page == "Forecasting Models":
     col1, col2 = st.columns(2)
 
     with col1:
-        hist = arima_forecast(df)
+        hist = arima_forecast(df, symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(df["Date"], df["Close"], label="Actual", alpha=0.6)
         ax.plot(hist["Date"], hist["ARIMA_Fitted"], label="ARIMA")
@@ -742,7 +738,7 @@ elif page == "Forecasting Models":
         st.pyplot(fig)
 
     with col2:
-        fut = arima_forecast_30_days(df)
+        fut = arima_forecast_30_days(df, symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(fut["Date"], fut["Forecast"], label="30-Day Forecast")
         format_axes(fig, ax, "Future Forecast")
@@ -774,7 +770,7 @@ elif page == "Forecasting Models":
         st.pyplot(fig)
 
     with col2:
-        fut = sarima_forecast_30_days(df)
+        fut = sarima_forecast_30_days(df, fit_mode="fast", symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(fut["Date"], fut["Forecast"], label="30-Day Forecast")
         format_axes(fig, ax, "Future Forecast")
@@ -798,7 +794,7 @@ elif page == "Forecasting Models":
     col1, col2 = st.columns(2)
 
     with col1:
-        hist = lstm_forecast(df)
+        hist = lstm_forecast(df, symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(df["Date"], df["Close"], label="Actual", alpha=0.6)
         ax.plot(hist["Date"], hist["LSTM_Prediction"], label="LSTM")
@@ -806,7 +802,7 @@ elif page == "Forecasting Models":
         st.pyplot(fig)
 
     with col2:
-        fut = lstm_forecast_30_days(df)
+        fut = lstm_forecast_30_days(df, mode="global", symbol=coin)
         fig, ax = plt.subplots(figsize=(6, 4))
         ax.plot(fut["Date"], fut["Forecast"], label="30-Day Forecast")
         format_axes(fig, ax, "Future Forecast")
@@ -31,7 +31,7 @@ df = preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))
 # ----------------------------------
 st.subheader("📊 Historical Fit (Actual vs ARIMA)")
 
-arima_df = arima_forecast(df)
+arima_df = arima_forecast(df, symbol=coin)
 
 fig1, ax1 = plt.subplots(figsize=(12, 4))
 
@@ -50,7 +50,7 @@ st.pyplot(fig1)
 # ----------------------------------
 st.subheader("🔮 30-Day Forecast (After 31-12-2025)")
 
-forecast_df = arima_forecast_30_days(df)
+forecast_df = arima_forecast_30_days(df, symbol=coin)
 
 fig2, ax2 = plt.subplots(figsize=(12, 4))
 
@@ -37,7 +37,7 @@ st.pyplot(fig1)
 # -----------------------------
 st.subheader("🔮 30-Day Forecast (After 31-12-2025)")
 
-forecast_df = sarima_forecast_30_days(df)
+forecast_df = sarima_forecast_30_days(df, fit_mode="fast", symbol=coin)
 
 fig2, ax2 = plt.subplots(figsize=(12, 4))
 ax2.plot(
@@ -22,7 +22,7 @@ df = preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))
 # -----------------------------
 st.subheader("📊 Historical Trend (Actual vs Prophet)")
 
-prophet_df = prophet_forecast(df)
+prophet_df = prophet_forecast(df, symbol=coin)
 
 fig1, ax1 = plt.subplots(figsize=(12, 4))
 ax1.plot(df["Date"], df["Close"], label="Actual", color="black", alpha=0.6)
@@ -37,7 +37,7 @@ st.pyplot(fig1)
 # -----------------------------
 st.subheader("🔮 30-Day Forecast (After 31-12-2025)")
 
-forecast_df = prophet_forecast_30_days(df)
+forecast_df = prophet_forecast_30_days(df, symbol=coin)
 
 fig2, ax2 = plt.subplots(figsize=(12, 4))
 ax2.plot(
@@ -3,7 +3,7 @@ import matplotlib.pyplot as plt
 
 from src.data_loader import load_crypto_data
 from src.preprocessing import preprocess_crypto_data
-from src.lstm_model import lstm_forecast, lstm_forecast_30_days
+from src.lstm_model import MC_SAMPLES, has_global_intervals, lstm_forecast, lstm_forecast_30_days
 
 st.title("📈 LSTM Model")
 
@@ -14,6 +14,8 @@ coins = [
 ]
 
 coin = st.sidebar.selectbox("Select Coin", coins)
+# The band needs the prebuilt MC dropout model (scripts/train_global_lstm.py)
+show_interval = has_global_intervals() and st.sidebar.checkbox("Show 90% interval (MC dropout)")
 
 df = preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))
 
@@ -22,7 +24,7 @@ df = preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))
 # -----------------------------
 st.subheader("📊 Historical Fit (Actual vs LSTM)")
 
-lstm_df = lstm_forecast(df)
+lstm_df = lstm_forecast(df, symbol=coin)
 
 fig1, ax1 = plt.subplots(figsize=(12, 4))
 ax1.plot(df["Date"], df["Close"], label="Actual", color="black", alpha=0.6)
@@ -37,7 +39,9 @@ st.pyplot(fig1)
 # -----------------------------
 st.subheader("🔮 30-Day Forecast (After 31-12-2025)")
 
-forecast_df = lstm_forecast_30_days(df)
+forecast_df = lstm_forecast_30_days(
+    df, mode="global", symbol=coin, samples=MC_SAMPLES if show_interval else 0
+)
 
 fig2, ax2 = plt.subplots(figsize=(12, 4))
 ax2.plot(
@@ -46,12 +50,21 @@ ax2.plot(
     label="LSTM 30-Day Forecast",
     color="red"
 )
+if "Lower" in forecast_df:
+    ax2.fill_between(
+        forecast_df["Date"],
+        forecast_df["Lower"],
+        forecast_df["Upper"],
+        color="red",
+        alpha=0.2,
+        label="90% Interval"
+    )
 ax2.legend()
 ax2.grid(True)
 
 st.pyplot(fig2)
 
 st.info(
-    "LSTM uses recursive forecasting. "
-    "Each predicted day is fed back into the model to predict the next."
+    "The 30-day forecast comes from one LSTM shared by all coins, predicting "
+    "all 30 days in one pass (per-coin model until the shared one is built)."
 )
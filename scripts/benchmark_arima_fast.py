@@ -0,0 +1,62 @@
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.arima_model import ARIMA_ORDER, FastARFit, _fit_cold  # noqa: E402
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+STEPS = 30
+REPEATS = 3
+
+
+def best_time(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+def rmse(actual, predicted):
+    return float(np.sqrt(np.mean((actual - predicted) ** 2)))
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+
+    rows = []
+    for csv_path in sorted(DATA_DIR.glob("*.csv")):
+        df = preprocess_crypto_data(load_eda_data(str(csv_path)).reset_index())
+        close = df["Close"].to_numpy()
+
+        mle_ms, mle = best_time(lambda: _fit_cold(close, ARIMA_ORDER))
+        fast_ms, fast = best_time(lambda: FastARFit(close, ARIMA_ORDER))
+
+        # Skip the first bar (statsmodels reports 0 there)
+        rows.append({
+            "Coin": csv_path.stem,
+            "MLE (ms)": mle_ms,
+            "Fast (ms)": fast_ms,
+            "Speedup": mle_ms / fast_ms,
+            "Max param diff": np.abs(fast.params - mle.params[:len(fast.params)]).max(),
+            "Fit RMSE MLE": rmse(close[1:], mle.fittedvalues[1:]),
+            "Fit RMSE fast": rmse(close[1:], fast.fittedvalues[1:]),
+            "Forecast gap (%)": np.abs(fast.forecast(STEPS) - mle.forecast(STEPS)).max() / close[-1] * 100,
+        })
+
+    result = pd.DataFrame(rows)
+    print(f"ARIMA{ARIMA_ORDER}: statsmodels MLE vs least-squares fast fit ({STEPS}-day forecast)\n")
+    print(result.to_string(index=False, float_format=lambda x: f"{x:.4g}"))
+    print(f"\nAll coins: {result['MLE (ms)'].sum():.0f} ms MLE vs {result['Fast (ms)'].sum():.1f} ms fast")
@@ -0,0 +1,70 @@
+import sys
+import time
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.arima_model import ARIMA_ORDER, _fit_cold, fit_arima  # noqa: E402
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.model_cache import MODEL_CACHE  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+
+# Simulated daily refreshes (one new close per coin per day)
+DAYS = 60
+STEPS = 30
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+
+    closes = {
+        p.stem: load_eda_data(str(p))["Close"].to_numpy()
+        for p in sorted(DATA_DIR.glob("*.csv"))
+    }
+
+    rows = []
+    for symbol, close in closes.items():
+        if len(close) < DAYS + 100:
+            continue
+
+        MODEL_CACHE.clear()
+        fit_arima(close[:-DAYS])
+
+        full = incremental = 0.0
+        worst = 0.0
+        for day in range(DAYS - 1, -1, -1):
+            values = close[:len(close) - day]
+
+            started = time.perf_counter()
+            reference = _fit_cold(values, ARIMA_ORDER)
+            full += time.perf_counter() - started
+
+            started = time.perf_counter()
+            updated = fit_arima(values)
+            incremental += time.perf_counter() - started
+
+            # Forecast gap relative to the last price
+            gap = np.abs(updated.forecast(STEPS) - reference.forecast(STEPS)).max() / values[-1]
+            worst = max(worst, gap)
+
+        rows.append({
+            "Coin": symbol,
+            "Full refit (ms/day)": full / DAYS * 1000,
+            "Incremental (ms/day)": incremental / DAYS * 1000,
+            "Speedup": full / incremental,
+            "Max forecast gap (%)": worst * 100,
+        })
+
+    result = pd.DataFrame(rows)
+    print(f"ARIMA{ARIMA_ORDER}, {DAYS} daily refreshes per coin\n")
+    print(result.round(3).to_string(index=False))
+    print(f"\nTotal: {result['Full refit (ms/day)'].sum():.0f} ms/day full vs "
+          f"{result['Incremental (ms/day)'].sum():.0f} ms/day incremental")
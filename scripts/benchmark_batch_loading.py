@@ -0,0 +1,128 @@
+import json
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.batch_loader import load_many  # noqa: E402
+from src.data_loader import load_crypto_data  # noqa: E402
+from src.data_sources import ParquetStoreSource, YahooChartSource  # noqa: E402
+from src.eda_data_loader import load_eda_data  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+START_DATE = "2016-01-01"
+
+# Simulated network round trip of the stand-in server
+LATENCY_SECONDS = 0.25
+
+
+def make_handler(frames, latency, log=None):
+    """
+    Stand-in for the Yahoo chart API serving canned OHLCV from the bundled
+    CSVs. Requested symbols are appended to `log` if given.
+    """
+
+    class ChartHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlparse(self.path)
+            symbol = url.path.rsplit("/", 1)[-1].replace("-USD", "")
+            query = parse_qs(url.query)
+            if log is not None:
+                log.append(symbol)
+
+            start = pd.Timestamp(int(query["period1"][0]), unit="s")
+            end = pd.Timestamp(int(query["period2"][0]), unit="s")
+
+            time.sleep(latency)
+
+            if symbol not in frames:
+                self.send_response(404)
+                self.end_headers()
+                return
+
+            df = frames[symbol]
+            df = df[(df.index >= start) & (df.index < end)]
+
+            body = json.dumps({"chart": {"result": [{
+                "timestamp": ((df.index - pd.Timestamp(0)) // pd.Timedelta(seconds=1)).tolist(),
+                "indicators": {"quote": [{
+                    "open": df["Open"].tolist(),
+                    "high": df["High"].tolist(),
+                    "low": df["Low"].tolist(),
+                    "close": df["Close"].tolist(),
+                    "volume": df["Volume"].tolist(),
+                }]}
+            }]}}).encode()
+
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return ChartHandler
+
+
+def cold_store(base_url):
+    """
+    Empty Parquet store filled from the stand-in server.
+    """
+
+    return ParquetStoreSource(tempfile.mkdtemp(), remote=YahooChartSource(base_url))
+
+
+if __name__ == "__main__":
+    frames = {p.stem: load_eda_data(str(p)) for p in sorted(DATA_DIR.glob("*.csv"))}
+    symbols = list(frames)
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(frames, LATENCY_SECONDS))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_port}/v8/finance/chart"
+
+    # Baseline: the existing path, one blocking load_crypto_data per coin
+    source = cold_store(base_url)
+    started = time.perf_counter()
+    sequential = {symbol: load_crypto_data(symbol, START_DATE, source) for symbol in symbols}
+    sequential_time = time.perf_counter() - started
+
+    # Concurrent: one batch over a pooled session, same (cold) store setup
+    source = cold_store(base_url)
+    started = time.perf_counter()
+    batch, errors = load_many(symbols, START_DATE, source)
+    batch_time = time.perf_counter() - started
+
+    # Warm: everything is in the store now, no requests
+    started = time.perf_counter()
+    warm, _ = load_many(symbols, START_DATE, source)
+    warm_time = time.perf_counter() - started
+
+    panel, _ = load_many(symbols, START_DATE, source, as_panel=True)
+
+    server.shutdown()
+
+    # Both paths must return the same frames
+    assert not errors, errors
+    for symbol in symbols:
+        pd.testing.assert_frame_equal(batch[symbol], sequential[symbol])
+        pd.testing.assert_frame_equal(warm[symbol], sequential[symbol])
+        assert np.allclose(batch[symbol]["Close"], frames[symbol].loc[:"2025-12-31", "Close"]), symbol
+
+    print(f"Coins: {len(symbols)}, simulated latency: {LATENCY_SECONDS * 1000:.0f} ms/request, cold store")
+    print(f"load_crypto_data loop : {sequential_time:.2f} s")
+    print(f"load_many batch       : {batch_time:.2f} s ({sequential_time / batch_time:.1f}x faster)")
+    print(f"load_many, warm store : {warm_time:.2f} s")
+    print(f"Aligned panel         : {panel.values.shape}")
@@ -0,0 +1,68 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import (  # noqa: E402
+    _load_eda_data_untyped,
+    _load_eda_data_typed,
+    _sidecar_path,
+    load_eda_data
+)
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+REPEATS = 20
+
+
+def best_time(fn, repeats=REPEATS):
+    """
+    Best-of-N wall time in milliseconds.
+    """
+
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+if __name__ == "__main__":
+    rows = []
+
+    for csv_path in sorted(DATA_DIR.glob("*.csv")):
+        path = str(csv_path)
+
+        # Warm the sidecar once, then measure pure cache hits
+        _sidecar_path(path).unlink(missing_ok=True)
+        load_eda_data(path)
+
+        # Same rows and values (pyarrow rounds the last digit exactly,
+        # pandas' default C float parser may differ by one ulp)
+        baseline = _load_eda_data_untyped(path)
+        cached = load_eda_data(path)
+        assert cached.index.equals(baseline.index)
+        assert np.allclose(cached.to_numpy(), baseline.to_numpy(), rtol=1e-12, atol=0)
+
+        rows.append({
+            "Coin": csv_path.stem,
+            "Rows": len(baseline),
+            "Untyped (ms)": best_time(lambda: _load_eda_data_untyped(path)),
+            "Typed C (ms)": best_time(lambda: _load_eda_data_typed(path, "c")),
+            "Typed Arrow (ms)": best_time(lambda: _load_eda_data_typed(path, "pyarrow")),
+            "Sidecar (ms)": best_time(lambda: load_eda_data(path)),
+        })
+
+    results = pd.DataFrame(rows)
+    results.loc[len(results)] = ["TOTAL", results["Rows"].sum()] + results.iloc[:, 2:].sum().tolist()
+    results["Speedup"] = results["Untyped (ms)"] / results["Sidecar (ms)"]
+
+    pd.set_option("display.width", 120)
+    print(results.round(2).to_string(index=False))
@@ -0,0 +1,126 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.indicators import DEFAULT_INDICATORS, compute_indicators  # noqa: E402
+from src.panel import OHLCVPanel  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+INDICATORS = DEFAULT_INDICATORS + ["SMA_50", "EMA_50", "EMA_200"]
+
+# Universe sizes to time (bundled coins are repeated to simulate more symbols)
+UNIVERSE_SIZES = [15, 150, 600]
+REPEATS = 3
+
+
+def pandas_indicators(df, indicators):
+    """
+    Reference: today's per-coin path, one pandas call per column.
+    """
+
+    close, high, low = df["Close"], df["High"], df["Low"]
+    out = {}
+
+    for name in indicators:
+        if name == "Log_Return":
+            out[name] = np.log(close).diff()
+        elif name == "MACD":
+            macd = close.ewm(span=12, adjust=False).mean() - close.ewm(span=26, adjust=False).mean()
+            signal = macd.ewm(span=9, adjust=False).mean()
+            out.update({"MACD": macd, "MACD_Signal": signal, "MACD_Hist": macd - signal})
+        else:
+            kind, n = name.split("_")
+            n = int(n)
+            if kind == "SMA":
+                out[name] = close.rolling(n).mean()
+            elif kind == "EMA":
+                out[name] = close.ewm(span=n, adjust=False).mean()
+            elif kind == "RSI":
+                delta = close.diff()
+                gain = delta.clip(lower=0).ewm(alpha=1 / n, adjust=False, min_periods=n).mean()
+                loss = (-delta.clip(upper=0)).ewm(alpha=1 / n, adjust=False, min_periods=n).mean()
+                out[name] = 100 - 100 / (1 + gain / loss)
+            elif kind == "BB":
+                mid = close.rolling(n).mean()
+                band = 2 * close.rolling(n).std()
+                out.update({f"BB_Mid_{n}": mid, f"BB_Upper_{n}": mid + band, f"BB_Lower_{n}": mid - band})
+            elif kind == "ATR":
+                true_range = pd.concat([
+                    high - low,
+                    (high - close.shift()).abs(),
+                    (low - close.shift()).abs()
+                ], axis=1).max(axis=1)
+                out[name] = true_range.ewm(alpha=1 / n, adjust=False, min_periods=n).mean()
+
+    return pd.DataFrame(out)
+
+
+def best_time(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000
+
+
+if __name__ == "__main__":
+    base = {p.stem: load_eda_data(str(p)).reset_index() for p in sorted(DATA_DIR.glob("*.csv"))}
+
+    # -----------------------------
+    # Correctness on the bundled coins
+    # -----------------------------
+    panel = OHLCVPanel.from_frames(base)
+    close, high, low = (panel.field(f).T for f in ["Close", "High", "Low"])
+    fast = compute_indicators(close, high, low, INDICATORS, symbols=panel.symbols)
+
+    worst = 0.0
+    for i, symbol in enumerate(panel.symbols):
+        rows = panel.mask[i]
+        reference = pandas_indicators(base[symbol], INDICATORS)
+        for column in reference.columns:
+            got = fast[column][symbol].to_numpy()[rows]
+            want = reference[column].to_numpy()
+            assert np.array_equal(np.isnan(got), np.isnan(want)), (symbol, column)
+            valid = ~np.isnan(want)
+            if valid.any():
+                # Relative to the column's magnitude (bands can cross zero)
+                scale = np.abs(want[valid]).max()
+                worst = max(worst, float(np.abs(got[valid] - want[valid]).max() / scale))
+
+    print(f"Max difference vs pandas (relative to column scale): {worst:.2e}\n")
+
+    # -----------------------------
+    # Timing
+    # -----------------------------
+    rows = []
+    for size in UNIVERSE_SIZES:
+        frames = {
+            f"{symbol}_{k}": df
+            for k in range(size // len(base))
+            for symbol, df in base.items()
+        }
+        panel = OHLCVPanel.from_frames(frames)
+        close, high, low = (panel.field(f).T for f in ["Close", "High", "Low"])
+
+        per_coin = best_time(lambda: [pandas_indicators(df, INDICATORS) for df in frames.values()])
+        vectorized = best_time(lambda: compute_indicators(close, high, low, INDICATORS))
+
+        rows.append({
+            "Coins": size,
+            "Per-coin pandas (ms)": per_coin,
+            "Vectorized (ms)": vectorized,
+            "Speedup": per_coin / vectorized,
+        })
+
+    print(f"Indicators: {', '.join(INDICATORS)}")
+    print(pd.DataFrame(rows).round(1).to_string(index=False))
@@ -0,0 +1,88 @@
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.lstm_model import (  # noqa: E402
+    fit_lstm,
+    global_lstm_forecasts,
+    load_global_frames,
+)
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+LOOKBACK = 60
+STEPS = 30
+
+
+def mape(actual, forecast):
+    return np.mean(np.abs(forecast / actual - 1)) * 100
+
+
+if __name__ == "__main__":
+    model_dir = Path(tempfile.mkdtemp())
+
+    # Hold out the last STEPS days of every coin
+    full_frames = load_global_frames()
+    frames = {coin: df.iloc[:-STEPS] for coin, df in full_frames.items()}
+
+    # -----------------------------
+    # Fifteen per-coin direct models
+    # -----------------------------
+    started = time.perf_counter()
+    per_coin = {
+        coin: fit_lstm(df[["Close"]].values, "direct", LOOKBACK, STEPS, symbol=coin, model_dir=model_dir)
+        for coin, df in frames.items()
+    }
+    per_coin_train_s = time.perf_counter() - started
+
+    def per_coin_forecasts():
+        forecasts = {}
+        for coin, (engine, scaler) in per_coin.items():
+            window = scaler.transform(frames[coin][["Close"]].values)[-LOOKBACK:]
+            scaled = engine.predict(window.reshape(1, LOOKBACK))[0]
+            forecasts[coin] = scaler.inverse_transform(scaled.reshape(-1, 1)).flatten()
+        return forecasts
+
+    per_coin_forecasts()
+    started = time.perf_counter()
+    separate = per_coin_forecasts()
+    per_coin_infer_ms = (time.perf_counter() - started) * 1000
+
+    # -----------------------------
+    # One global model
+    # -----------------------------
+    started = time.perf_counter()
+    global_lstm_forecasts(frames, LOOKBACK, STEPS, model_dir)
+    global_train_s = time.perf_counter() - started
+
+    started = time.perf_counter()
+    shared = global_lstm_forecasts(frames, LOOKBACK, STEPS, model_dir)
+    global_infer_ms = (time.perf_counter() - started) * 1000
+
+    # -----------------------------
+    # Holdout accuracy
+    # -----------------------------
+    rows = []
+    for coin, df in full_frames.items():
+        actual = df["Close"].values[-STEPS:]
+        rows.append({
+            "Coin": coin,
+            "Rows": len(frames[coin]),
+            "Per-coin MAPE (%)": mape(actual, separate[coin]),
+            "Global MAPE (%)": mape(actual, shared[coin]["Forecast"].values),
+        })
+
+    result = pd.DataFrame(rows)
+    print(f"{STEPS}-day holdout: 15 per-coin direct LSTMs vs one global LSTM\n")
+    print(result.round(2).to_string(index=False))
+    print(f"\nMedian MAPE: {result['Per-coin MAPE (%)'].median():.2f}% per-coin vs "
+          f"{result['Global MAPE (%)'].median():.2f}% global")
+    print(f"Training:  {per_coin_train_s:.0f} s (15 jobs) vs {global_train_s:.0f} s (1 job)")
+    print(f"Inference: {per_coin_infer_ms:.0f} ms (15 passes) vs {global_infer_ms:.0f} ms (1 batched pass)")
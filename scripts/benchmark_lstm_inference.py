@@ -0,0 +1,101 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import tensorflow as tf
+from sklearn.preprocessing import MinMaxScaler
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.lstm_keras import build_model, compile_forecast, compile_rollout  # noqa: E402
+from src.lstm_numpy import NumpyLSTM  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+from src.windowing import window_dataset  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+CSV_PATH = "data/eda/BTC.csv"
+LOOKBACK = 60
+STEPS = 30
+REPEATS = 5
+
+# Latency does not depend on how well the model is trained
+EPOCHS = 1
+
+
+def predict_loop(model, window, steps):
+    """
+    The old recursive forecast: one model.predict per day.
+    """
+
+    last_sequence = window.copy()
+    predictions = []
+    for _ in range(steps):
+        next_scaled = model.predict(last_sequence, verbose=0)[0, 0]
+        predictions.append(next_scaled)
+        last_sequence = np.append(last_sequence[:, 1:, :], [[[next_scaled]]], axis=1)
+    return np.array(predictions)
+
+
+def timed(fn, repeats=REPEATS):
+    """
+    (first call ms, best of the following calls ms, result).
+    """
+
+    started = time.perf_counter()
+    result = fn()
+    first = time.perf_counter() - started
+
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return first * 1000, best * 1000, result
+
+
+if __name__ == "__main__":
+    df = preprocess_crypto_data(load_eda_data(CSV_PATH).reset_index())
+    scaled = MinMaxScaler().fit_transform(df[["Close"]].values)
+    window = scaled[-LOOKBACK:].reshape(1, LOOKBACK, 1).astype(np.float32)
+    window_tensor = tf.constant(window)
+
+    one_step = build_model(LOOKBACK)
+    one_step.fit(window_dataset(scaled, LOOKBACK, shuffle=True), epochs=EPOCHS, verbose=0)
+
+    direct = build_model(LOOKBACK, STEPS)
+    direct.fit(window_dataset(scaled, LOOKBACK, shuffle=True, horizon=STEPS), epochs=EPOCHS, verbose=0)
+
+    # One compiled function per model (traced on its first call)
+    rollout = compile_rollout(one_step)
+    direct_forecast = compile_forecast(direct)
+
+    cases = {
+        "predict() loop (old)": lambda: predict_loop(one_step, window, STEPS),
+        "compiled rollout": lambda: rollout(window_tensor, tf.constant(STEPS)).numpy(),
+        "direct head": lambda: direct_forecast(window_tensor)[0].numpy(),
+        "NumPy rollout": lambda: NumpyLSTM.from_keras(one_step).rollout(window, STEPS)[0],
+        "NumPy direct head": lambda: NumpyLSTM.from_keras(direct).predict(window)[0],
+    }
+
+    rows, results = [], {}
+    for name, fn in cases.items():
+        first_ms, best_ms, results[name] = timed(fn)
+        rows.append({"Mode": name, "First call (ms)": first_ms, "Warm (ms)": best_ms})
+
+    result = pd.DataFrame(rows)
+    result["Speedup vs loop"] = result["Warm (ms)"].iloc[0] / result["Warm (ms)"]
+
+    print(f"LSTM {STEPS}-day inference latency, lookback {LOOKBACK}, best of {REPEATS} warm calls\n")
+    print(result.round(2).to_string(index=False))
+
+    gap = np.abs(results["compiled rollout"] - results["predict() loop (old)"]).max()
+    print(f"\nRollout vs loop max |diff| (scaled): {gap:.2e}")
+    gap = np.abs(results["NumPy rollout"] - results["predict() loop (old)"]).max()
+    print(f"NumPy rollout vs loop max |diff| (scaled): {gap:.2e}")
+    gap = np.abs(results["NumPy direct head"] - results["direct head"]).max()
+    print(f"NumPy vs Keras direct head max |diff| (scaled): {gap:.2e}")
@@ -0,0 +1,72 @@
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.lstm_keras import build_global_model  # noqa: E402
+from src.lstm_model import EMBEDDING_DIM, MC_DROPOUT  # noqa: E402
+from src.lstm_numpy import NumpyLSTM  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+N_COINS = 15
+LOOKBACK = 60
+STEPS = 30
+SAMPLE_COUNTS = [1, 50, 100, 200]
+REPEATS = 3
+
+# Latency and spread do not depend on training: an untrained model is enough
+
+
+def best_of(fn, repeats=REPEATS):
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return min(timings) * 1000
+
+
+def separate_passes(engine, windows, coin_ids, n_samples):
+    """
+    The naive way: one dropout forward pass per sample.
+    """
+
+    rng = np.random.default_rng(0)
+    return np.stack([engine.predict(windows, coin_ids, rng) for _ in range(n_samples)])
+
+
+if __name__ == "__main__":
+    model = build_global_model(LOOKBACK, N_COINS, STEPS, EMBEDDING_DIM, dropout=MC_DROPOUT)
+    engine = NumpyLSTM.from_keras(model)
+
+    rng = np.random.default_rng(42)
+    windows = rng.random((N_COINS, LOOKBACK), dtype=np.float32)
+    coin_ids = np.arange(N_COINS)
+
+    rows = []
+    for n_samples in SAMPLE_COUNTS:
+        rows.append({
+            "Samples": n_samples,
+            "Batched (ms)": best_of(lambda: engine.sample(windows, n_samples, coin_ids, seed=0)),
+            "Separate passes (ms)": best_of(lambda: separate_passes(engine, windows, coin_ids, n_samples)),
+        })
+
+    print(f"MC dropout sampling, global model, {N_COINS} coins x {STEPS}-day horizon\n")
+    print(pd.DataFrame(rows).round(1).to_string(index=False))
+
+    # Same predictive spread as Keras with dropout active
+    n_samples = SAMPLE_COUNTS[-1]
+    keras_paths = model(
+        [np.tile(windows, (n_samples, 1))[..., np.newaxis], np.tile(coin_ids, n_samples)[:, np.newaxis]],
+        training=True,
+    ).numpy().reshape(n_samples, N_COINS, STEPS)
+    numpy_paths = engine.sample(windows, n_samples, coin_ids, seed=0)
+
+    print(f"\nMean per-day std over {n_samples} samples: "
+          f"Keras {keras_paths.std(axis=0).mean():.5f}, NumPy {numpy_paths.std(axis=0).mean():.5f}")
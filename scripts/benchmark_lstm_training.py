@@ -0,0 +1,60 @@
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.lstm_model import TRAINING_MODES, _read_meta, fit_lstm  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+from src.windowing import sliding_windows  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+COINS = ["BTC", "ETH", "SOL"]
+DATA_DIR = Path("data/eda")
+LOOKBACK = 60
+
+
+if __name__ == "__main__":
+    rows = []
+    for coin in COINS:
+        close_prices = preprocess_crypto_data(
+            load_eda_data(str(DATA_DIR / f"{coin}.csv")).reset_index()
+        )[["Close"]].values
+
+        # Same split as lstm_forecast: train on 80% of windows, score the rest
+        train_size = int((len(close_prices) - LOOKBACK) * 0.8)
+
+        for mode in TRAINING_MODES:
+            model_dir = Path(tempfile.mkdtemp())
+            engine, scaler = fit_lstm(
+                close_prices, "eval", LOOKBACK, train_windows=train_size,
+                symbol=coin, model_dir=model_dir, training=mode
+            )
+            stats = _read_meta(model_dir / coin / "eval.json")["training"]
+
+            scaled = scaler.transform(close_prices)[:, 0]
+            predictions = engine.predict(sliding_windows(scaled, LOOKBACK)[train_size:])
+            predictions = scaler.inverse_transform(predictions.reshape(-1, 1)).flatten()
+            actual = close_prices[train_size + LOOKBACK:, 0]
+
+            rows.append({
+                "Coin": coin,
+                "Mode": mode,
+                "Epochs": stats["epochs"],
+                "Wall (s)": stats["wall_seconds"],
+                "Samples/s": stats["samples_per_sec"],
+                "Test MAPE (%)": np.mean(np.abs(predictions / actual - 1)) * 100,
+            })
+
+    result = pd.DataFrame(rows)
+    print(f"LSTM eval-model training by mode (lookback {LOOKBACK})\n")
+    print(result.round(2).to_string(index=False))
+
+    totals = result.groupby("Mode")[["Wall (s)", "Test MAPE (%)"]].agg({"Wall (s)": "sum", "Test MAPE (%)": "median"})
+    print("\n" + totals.round(2).to_string())
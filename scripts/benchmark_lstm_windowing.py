@@ -0,0 +1,71 @@
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.windowing import sliding_windows, window_dataset  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+HISTORY_LENGTHS = [1_000, 3_000, 10_000]
+LOOKBACKS = [30, 60, 120]
+
+
+def loop_windows(values, lookback):
+    """
+    The old windowing: Python loop of slices, then one np.array copy.
+    """
+
+    X, y = [], []
+    for i in range(lookback, len(values)):
+        X.append(values[i - lookback:i, 0])
+        y.append(values[i, 0])
+    X, y = np.array(X), np.array(y)
+    return X.reshape(X.shape[0], X.shape[1], 1), y
+
+
+def measure(fn):
+    tracemalloc.start()
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed * 1000, peak / 1e6
+
+
+def iterate(dataset):
+    for _ in dataset:
+        pass
+
+
+if __name__ == "__main__":
+    rows = []
+    for n in HISTORY_LENGTHS:
+        values = np.random.default_rng(0).random((n, 1))
+        for lookback in LOOKBACKS:
+            loop_ms, loop_mb = measure(lambda: loop_windows(values, lookback))
+            view_ms, view_mb = measure(lambda: sliding_windows(values, lookback))
+            dataset = window_dataset(values, lookback)
+            epoch_ms, _ = measure(lambda: iterate(dataset))
+
+            assert np.array_equal(loop_windows(values, lookback)[0][..., 0], sliding_windows(values, lookback))
+
+            rows.append({
+                "Rows": n,
+                "Lookback": lookback,
+                "Loop (ms)": loop_ms,
+                "Loop peak (MB)": loop_mb,
+                "View (ms)": view_ms,
+                "View peak (MB)": view_mb,
+                "tf.data epoch (ms)": epoch_ms,
+            })
+
+    print("LSTM windowing: Python loop vs strided view / streaming tf.data\n")
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
@@ -0,0 +1,63 @@
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+from src.prophet_model import PREDICTION_MODES, _prophet_frame, fit_prophet  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+STEPS = 30
+REPEATS = 3
+
+
+def best_time(fn, repeats=REPEATS):
+    best = float("inf")
+    for _ in range(repeats):
+        started = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - started)
+    return best * 1000, result
+
+
+if __name__ == "__main__":
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+
+    rows = []
+    for csv_path in sorted(DATA_DIR.glob("*.csv")):
+        df = preprocess_crypto_data(load_eda_data(str(csv_path)).reset_index())
+        model = fit_prophet(_prophet_frame(df))
+        future = model.make_future_dataframe(periods=STEPS, freq="D")
+
+        row = {"Coin": csv_path.stem, "Rows": len(future)}
+        forecasts = {}
+        for mode, settings in PREDICTION_MODES.items():
+            model.uncertainty_samples = settings["uncertainty_samples"]
+            row[f"{mode} (ms)"], forecasts[mode] = best_time(
+                lambda: model.predict(future, vectorized=settings["vectorized"])
+            )
+
+        # yhat does not depend on sampling; interval width does (a little)
+        full, fast = forecasts["full"], forecasts["fast"]
+        row["yhat diff"] = np.abs(forecasts["point"]["yhat"] - full["yhat"]).max()
+        row["Band width gap (%)"] = (
+            np.abs((fast["yhat_upper"] - fast["yhat_lower"]) / (full["yhat_upper"] - full["yhat_lower"]) - 1)
+            .tail(STEPS).max() * 100
+        )
+        rows.append(row)
+
+    result = pd.DataFrame(rows)
+    print(f"Prophet predict over history + {STEPS} days, best of {REPEATS}\n")
+    print(result.round(3).to_string(index=False))
+
+    totals = {mode: result[f"{mode} (ms)"].sum() for mode in PREDICTION_MODES}
+    print("\nAll coins: " + ", ".join(f"{mode} {ms:.0f} ms" for mode, ms in totals.items()))
@@ -0,0 +1,84 @@
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from prophet import Prophet
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.model_cache import MODEL_CACHE  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+from src.prophet_model import PROPHET_CONFIG, _prophet_frame, fit_prophet  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+
+# Bars added by the simulated refresh
+NEW_BARS = 1
+
+
+def timed_fit(prophet_df, **kwargs):
+    MODEL_CACHE.clear()
+    started = time.perf_counter()
+    model = fit_prophet(prophet_df, **kwargs)
+    return time.perf_counter() - started, model
+
+
+def iterations(prophet_df, init=None):
+    """
+    L-BFGS iterations of one fit (separate run: saving them costs time).
+    """
+
+    kwargs = {"init": init} if init is not None else {}
+    model = Prophet(**PROPHET_CONFIG).fit(prophet_df, save_iterations=True, **kwargs)
+    return model.stan_fit.optimized_iterations_np.shape[0]
+
+
+def point_forecast(model, steps=30):
+    model.uncertainty_samples = 0
+    return model.predict(model.make_future_dataframe(periods=steps, freq="D"))["yhat"].to_numpy()
+
+
+if __name__ == "__main__":
+    logging.getLogger("cmdstanpy").setLevel(logging.WARNING)
+    cache_dir = Path(tempfile.mkdtemp())
+
+    rows = []
+    for csv_path in sorted(DATA_DIR.glob("*.csv")):
+        symbol = csv_path.stem
+        prophet_df = _prophet_frame(preprocess_crypto_data(load_eda_data(str(csv_path)).reset_index()))
+
+        # Yesterday's fit, stored per coin
+        timed_fit(prophet_df.iloc[:-NEW_BARS], symbol=symbol, cache_dir=cache_dir)
+        init = {
+            name: np.asarray(value)
+            for name, value in json.loads((cache_dir / f"{symbol}.json").read_text())["init"].items()
+        }
+
+        cold_s, cold = timed_fit(prophet_df, warm_start=False)
+        warm_s, warm = timed_fit(prophet_df, symbol=symbol, cache_dir=cache_dir)
+
+        rows.append({
+            "Coin": symbol,
+            "Cold iters": iterations(prophet_df),
+            "Warm iters": iterations(prophet_df, init),
+            "Cold (s)": cold_s,
+            "Warm (s)": warm_s,
+            "Speedup": cold_s / warm_s,
+            # Log-price gap between the two optima (history + 30 days)
+            "Max yhat gap": np.abs(point_forecast(warm) - point_forecast(cold)).max(),
+        })
+
+    result = pd.DataFrame(rows)
+    print(f"Prophet refit after {NEW_BARS} new bar(s): cold vs warm start\n")
+    print(result.round(3).to_string(index=False))
+    print(f"\nTotal: {result['Cold (s)'].sum():.1f} s cold vs {result['Warm (s)'].sum():.1f} s warm, "
+          f"{result['Cold iters'].sum()} vs {result['Warm iters'].sum()} iterations")
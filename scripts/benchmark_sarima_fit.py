@@ -0,0 +1,77 @@
+import sys
+import time
+import tracemalloc
+import warnings
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.eda_data_loader import load_eda_data  # noqa: E402
+from src.model_cache import MODEL_CACHE  # noqa: E402
+from src.preprocessing import preprocess_crypto_data  # noqa: E402
+from src.sarima_model import FIT_MODES, sarima_forecast_30_days  # noqa: E402
+
+# --------------------------------------------------
+# CONFIG
+# --------------------------------------------------
+DATA_DIR = Path("data/eda")
+COINS = ["BTC", "ETH", "DOGE"]
+STEPS = 30
+
+
+def run(df, fit_mode):
+    """
+    One uncached forecast call; returns (seconds, forecast values).
+    """
+
+    MODEL_CACHE.clear()
+    started = time.perf_counter()
+    forecast = sarima_forecast_30_days(df, steps=STEPS, fit_mode=fit_mode)
+    return time.perf_counter() - started, forecast["Forecast"].to_numpy()
+
+
+def peak_memory(df, fit_mode):
+    """
+    Peak traced allocation (MB) of one uncached forecast call. Timed
+    separately because tracing slows allocation-heavy modes down.
+    """
+
+    MODEL_CACHE.clear()
+    tracemalloc.start()
+    sarima_forecast_30_days(df, steps=STEPS, fit_mode=fit_mode)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+if __name__ == "__main__":
+    warnings.filterwarnings("ignore")
+
+    rows = []
+    for coin in COINS:
+        df = preprocess_crypto_data(load_eda_data(str(DATA_DIR / f"{coin}.csv")).reset_index())
+        last_price = df["Close"].iloc[-1]
+
+        reference = None
+        for fit_mode in FIT_MODES:
+            seconds, forecast = run(df, fit_mode)
+            if reference is None:
+                reference = forecast
+
+            rows.append({
+                "Coin": coin,
+                "Mode": fit_mode,
+                "Fit + forecast (s)": seconds,
+                "Peak memory (MB)": peak_memory(df, fit_mode),
+                "Gap vs default (%)": np.abs(forecast - reference).max() / last_price * 100,
+            })
+
+    result = pd.DataFrame(rows)
+    print(f"SARIMAX(1,1,1)(1,1,1,12), {STEPS}-day forecast\n")
+    print(result.round(3).to_string(index=False))
+
+    print("\nMean over coins:")
+    print(result.groupby("Mode", sort=False)[["Fit + forecast (s)", "Peak memory (MB)"]].mean().round(2))
@@ -1,3 +1,11 @@
+import argparse
+import os
+import random
+import shutil
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
 import yfinance as yf
 import pandas as pd
 from pathlib import Path
@@ -26,49 +34,217 @@ SYMBOLS = {
 START_DATE = "2016-01-01"
 OUTPUT_DIR = Path("data/eda")
 
-# --------------------------------------------------
-# CREATE OUTPUT DIRECTORY
-# --------------------------------------------------
-OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+MAX_WORKERS = 8
+MAX_RETRIES = 3
+BACKOFF_SECONDS = 1.0
+
 
 # --------------------------------------------------
-# DOWNLOAD & CLEAN DATA
+# REMOTE SOURCE
 # --------------------------------------------------
-for coin, symbol in SYMBOLS.items():
-    print(f"\n⬇️ Downloading {coin} ({symbol}) ...")
+def fetch_yfinance(symbol, start, end):
+    """
+    Download daily OHLCV bars for [start, end) from yfinance.
+    A Ticker object per call keeps concurrent downloads independent.
+    """
 
-    df = yf.download(
-        symbol,
-        start=START_DATE,
-        progress=False,
+    df = yf.Ticker(symbol).history(
+        start=start.strftime("%Y-%m-%d"),
+        end=end.strftime("%Y-%m-%d"),
         auto_adjust=False
     )
 
     if df.empty:
-        print(f"⚠️ No data for {coin}, skipping.")
-        continue
+        return df
+
+    # Reset index to get Date column (timezone-naive, like the saved CSVs)
+    df = df.reset_index()
+    df["Date"] = pd.to_datetime(df["Date"]).dt.tz_localize(None).dt.normalize()
+
+    return df
+
+
+def clean_ohlcv(df):
+    """
+    Keep required columns only and drop invalid rows.
+    """
 
     # Fix MultiIndex columns (yfinance issue)
     if isinstance(df.columns, pd.MultiIndex):
         df.columns = df.columns.get_level_values(0)
 
-    # Reset index to get Date column
-    df.reset_index(inplace=True)
-
-    # Keep required columns ONLY
-    df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
+    df = df[COLUMNS].copy()
 
     # Force numeric (critical for mplfinance)
     for col in ["Open", "High", "Low", "Close", "Volume"]:
         df[col] = pd.to_numeric(df[col], errors="coerce")
 
     # Drop invalid rows
-    df.dropna(inplace=True)
+    return df.dropna().reset_index(drop=True)
+
+
+def fetch_with_retries(fetch, symbol, start, end, retries=MAX_RETRIES, backoff=BACKOFF_SECONDS):
+    """
+    Call fetch(symbol, start, end), retrying with exponential backoff and jitter.
+    """
+
+    for attempt in range(retries + 1):
+        try:
+            return fetch(symbol, start, end)
+        except Exception:
+            if attempt == retries:
+                raise
+            time.sleep(backoff * (2 ** attempt) * (1 + random.random()))
+
+
+# --------------------------------------------------
+# CSV FILES
+# --------------------------------------------------
+def last_saved_date(path):
+    """
+    Date of the last row in a saved CSV, read from the end of the file
+    without parsing the whole history. None if the file has no rows.
+    """
+
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        f.seek(max(0, size - 4096))
+        lines = f.read().decode().strip().splitlines()
+
+    if len(lines) == 0 or lines[-1].startswith("Date"):
+        return None
+
+    return pd.Timestamp(lines[-1].split(",", 1)[0])
+
+
+def write_csv_atomic(df, path, append=False):
+    """
+    Write (or append to) a CSV via a temp file + rename, so a reader
+    never sees a half-written file.
+    """
+
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+
+    try:
+        with os.fdopen(fd, "w", newline="") as tmp:
+            if append:
+                with open(path, "r", newline="") as current:
+                    shutil.copyfileobj(current, tmp)
+            df.to_csv(tmp, index=False, header=not append)
+
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+# --------------------------------------------------
+# REFRESH
+# --------------------------------------------------
+def refresh_coin(coin, symbol, fetch=fetch_yfinance, output_dir=OUTPUT_DIR,
+                 incremental=False, retries=MAX_RETRIES, backoff=BACKOFF_SECONDS):
+    """
+    Refresh one coin's CSV. In incremental mode only the bars after the
+    last saved date are fetched and appended.
+    Returns the number of new rows written.
+    """
+
+    output_path = Path(output_dir) / f"{coin}.csv"
+
+    # Only request completed daily bars
+    end = pd.Timestamp.today().normalize()
+    start = pd.Timestamp(START_DATE)
+
+    last_date = None
+    if incremental and output_path.exists():
+        last_date = last_saved_date(output_path)
+
+    if last_date is not None:
+        start = last_date + pd.Timedelta(days=1)
+        if start >= end:
+            return 0
+
+    df = fetch_with_retries(fetch, symbol, start, end, retries, backoff)
+
+    if df.empty:
+        return 0
+
+    df = clean_ohlcv(df)
+
+    if last_date is not None:
+        df = df[df["Date"] > last_date]
+        if df.empty:
+            return 0
+
+    write_csv_atomic(df, output_path, append=last_date is not None)
+
+    return len(df)
+
+
+def refresh_all(symbols=SYMBOLS, fetch=fetch_yfinance, output_dir=OUTPUT_DIR,
+                incremental=False, workers=MAX_WORKERS, retries=MAX_RETRIES,
+                backoff=BACKOFF_SECONDS):
+    """
+    Refresh every coin concurrently through a bounded worker pool.
+    Returns {coin: rows written or the exception that stopped it}.
+    """
+
+    Path(output_dir).mkdir(parents=True, exist_ok=True)
+
+    results = {}
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(
+                refresh_coin, coin, symbol, fetch, output_dir,
+                incremental, retries, backoff
+            ): coin
+            for coin, symbol in symbols.items()
+        }
+
+        for future in as_completed(futures):
+            coin = futures[future]
+            try:
+                results[coin] = future.result()
+            except Exception as exc:
+                results[coin] = exc
+
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Download daily crypto OHLCV data")
+    parser.add_argument("--incremental", action="store_true",
+                        help="only fetch bars after the last date already on disk")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--retries", type=int, default=MAX_RETRIES)
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+
+    results = refresh_all(
+        incremental=args.incremental,
+        workers=args.workers,
+        retries=args.retries
+    )
 
-    # Save CSV
-    output_path = OUTPUT_DIR / f"{coin}.csv"
-    df.to_csv(output_path, index=False)
+    failed = False
+    for coin in SYMBOLS:
+        outcome = results[coin]
+        if isinstance(outcome, Exception):
+            failed = True
+            print(f"❌ {coin}: {outcome}")
+        elif outcome == 0:
+            print(f"⚠️ {coin}: no new data")
+        else:
+            print(f"✅ {coin}: {outcome} rows saved to {OUTPUT_DIR / f'{coin}.csv'}")
 
-    print(f"✅ Saved: {output_path}")
+    elapsed = time.perf_counter() - started
+    if failed:
+        raise SystemExit(f"\n⚠️ Some downloads failed ({elapsed:.1f}s)")
 
-print("\n🎉 ALL CRYPTO DATA DOWNLOADED SUCCESSFULLY")
+    print(f"\n🎉 ALL CRYPTO DATA DOWNLOADED SUCCESSFULLY ({elapsed:.1f}s)")
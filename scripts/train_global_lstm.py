@@ -0,0 +1,34 @@
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from src.lstm_model import MC_SAMPLES, global_lstm_forecasts, load_global_frames  # noqa: E402
+
+# --------------------------------------------------
+# (Re)build the global LSTM the dashboard serves,
+# plus its MC dropout (-mc) variant for the 90% band.
+# Pages never train them: rerun this after refreshing
+# prices (it only retrains when the data changed)
+# --------------------------------------------------
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the global LSTM served by the LSTM page.")
+    parser.add_argument("coins", nargs="*", help="Coins to train on (default: the dashboard's coins)")
+    parser.add_argument("--no-intervals", action="store_true",
+                        help="Skip the MC dropout model (the page then shows no band)")
+    args = parser.parse_args()
+
+    # Training stats and skipped coins are logged by src.lstm_*
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+    samples = 0 if args.no_intervals else MC_SAMPLES
+
+    started = time.perf_counter()
+    forecasts = global_lstm_forecasts(load_global_frames(args.coins or None), samples=samples)
+    print(f"✅ Global LSTM ready for {len(forecasts)} coins in {time.perf_counter() - started:.0f} s")
+
+    for coin, forecast_df in forecasts.items():
+        print(f"{coin:>6}: {forecast_df['Forecast'].iloc[0]:.4f} → {forecast_df['Forecast'].iloc[-1]:.4f}")
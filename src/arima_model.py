@@ -1,23 +1,297 @@
+import json
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from statsmodels.tsa.arima.model import ARIMA
 
-def arima_forecast(df):
+from src.atomic_files import write_text_atomic
+from src.model_cache import MODEL_CACHE, series_fingerprint
+
+# Simple ARIMA baseline order
+ARIMA_ORDER = (5, 1, 0)
+
+# Per-coin orders chosen by src.arima_order_search
+ORDERS_PATH = Path("data/models/arima_orders.json")
+
+# New bars absorbed with a filter pass (parameters kept) before the
+# parameters are re-estimated
+REFIT_AFTER_BARS = 30
+
+# Per-coin fitted parameters, so new bars extend the last fit after a
+# restart or cache eviction (bump the version when the layout changes)
+CHECKPOINT_DIR = Path("data/models/arima")
+CHECKPOINT_VERSION = 1
+
+
+# -----------------------------
+# Per-coin orders
+# -----------------------------
+def load_arima_orders(path=ORDERS_PATH):
     """
-    Train ARIMA model on data capped till 31-12-2025.
+    Saved order-search results: {symbol: {"order": [p, d, q], ...}}.
+    """
+
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_arima_orders(results, path=ORDERS_PATH):
+    """
+    Merge {symbol: result} into the saved orders (atomic write).
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    orders = load_arima_orders(path)
+    orders.update(results)
+
+    write_text_atomic(path, json.dumps(orders, indent=2, sort_keys=True))
+
+
+def get_arima_order(symbol=None, path=ORDERS_PATH):
+    """
+    Saved order for a coin, or the ARIMA_ORDER baseline.
+    """
+
+    if symbol is None:
+        return ARIMA_ORDER
+
+    result = load_arima_orders(path).get(symbol)
+    if result is None:
+        return ARIMA_ORDER
+    return tuple(result["order"])
+
+
+# -----------------------------
+# Fitting
+# -----------------------------
+def _fit_cold(values, order):
+    model_fit = ARIMA(values, order=order).fit()
+    model_fit.estimated_nobs = len(values)
+    return model_fit
+
+
+def update_arima(prev_fit, values, order=ARIMA_ORDER, refit_after=REFIT_AFTER_BARS):
+    """
+    Extend a fit made on a prefix of `values` to the whole series.
+
+    - Up to `refit_after` bars since the last estimation: append the new
+      observations with the parameters kept (one Kalman filter pass).
+    - Otherwise: re-estimate, warm-started from the previous parameters.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    new_values = values[prev_fit.nobs:]
+    estimated_nobs = getattr(prev_fit, "estimated_nobs", prev_fit.nobs)
+
+    if len(new_values) == 0:
+        return prev_fit
+
+    if len(values) - estimated_nobs <= refit_after:
+        model_fit = prev_fit.append(new_values, refit=False)
+        model_fit.estimated_nobs = estimated_nobs
+    else:
+        model_fit = ARIMA(values, order=order).fit(start_params=prev_fit.params)
+        model_fit.estimated_nobs = len(values)
+
+    return model_fit
+
+
+class FastARFit:
+    """
+    ARIMA(p, d, 0) estimated by conditional least squares on the d-times
+    differenced series (intercept only when d == 0), in plain NumPy.
+
+    Exposes the parts of the statsmodels results used here:
+    `params`, `fittedvalues` and `forecast(steps)`.
+    """
+
+    def __init__(self, values, order):
+        p, d, q = order
+        if q:
+            raise ValueError("FastARFit only supports pure AR orders (q = 0)")
+
+        self.order = tuple(order)
+        self.values = np.asarray(values, dtype=np.float64)
+
+        # Last value of every differencing level, to integrate forecasts
+        levels = [self.values]
+        for _ in range(d):
+            levels.append(np.diff(levels[-1]))
+        self._last_levels = [level[-1] for level in levels[:-1]]
+
+        w = levels[-1]
+        self._w = w
+        self._const = d == 0
+
+        # Lag matrix with zero pre-sample values: row t holds w[t-1..t-p]
+        padded = np.concatenate([np.zeros(p), w])
+        lags = np.column_stack(
+            [padded[p - i - 1:len(padded) - i - 1] for i in range(p)] or [np.empty((len(w), 0))]
+        )
+        if self._const:
+            lags = np.column_stack([np.ones(len(w)), lags])
+
+        self.params, *_ = np.linalg.lstsq(lags[p:], w[p:], rcond=None)
+        residuals = w[p:] - lags[p:] @ self.params
+        self.sigma2 = float(residuals @ residuals / max(len(residuals), 1))
+
+        # In-sample one-step predictions, mapped back to price levels
+        # (a residual is the same in differenced and level space)
+        w_hat = lags @ self.params
+        fitted = np.zeros(len(self.values))
+        fitted[d:] = self.values[d:] - (w - w_hat)
+        if d > 1:
+            fitted[1:d] = self.values[:d - 1]
+        self.fittedvalues = fitted
+        self.nobs = len(self.values)
+
+    def forecast(self, steps=1):
+        p, d, _ = self.order
+        const = self.params[0] if self._const else 0.0
+        phi = self.params[1:] if self._const else self.params
+
+        history = list(self._w[-p:]) if p else []
+        out = np.empty(steps)
+        for h in range(steps):
+            out[h] = const + sum(phi[i] * history[-i - 1] for i in range(p))
+            history.append(out[h])
+
+        # Undo the differencing, innermost level first
+        for last in reversed(self._last_levels):
+            out = last + np.cumsum(out)
+        return out
+
+
+def save_arima_checkpoint(symbol, model_fit, values, order, checkpoint_dir=CHECKPOINT_DIR):
+    """
+    Record a coin's fit (parameters + the series prefix they belong to).
+    """
+
+    path = Path(checkpoint_dir) / f"{symbol}.json"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    write_text_atomic(path, json.dumps({
+        "version": CHECKPOINT_VERSION,
+        "order": list(order),
+        "nobs": len(values),
+        "fingerprint": series_fingerprint(values),
+        "params": [float(param) for param in model_fit.params],
+        "estimated_nobs": int(getattr(model_fit, "estimated_nobs", len(values))),
+    }))
+
+
+def load_arima_checkpoint(symbol, values, order, checkpoint_dir=CHECKPOINT_DIR):
+    """
+    The coin's saved fit as a results object on the prefix of `values` it
+    was made on (one filter pass, no estimation), or None if there is no
+    checkpoint for this order / format or the history has changed.
+    """
+
+    path = Path(checkpoint_dir) / f"{symbol}.json"
+    if not path.exists():
+        return None
+
+    checkpoint = json.loads(path.read_text())
+    n = checkpoint["nobs"]
+    if (
+        checkpoint.get("version") != CHECKPOINT_VERSION
+        or tuple(checkpoint["order"]) != tuple(order)
+        or n > len(values)
+        or series_fingerprint(values[:n]) != checkpoint["fingerprint"]
+    ):
+        return None
+
+    model_fit = ARIMA(values[:n], order=order).filter(np.array(checkpoint["params"]))
+    model_fit.estimated_nobs = checkpoint["estimated_nobs"]
+    return model_fit
+
+
+def _latest_prefix_fit(values, order):
+    """
+    Cached fit of the same order whose series is the longest strict prefix
+    of `values` (i.e. the same history before new bars arrived).
+    """
+
+    best = None
+    for key, model_fit in MODEL_CACHE.items():
+        if key[0] != "arima" or key[1] != tuple(order):
+            continue
+
+        n = model_fit.nobs
+        if n >= len(values) or (best is not None and n <= best.nobs):
+            continue
+        if np.array_equal(model_fit.model.endog[:, 0], values[:n]):
+            best = model_fit
+
+    return best
+
+
+def fit_arima(values, order=ARIMA_ORDER, incremental=True, fast=False, symbol=None,
+              checkpoint_dir=CHECKPOINT_DIR):
     """
+    Fit ARIMA on a close-price series, reusing a cached fit when the same
+    series and order were fitted before (historical fit, 30-day forecast
+    and model evaluation all share one fit).
+
+    With incremental=True a cached fit of an earlier version of the same
+    history is updated (see update_arima) instead of refitting from scratch.
+    With `symbol`, the coin's checkpoint in `checkpoint_dir` is used when
+    no cached fit matches (restarts, evictions) and is rewritten after each
+    fit. A series that does not extend any earlier one (e.g. revised
+    history) gets a full fit.
+
+    fast=True estimates pure AR orders with FastARFit (least squares
+    instead of state-space MLE); orders with MA terms still use statsmodels.
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+
+    if fast and order[2] == 0:
+        key = ("arima-fast", tuple(order), series_fingerprint(values))
+        return MODEL_CACHE.get_or_fit(key, lambda: FastARFit(values, order))
+
+    key = ("arima", tuple(order), series_fingerprint(values))
 
-    ts = df.set_index("Date")["Close"]
+    def fit():
+        prev_fit = None
+        if incremental:
+            prev_fit = _latest_prefix_fit(values, order)
+            if prev_fit is None and symbol is not None:
+                prev_fit = load_arima_checkpoint(symbol, values, order, checkpoint_dir)
 
-    # Simple ARIMA baseline
-    model = ARIMA(ts, order=(5, 1, 0))
-    model_fit = model.fit()
+        if prev_fit is None:
+            model_fit = _fit_cold(values, order)
+        else:
+            model_fit = update_arima(prev_fit, values, order)
+
+        if symbol is not None:
+            save_arima_checkpoint(symbol, model_fit, values, order, checkpoint_dir)
+        return model_fit
+
+    return MODEL_CACHE.get_or_fit(key, fit)
+
+
+def arima_forecast(df, symbol=None, fast=False):
+    """
+    Train ARIMA model on data capped till 31-12-2025.
+    Uses the coin's searched order when `symbol` is given; fast=True uses
+    the least-squares estimator for pure AR orders.
+    """
+
+    # Simple ARIMA baseline (or the coin's saved order)
+    model_fit = fit_arima(df["Close"].values, get_arima_order(symbol), fast=fast, symbol=symbol)
 
     # In-sample prediction (fitted values)
     fitted_values = model_fit.fittedvalues
 
     forecast_df = pd.DataFrame({
-        "Date": fitted_values.index,
-        "ARIMA_Fitted": fitted_values.values
+        "Date": df["Date"].values,
+        "ARIMA_Fitted": fitted_values
     })
 
     return forecast_df
@@ -25,8 +299,8 @@ def arima_forecast(df):
 
 # ---------------- TEST ----------------
 if __name__ == "__main__":
-    from data_loader import load_crypto_data
-    from preprocessing import preprocess_crypto_data
+    from src.data_loader import load_crypto_data
+    from src.preprocessing import preprocess_crypto_data
 
     df = load_crypto_data("BTC", "2016-01-01")
     df = preprocess_crypto_data(df)
@@ -36,24 +310,17 @@ if __name__ == "__main__":
     arima_df = arima_forecast(df)
     print(arima_df.head())
 
-import pandas as pd
-from statsmodels.tsa.arima.model import ARIMA
 
-def arima_forecast_30_days(df, steps=30):
+def arima_forecast_30_days(df, steps=30, symbol=None, fast=False):
     """
     Forecast future prices AFTER the last available date.
     """
 
-    # Use closing prices
-    series = df["Close"].values
-
-    # Fit ARIMA (same order you already use)
-    model = ARIMA(series, order=(5, 1, 0))
-    model_fit = model.fit()
+    # Use closing prices (same fit as arima_forecast)
+    model_fit = fit_arima(df["Close"].values, get_arima_order(symbol), fast=fast, symbol=symbol)
 
     # Forecast future steps
-    forecast = model_fit.get_forecast(steps=steps)
-    forecast_values = forecast.predicted_mean
+    forecast_values = model_fit.forecast(steps=steps)
 
     # Generate future dates
     last_date = pd.to_datetime(df["Date"].iloc[-1])
@@ -0,0 +1,192 @@
+import argparse
+import time
+import warnings
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from statsmodels.tsa.arima.model import ARIMA
+from statsmodels.tsa.stattools import kpss
+
+from src.arima_model import ARIMA_ORDER, save_arima_orders
+
+# --------------------------------------------------
+# SEARCH SETTINGS
+# --------------------------------------------------
+MAX_P = 5
+MAX_Q = 3
+MAX_D = 2
+
+# Candidates are first screened on the most recent bars only
+SCREEN_BARS = 365
+
+# Screened candidates this much worse (AIC/BIC points) than the best are
+# pruned before the full fit; at most MAX_FULL_FITS survive
+PRUNE_MARGIN = 4.0
+MAX_FULL_FITS = 6
+
+# Wall-clock budget per coin; the best order found so far is kept
+MAX_SECONDS_PER_COIN = 60.0
+
+MAX_WORKERS = 4
+
+
+def choose_d(values, max_d=MAX_D, alpha=0.05):
+    """
+    Number of differences until the KPSS test no longer rejects
+    stationarity.
+    """
+
+    series = np.asarray(values, dtype=np.float64)
+    for d in range(max_d):
+        with warnings.catch_warnings():
+            # p-values outside KPSS's lookup table are clipped, with a warning
+            warnings.simplefilter("ignore")
+            p_value = kpss(series, nlags="auto")[1]
+        if p_value >= alpha:
+            return d
+        series = np.diff(series)
+    return max_d
+
+
+def _score(values, order, criterion):
+    """
+    AIC/BIC of one candidate (inf when the fit fails).
+    """
+
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        try:
+            model_fit = ARIMA(values, order=order).fit(cov_type="none")
+        except (ValueError, np.linalg.LinAlgError):
+            return np.inf
+
+    score = getattr(model_fit, criterion)
+    return float(score) if np.isfinite(score) else np.inf
+
+
+def select_arima_order(values, criterion="aic", max_p=MAX_P, max_q=MAX_Q,
+                       max_seconds=MAX_SECONDS_PER_COIN):
+    """
+    Pick the (p, d, q) order for one close series.
+
+    1. d from repeated KPSS tests.
+    2. Every (p, q) is fitted on the last SCREEN_BARS bars; candidates whose
+       screening score is already PRUNE_MARGIN worse than the best are pruned.
+    3. The best MAX_FULL_FITS survivors are fitted on the full series.
+
+    Simple orders are tried first, so hitting `max_seconds` still leaves a
+    sensible choice. Returns a JSON-ready result dict.
+    """
+
+    started = time.perf_counter()
+    values = np.asarray(values, dtype=np.float64)
+
+    def out_of_time():
+        return time.perf_counter() - started > max_seconds
+
+    d = choose_d(values)
+    candidates = sorted(
+        ((p, d, q) for p, q in product(range(max_p + 1), range(max_q + 1))),
+        key=lambda order: (order[0] + order[2], order)
+    )
+
+    # -----------------------------
+    # Screening on the recent tail
+    # -----------------------------
+    tail = values[-SCREEN_BARS:]
+    screened = {}
+    for order in candidates:
+        if out_of_time():
+            break
+        screened[order] = _score(tail, order, criterion)
+
+    best_screen = min(screened.values(), default=np.inf)
+    survivors = sorted(
+        (order for order, score in screened.items() if score <= best_screen + PRUNE_MARGIN),
+        key=screened.get
+    )[:MAX_FULL_FITS]
+
+    # -----------------------------
+    # Full fits of the survivors
+    # -----------------------------
+    scores = {}
+    for order in survivors:
+        if scores and out_of_time():
+            break
+        scores[order] = _score(values, order, criterion)
+
+    finite = {order: score for order, score in scores.items() if np.isfinite(score)}
+    if finite:
+        best = min(finite, key=finite.get)
+        score = finite[best]
+    else:
+        best, score = ARIMA_ORDER, None
+
+    return {
+        "order": list(best),
+        "criterion": criterion,
+        "score": score,
+        "nobs": len(values),
+        "screened": len(screened),
+        "full_fits": len(scores),
+        "complete": len(screened) == len(candidates) and len(scores) == len(survivors),
+        "seconds": round(time.perf_counter() - started, 2),
+        "searched_at": str(pd.Timestamp.today().date()),
+    }
+
+
+def _search_one(symbol, values, criterion, max_seconds):
+    return symbol, select_arima_order(values, criterion=criterion, max_seconds=max_seconds)
+
+
+def select_orders(closes, criterion="aic", workers=MAX_WORKERS,
+                  max_seconds=MAX_SECONDS_PER_COIN, save=True):
+    """
+    Search orders for {symbol: close values} across a process pool and
+    (by default) save them for arima_forecast / arima_forecast_30_days.
+    """
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_search_one, symbol, np.asarray(values, dtype=np.float64),
+                            criterion, max_seconds)
+            for symbol, values in closes.items()
+        ]
+        for future in as_completed(futures):
+            symbol, result = future.result()
+            results[symbol] = result
+            score = "n/a" if result["score"] is None else f"{result['score']:.1f}"
+            print(f"✅ {symbol}: ARIMA{tuple(result['order'])} "
+                  f"({criterion.upper()} {score}, {result['seconds']}s)")
+
+    if save:
+        save_arima_orders(results)
+
+    return results
+
+
+if __name__ == "__main__":
+    from src.data_loader import load_crypto_data
+    from src.data_sources import CSV_DIR
+    from src.preprocessing import preprocess_crypto_data
+
+    parser = argparse.ArgumentParser(description="Select and save ARIMA orders per coin.")
+    parser.add_argument("coins", nargs="*", help="Coins to search (default: all bundled coins)")
+    parser.add_argument("--criterion", choices=["aic", "bic"], default="aic")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS_PER_COIN,
+                        help="Time budget per coin")
+    args = parser.parse_args()
+
+    coins = args.coins or [p.stem for p in sorted(CSV_DIR.glob("*.csv"))]
+    # Same series the ARIMA pages and arima_forecast_30_days fit
+    closes = {
+        coin: preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))["Close"].values
+        for coin in coins
+    }
+
+    select_orders(closes, criterion=args.criterion, workers=args.workers,
+                  max_seconds=args.max_seconds)
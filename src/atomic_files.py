@@ -0,0 +1,40 @@
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+
+
+@contextmanager
+def atomic_path(path, suffix=".tmp"):
+    """
+    Yield a fresh temp path next to `path`; when the block succeeds it is
+    renamed over `path`, so readers see the old file or the new one, never
+    a partial write.
+
+    The name comes from tempfile.mkstemp, so concurrent writers of the same
+    file (Streamlit sessions share one process and pid, scripts run next to
+    the app) never share a temp file: the last rename wins.
+    `suffix` keeps extensions writers insist on (np.savez adds ".npz").
+    """
+
+    path = Path(path)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=suffix)
+    os.close(fd)
+
+    try:
+        yield Path(tmp_name)
+        os.chmod(tmp_name, 0o644)
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def write_text_atomic(path, text):
+    """
+    Replace a text file atomically (see atomic_path).
+    """
+
+    with atomic_path(path) as tmp_path:
+        tmp_path.write_text(text)
@@ -0,0 +1,124 @@
+import asyncio
+
+import aiohttp
+import pandas as pd
+
+from src.data_loader import PROJECT_END_DATE, load_crypto_data
+from src.data_sources import (
+    ParquetStoreSource,
+    YahooChartSource,
+    get_default_source
+)
+from src.panel import OHLCVPanel
+
+MAX_CONCURRENCY = 8
+
+
+async def _fetch_chart(session, semaphore, chart, symbol, start, end):
+    url, params = chart.request(symbol, start, end)
+
+    async with semaphore:
+        async with session.get(
+            url,
+            params=params,
+            headers=chart.headers,
+            timeout=aiohttp.ClientTimeout(total=chart.timeout)
+        ) as response:
+            response.raise_for_status()
+            payload = await response.json(content_type=None)
+
+    return chart.parse(payload, start, end)
+
+
+async def _fetch_remote(session, semaphore, remote, symbol, start, end):
+    """
+    One store gap from the store's own remote: over the shared session if
+    it speaks the chart API, else its fetch() in a worker thread (so e.g.
+    the default CachedSource(YFinanceSource()) keeps its TTL cache).
+    """
+
+    if isinstance(remote, YahooChartSource):
+        return await _fetch_chart(session, semaphore, remote, symbol, start, end)
+
+    async with semaphore:
+        return await asyncio.to_thread(remote.fetch, symbol, start, end)
+
+
+async def _load_one(session, semaphore, source, symbol, start):
+    """
+    load_crypto_data for one coin. Store gaps are fetched concurrently
+    from the store's remote; any other source runs in a worker thread.
+    """
+
+    if not (isinstance(source, ParquetStoreSource) and source.remote is not None):
+        async with semaphore:
+            return await asyncio.to_thread(load_crypto_data, symbol, start, source)
+
+    # Store reads and writes run in worker threads so they overlap too
+    stored, coverage, requests = await asyncio.to_thread(source.plan, symbol, start, PROJECT_END_DATE)
+    parts = await asyncio.gather(*[
+        _fetch_remote(session, semaphore, source.remote, symbol, *request) for request in requests
+    ], return_exceptions=True)
+
+    errors = [part for part in parts if isinstance(part, Exception)]
+    if requests:
+        await asyncio.to_thread(source.merge, symbol, stored, coverage, requests, [
+            None if isinstance(part, Exception) else part for part in parts
+        ])
+
+    # Serve what the store now holds (as ParquetStoreSource does when its
+    # remote fails); a coin with nothing stored reports the fetch error
+    try:
+        return await asyncio.to_thread(load_crypto_data, symbol, start, ParquetStoreSource(source.store_dir))
+    except ValueError:
+        if errors:
+            raise errors[0]
+        raise
+
+
+async def load_many_async(symbols, start_date, source=None, concurrency=MAX_CONCURRENCY):
+    """
+    load_crypto_data for several coins at once. With the Parquet store
+    (the default), missing ranges are fetched concurrently from the
+    store's configured remote and written back to the store: a
+    YahooChartSource remote shares one pooled HTTP session, any other
+    remote (e.g. the default cached yfinance) runs in worker threads.
+    Returns ({symbol: DataFrame}, {symbol: exception}) - one bad coin does
+    not fail the batch.
+    """
+
+    source = get_default_source() if source is None else source
+    start = pd.Timestamp(start_date)
+    semaphore = asyncio.Semaphore(concurrency)
+    connector = aiohttp.TCPConnector(limit=concurrency)
+
+    async with aiohttp.ClientSession(connector=connector) as session:
+        outcomes = await asyncio.gather(*[
+            _load_one(session, semaphore, source, symbol, start) for symbol in symbols
+        ], return_exceptions=True)
+
+    frames, errors = {}, {}
+    for symbol, outcome in zip(symbols, outcomes):
+        if isinstance(outcome, Exception):
+            errors[symbol] = outcome
+        else:
+            frames[symbol] = outcome
+
+    return frames, errors
+
+
+def load_many(symbols, start_date, source=None, concurrency=MAX_CONCURRENCY, as_panel=False):
+    """
+    Blocking wrapper around load_many_async for scripts and Streamlit pages.
+    as_panel=True returns a date-aligned OHLCVPanel of the loaded coins
+    instead of a dict (errors are still returned separately).
+    """
+
+    frames, errors = asyncio.run(
+        load_many_async(symbols, start_date, source, concurrency)
+    )
+
+    if as_panel:
+        return OHLCVPanel.from_frames(frames), errors
+
+    return frames, errors
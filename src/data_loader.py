@@ -1,27 +1,30 @@
-import yfinance as yf
 import pandas as pd
 
+from src.price_store import PRICE_COLUMNS
+from src.data_sources import get_default_source
+
 # 🔒 Project-wide fixed end date
 PROJECT_END_DATE = pd.Timestamp("2025-12-31")
 
-def load_crypto_data(symbol, start_date):
+
+def load_crypto_data(symbol, start_date, source=None):
     """
-    Fetch historical crypto data and cap it till 31-12-2025.
+    Load historical crypto data and cap it till 31-12-2025.
+    Reads from the configured data source (local price store by default).
     """
 
-    ticker = f"{symbol}-USD"
-    df = yf.download(ticker, start=start_date, progress=False)
+    if source is None:
+        source = get_default_source()
+
+    df = source.fetch(symbol, pd.Timestamp(start_date), PROJECT_END_DATE)
 
     if df.empty:
         raise ValueError(f"No data found for {symbol}")
 
-    df.reset_index(inplace=True)
-    df["Date"] = pd.to_datetime(df["Date"])
-
     # 🔹 IMPORTANT: Cap data till 31-12-2025
     df = df[df["Date"] <= PROJECT_END_DATE]
 
-    df = df[["Date", "Open", "High", "Low", "Close", "Volume"]]
+    df = df[PRICE_COLUMNS]
     df = df.reset_index(drop=True)
 
     return df
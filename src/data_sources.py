@@ -0,0 +1,337 @@
+import json
+import os
+import time
+from pathlib import Path
+from urllib.parse import urlencode
+from urllib.request import Request, urlopen
+
+import pandas as pd
+import yfinance as yf
+
+from src.atomic_files import atomic_path
+from src.eda_data_loader import load_eda_data
+from src.price_store import (
+    STORE_DIR,
+    PRICE_COLUMNS,
+    read_store,
+    write_store,
+    missing_ranges
+)
+
+CSV_DIR = Path("data/eda")
+CACHE_DIR = Path("data/cache")
+
+# Remote responses are reused for one hour by default
+CACHE_TTL_SECONDS = 3600
+
+# Yahoo Finance chart API (the endpoint yfinance itself uses)
+YAHOO_CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart"
+REQUEST_TIMEOUT_SECONDS = 20
+
+_HEADERS = {"User-Agent": "Mozilla/5.0"}
+
+
+def _empty_frame():
+    return pd.DataFrame({
+        col: pd.Series(dtype="datetime64[ns]" if col == "Date" else "float64")
+        for col in PRICE_COLUMNS
+    })
+
+
+def _between(df, start, end):
+    df = df[(df["Date"] >= start) & (df["Date"] <= end)]
+    return df[PRICE_COLUMNS].reset_index(drop=True)
+
+
+class DataSource:
+    """
+    Base class for price backends.
+    fetch(symbol, start, end) returns daily Date + OHLCV rows for the
+    inclusive range [start, end], sorted by date (empty if none).
+    """
+
+    def fetch(self, symbol, start, end):
+        raise NotImplementedError
+
+
+class YFinanceSource(DataSource):
+    """
+    Live Yahoo Finance data ("<SYMBOL>-USD" tickers).
+    """
+
+    def fetch(self, symbol, start, end):
+        ticker = f"{symbol}-USD"
+        df = yf.download(
+            ticker,
+            start=start.strftime("%Y-%m-%d"),
+            end=(end + pd.Timedelta(days=1)).strftime("%Y-%m-%d"),
+            progress=False
+        )
+
+        if df.empty:
+            return _empty_frame()
+
+        # Fix MultiIndex columns (yfinance issue)
+        if isinstance(df.columns, pd.MultiIndex):
+            df.columns = df.columns.get_level_values(0)
+
+        df = df.reset_index()
+        df["Date"] = pd.to_datetime(df["Date"]).dt.tz_localize(None)
+
+        return _between(df, start, end)
+
+
+class YahooChartSource(DataSource):
+    """
+    Yahoo Finance chart API over plain HTTP. request() / parse() are
+    shared with src.batch_loader, which sends many requests concurrently
+    over one pooled session.
+    """
+
+    def __init__(self, base_url=YAHOO_CHART_URL, timeout=REQUEST_TIMEOUT_SECONDS):
+        self.base_url = base_url
+        self.timeout = timeout
+        self.headers = dict(_HEADERS)
+
+    def request(self, symbol, start, end):
+        """
+        (url, query params) for the daily bars of [start, end].
+        """
+
+        return f"{self.base_url}/{symbol}-USD", {
+            "period1": int(start.timestamp()),
+            "period2": int((end + pd.Timedelta(days=1)).timestamp()),
+            "interval": "1d",
+        }
+
+    def parse(self, payload, start, end):
+        """
+        Date + OHLCV rows of [start, end] from a chart API response.
+        """
+
+        result = (payload["chart"].get("result") or [{}])[0]
+        quote = result.get("indicators", {}).get("quote", [{}])[0]
+        if not result.get("timestamp"):
+            return _empty_frame()
+
+        df = pd.DataFrame({
+            "Date": pd.to_datetime(result["timestamp"], unit="s").normalize().astype("datetime64[ns]"),
+            "Open": quote.get("open"),
+            "High": quote.get("high"),
+            "Low": quote.get("low"),
+            "Close": quote.get("close"),
+            "Volume": quote.get("volume"),
+        })
+
+        df = df.dropna().drop_duplicates(subset="Date", keep="last")
+        return _between(df.astype({col: "float64" for col in PRICE_COLUMNS[1:]}), start, end)
+
+    def fetch(self, symbol, start, end):
+        url, params = self.request(symbol, start, end)
+
+        request = Request(f"{url}?{urlencode(params)}", headers=self.headers)
+        with urlopen(request, timeout=self.timeout) as response:
+            payload = json.loads(response.read())
+
+        return self.parse(payload, start, end)
+
+
+class CSVDirectorySource(DataSource):
+    """
+    One "<SYMBOL>.csv" file per coin, as written by scripts/download_crypto_data.py.
+    """
+
+    def __init__(self, directory=CSV_DIR):
+        self.directory = Path(directory)
+
+    def fetch(self, symbol, start, end):
+        path = self.directory / f"{symbol}.csv"
+        if not path.exists():
+            return _empty_frame()
+
+        df = load_eda_data(str(path)).reset_index()
+        return _between(df, start, end)
+
+
+class ParquetStoreSource(DataSource):
+    """
+    Local Parquet price store. Date ranges the store has not covered yet
+    are fetched from `remote` (if given) and written back.
+    """
+
+    def __init__(self, store_dir=STORE_DIR, remote=None):
+        self.store_dir = Path(store_dir)
+        self.remote = remote
+
+    def fetch(self, symbol, start, end):
+        stored, coverage, requests = self.plan(symbol, start, end)
+
+        if requests and self.remote is not None:
+            parts = [self.remote.fetch(symbol, *request) for request in requests]
+            stored, coverage = self.merge(symbol, stored, coverage, requests, parts)
+
+        if stored is None:
+            return _empty_frame()
+
+        return _between(stored, start, end)
+
+    def plan(self, symbol, start, end):
+        """
+        (stored frame, coverage, [(start, end)] remote requests) needed to
+        complete [start, end] in the store.
+        """
+
+        stored, coverage = read_store(symbol, self.store_dir)
+
+        # Never ask for bars that are not complete yet
+        yesterday = pd.Timestamp.today().normalize() - pd.Timedelta(days=1)
+        gaps = missing_ranges(coverage, start, min(end, yesterday))
+        first_bar = None if stored is None or stored.empty else stored["Date"].min()
+
+        requests = []
+        for gap_start, gap_end in gaps:
+            leading = coverage is not None and gap_end < coverage[0]
+
+            # A range before the first stored bar is fetched through that
+            # bar: getting it back confirms the source is answering, so an
+            # answer with nothing earlier means the coin was not listed yet
+            requests.append((gap_start, first_bar if leading and first_bar is not None else gap_end))
+
+        return stored, coverage, requests
+
+    def merge(self, symbol, stored, coverage, requests, parts):
+        """
+        Write the remote answers to plan()'s requests into the store.
+        An empty (or None, i.e. failed) part is retried on a later load;
+        coverage only grows over requests that returned data.
+        Returns the new (stored frame, coverage).
+        """
+
+        frames = []
+        cov_start, cov_end = coverage if coverage else (None, None)
+
+        for (request_start, request_end), part in zip(requests, parts):
+            if part is None or part.empty:
+                continue
+
+            frames.append(part)
+            cov_start = request_start if cov_start is None else min(cov_start, request_start)
+            cov_end = request_end if cov_end is None else max(cov_end, request_end)
+
+        if not frames:
+            return stored, coverage
+
+        if stored is not None:
+            frames.insert(0, stored)
+
+        coverage = (cov_start, cov_end)
+        stored = write_store(
+            symbol, pd.concat(frames, ignore_index=True), coverage, self.store_dir
+        )
+
+        return stored, coverage
+
+
+class InMemorySource(DataSource):
+    """
+    Fixed frames held in memory ({symbol: DataFrame}), for tests and offline runs.
+    """
+
+    def __init__(self, frames):
+        self.frames = {}
+        for symbol, df in frames.items():
+            df = df.reset_index() if "Date" not in df.columns else df
+            df = df.assign(Date=pd.to_datetime(df["Date"]))
+            self.frames[symbol] = df.sort_values("Date").reset_index(drop=True)
+
+    def fetch(self, symbol, start, end):
+        if symbol not in self.frames:
+            return _empty_frame()
+
+        return _between(self.frames[symbol], start, end)
+
+
+class CachedSource(DataSource):
+    """
+    On-disk TTL cache in front of another (usually remote) source,
+    keyed by symbol and date range. Empty responses are not cached.
+    """
+
+    def __init__(self, source, cache_dir=CACHE_DIR, ttl=CACHE_TTL_SECONDS):
+        self.source = source
+        self.cache_dir = Path(cache_dir)
+        self.ttl = ttl
+
+    def _path(self, symbol, start, end):
+        return self.cache_dir / f"{symbol}_{start:%Y%m%d}_{end:%Y%m%d}.parquet"
+
+    def fetch(self, symbol, start, end):
+        path = self._path(symbol, start, end)
+
+        if path.exists() and time.time() - path.stat().st_mtime < self.ttl:
+            return pd.read_parquet(path)
+
+        df = self.source.fetch(symbol, start, end)
+
+        if not df.empty:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            with atomic_path(path) as tmp_path:
+                df.to_parquet(tmp_path, index=False)
+
+        return df
+
+
+# --------------------------------------------------
+# DEFAULT SOURCE
+# --------------------------------------------------
+_default_source = None
+
+
+def make_source(name):
+    """
+    Build a backend by name:
+      "store"      - Parquet store, filling gaps from cached yfinance (default)
+      "store-only" - Parquet store, never touches the network
+      "csv"        - bundled data/eda CSV files
+      "remote"     - cached yfinance
+      "chart"      - Parquet store, filling gaps from the Yahoo chart API
+    """
+
+    if name == "store":
+        return ParquetStoreSource(remote=CachedSource(YFinanceSource()))
+    if name == "store-only":
+        return ParquetStoreSource()
+    if name == "csv":
+        return CSVDirectorySource()
+    if name == "remote":
+        return CachedSource(YFinanceSource())
+    if name == "chart":
+        return ParquetStoreSource(remote=YahooChartSource())
+
+    raise ValueError(f"Unknown data source: {name}")
+
+
+def get_default_source():
+    """
+    Source used by load_crypto_data, chosen by the CRYPTO_DATA_SOURCE
+    environment variable (CRYPTO_STORE_ONLY=1 implies "store-only").
+    """
+
+    global _default_source
+
+    if _default_source is None:
+        name = os.environ.get("CRYPTO_DATA_SOURCE", "store")
+        if os.environ.get("CRYPTO_STORE_ONLY", "0") == "1":
+            name = "store-only"
+        _default_source = make_source(name)
+
+    return _default_source
+
+
+def set_default_source(source):
+    """
+    Pin every load_crypto_data call to `source` (None restores the default).
+    """
+
+    global _default_source
+    _default_source = source
@@ -1,6 +1,6 @@
 import matplotlib.pyplot as plt
-from data_loader import load_crypto_data
-from preprocessing import preprocess_crypto_data
+from src.data_loader import load_crypto_data
+from src.preprocessing import preprocess_crypto_data
 
 # Load and preprocess
 df = load_crypto_data("BTC", "2016-01-01")
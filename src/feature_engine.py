@@ -0,0 +1,259 @@
+import json
+import math
+from collections import deque
+from pathlib import Path
+
+import pandas as pd
+
+from src.atomic_files import write_text_atomic
+
+STATE_DIR = Path("data/state/features")
+
+PRICE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+FEATURE_COLUMNS = ["Daily_Return", "Volatility_7D", "MA_7", "MA_30"]
+
+STATE_VERSION = 1
+
+
+class _RollingMean:
+    """
+    O(1) fixed-window mean using the same compensated running sum as
+    pandas' rolling().mean(), so results match it bit for bit.
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.nobs = 0
+        self.sum_x = 0.0
+        self.neg_ct = 0
+        self.comp_add = 0.0
+        self.comp_remove = 0.0
+        self.same_count = 0
+        self.prev_value = math.nan
+
+    def _add(self, val):
+        if math.isnan(val):
+            return
+        self.nobs += 1
+        y = val - self.comp_add
+        t = self.sum_x + y
+        self.comp_add = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, val) < 0:
+            self.neg_ct += 1
+        if val == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = val
+
+    def _remove(self, val):
+        if math.isnan(val):
+            return
+        self.nobs -= 1
+        y = -val - self.comp_remove
+        t = self.sum_x + y
+        self.comp_remove = t - self.sum_x - y
+        self.sum_x = t
+        if math.copysign(1.0, val) < 0:
+            self.neg_ct -= 1
+
+    def push(self, val):
+        if len(self.values) == self.window:
+            self._remove(self.values[0])
+        self.values.append(val)
+        self._add(val)
+
+        if self.nobs < self.window:
+            return math.nan
+
+        result = self.sum_x / self.nobs
+        if self.same_count >= self.nobs:
+            result = self.prev_value
+        elif self.neg_ct == 0 and result < 0:
+            result = 0.0
+        elif self.neg_ct == self.nobs and result > 0:
+            result = 0.0
+        return result
+
+
+class _RollingStd:
+    """
+    O(1) fixed-window sample standard deviation using the same Welford
+    update as pandas' rolling().std().
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self.values = deque(maxlen=window)
+        self.nobs = 0
+        self.mean_x = 0.0
+        self.ssqdm_x = 0.0
+        self.comp_add = 0.0
+        self.comp_remove = 0.0
+        self.same_count = 0
+        self.prev_value = math.nan
+
+    def _add(self, val):
+        if math.isnan(val):
+            return
+        if val == self.prev_value:
+            self.same_count += 1
+        else:
+            self.same_count = 1
+        self.prev_value = val
+
+        self.nobs += 1
+        prev_mean = self.mean_x - self.comp_add
+        y = val - self.comp_add
+        t = y - self.mean_x
+        self.comp_add = t + self.mean_x - y
+        self.mean_x = self.mean_x + t / self.nobs
+        self.ssqdm_x = self.ssqdm_x + (val - prev_mean) * (val - self.mean_x)
+
+        # A window of identical values has exactly zero spread
+        if self.same_count >= self.nobs:
+            self.mean_x = val
+            self.ssqdm_x = 0.0
+
+    def _remove(self, val):
+        if math.isnan(val):
+            return
+        self.nobs -= 1
+        if self.nobs:
+            prev_mean = self.mean_x - self.comp_remove
+            y = val - self.comp_remove
+            t = y - self.mean_x
+            self.comp_remove = t + self.mean_x - y
+            self.mean_x = self.mean_x - t / self.nobs
+            self.ssqdm_x = self.ssqdm_x - (val - prev_mean) * (val - self.mean_x)
+        else:
+            self.mean_x = 0.0
+            self.ssqdm_x = 0.0
+
+    def push(self, val):
+        if len(self.values) == self.window:
+            self._remove(self.values[0])
+        self.values.append(val)
+        self._add(val)
+
+        if self.nobs < self.window:
+            return math.nan
+
+        if self.nobs == 1 or self.same_count >= self.nobs:
+            return 0.0
+        return math.sqrt(max(self.ssqdm_x / (self.nobs - 1), 0.0))
+
+
+class FeatureEngine:
+    """
+    Stateful version of preprocess_crypto_data.
+
+    Keeps the rolling-window state (running sums, sums of squares and the
+    last N values) so each new daily bar updates every feature in O(1).
+    """
+
+    def __init__(self):
+        self.prev_close = math.nan
+        self.last_date = None
+        self.vol_7 = _RollingStd(7)
+        self.ma_7 = _RollingMean(7)
+        self.ma_30 = _RollingMean(30)
+
+    def update(self, bar):
+        """
+        Add one bar (mapping with Date + OHLCV). Returns the feature row,
+        or None while the warm-up windows are still filling (those rows
+        are dropped by preprocess_crypto_data as well).
+        """
+
+        close = float(bar["Close"])
+
+        daily_return = close / self.prev_close - 1
+        row = dict(
+            {col: bar[col] for col in PRICE_COLUMNS},
+            Daily_Return=daily_return,
+            Volatility_7D=self.vol_7.push(daily_return),
+            MA_7=self.ma_7.push(close),
+            MA_30=self.ma_30.push(close)
+        )
+
+        self.prev_close = close
+        self.last_date = pd.Timestamp(bar["Date"])
+
+        if any(pd.isna(value) for value in row.values()):
+            return None
+        return row
+
+    def append(self, df):
+        """
+        Feed new bars (Date-sorted DataFrame) and return their feature rows.
+        Bars on or before the last processed date are ignored.
+        """
+
+        if self.last_date is not None:
+            df = df[pd.to_datetime(df["Date"]) > self.last_date]
+
+        rows = [self.update(bar) for bar in df[PRICE_COLUMNS].to_dict("records")]
+        rows = [row for row in rows if row is not None]
+
+        return pd.DataFrame(rows, columns=PRICE_COLUMNS + FEATURE_COLUMNS)
+
+    @classmethod
+    def from_history(cls, df):
+        """
+        Build the engine from full history. Returns (engine, features),
+        where features equals preprocess_crypto_data(df).
+        """
+
+        engine = cls()
+        features = engine.append(df.sort_values("Date"))
+        return engine, features
+
+    # -----------------------------
+    # Persistence
+    # -----------------------------
+    def to_state(self):
+        def window_state(window):
+            state = dict(vars(window))
+            state["values"] = list(window.values)
+            return state
+
+        return {
+            "version": STATE_VERSION,
+            "prev_close": self.prev_close,
+            "last_date": None if self.last_date is None else str(self.last_date.date()),
+            "vol_7": window_state(self.vol_7),
+            "ma_7": window_state(self.ma_7),
+            "ma_30": window_state(self.ma_30),
+        }
+
+    @classmethod
+    def from_state(cls, state):
+        if state.get("version") != STATE_VERSION:
+            raise ValueError("Unsupported feature state version")
+
+        engine = cls()
+        engine.prev_close = state["prev_close"]
+        engine.last_date = None if state["last_date"] is None else pd.Timestamp(state["last_date"])
+
+        for name in ["vol_7", "ma_7", "ma_30"]:
+            window = getattr(engine, name)
+            for key, value in state[name].items():
+                if key == "values":
+                    window.values = deque(value, maxlen=window.window)
+                else:
+                    setattr(window, key, value)
+
+        return engine
+
+    def save(self, symbol, state_dir=STATE_DIR):
+        path = Path(state_dir) / f"{symbol}.json"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_text_atomic(path, json.dumps(self.to_state()))
+
+    @classmethod
+    def load(cls, symbol, state_dir=STATE_DIR):
+        path = Path(state_dir) / f"{symbol}.json"
+        return cls.from_state(json.loads(path.read_text()))
@@ -0,0 +1,230 @@
+import re
+
+import numpy as np
+import pandas as pd
+from scipy.signal import lfilter
+
+# Requestable indicators; "<NAME>_<n>" sets the window/span, e.g. "EMA_50"
+DEFAULT_INDICATORS = [
+    "Log_Return", "EMA_12", "EMA_26", "RSI_14", "MACD", "BB_20", "ATR_14"
+]
+
+_PATTERN = re.compile(r"^(SMA|EMA|RSI|BB|ATR)_(\d+)$")
+
+
+# --------------------------------------------------
+# PACKING
+# --------------------------------------------------
+# Coins list on different dates and may have gaps. Each column's valid bars
+# are moved to the top (in date order), so every kernel below works on
+# consecutive bars for all coins at once, exactly like a per-coin
+# pandas call on that coin's own rows. Results are scattered back after.
+
+def _pack(mask):
+    """
+    Destination row of every (date, coin) cell: valid bars first, in date
+    order, then the empty cells. O(dates x coins), no sorting.
+    """
+
+    valid_rows = np.cumsum(mask, axis=0, dtype=np.int32) - 1
+    n_valid = mask.sum(axis=0, dtype=np.int32)
+    empty_rows = n_valid + np.cumsum(~mask, axis=0, dtype=np.int32) - 1
+    return np.where(mask, valid_rows, empty_rows)
+
+
+def _take(x, rows):
+    packed = np.empty_like(x)
+    np.put_along_axis(packed, rows, x, axis=0)
+    return packed
+
+
+def _unpack(y, rows, mask):
+    out = np.take_along_axis(y, rows, axis=0)
+    out[~mask] = np.nan
+    return out
+
+
+# --------------------------------------------------
+# KERNELS (packed dates x coins arrays)
+# --------------------------------------------------
+def _ema(x, alpha, start=0, min_periods=1):
+    """
+    Recursive EMA (pandas ewm(adjust=False)) down every column in one
+    lfilter call; rows before `start` are ignored.
+    """
+
+    out = np.full_like(x, np.nan)
+    body = x[start:]
+    if len(body) == 0:
+        return out
+
+    zi = ((1 - alpha) * body[0])[np.newaxis, :]
+    out[start:], _ = lfilter([alpha], [1, alpha - 1], body, axis=0, zi=zi)
+    out[:start + min_periods - 1] = np.nan
+    return out
+
+
+def _window_sum(x, window):
+    """
+    Rolling sum in O(dates) for any window: within chunks of `window` rows
+    every window is one chunk suffix plus the next chunk's prefix, so each
+    partial sum covers at most `window` values (as accurate as summing
+    the window directly, unlike one long cumulative sum).
+    """
+
+    n = len(x)
+    out = np.full_like(x, np.nan)
+    if n < window:
+        return out
+
+    pad = np.full(((-n) % window,) + x.shape[1:], np.nan)
+    chunks = np.concatenate([x, pad]).reshape((-1, window) + x.shape[1:])
+
+    prefix = np.cumsum(chunks, axis=1).reshape((-1,) + x.shape[1:])[:n]
+    suffix = np.cumsum(chunks[:, ::-1], axis=1)[:, ::-1].reshape((-1,) + x.shape[1:])[:n]
+
+    ends = np.arange(window - 1, n)
+    whole_chunk = (ends % window == window - 1)[:, np.newaxis]
+    out[window - 1:] = np.where(
+        whole_chunk,
+        prefix[ends],
+        suffix[ends - window + 1] + prefix[ends]
+    )
+    return out
+
+
+def _sma(x, window):
+    return _window_sum(x, window) / window
+
+
+def _rolling_std(x, window):
+    # Shifting by a constant leaves the variance unchanged and keeps the
+    # sums of squares small
+    centered = x - x[0]
+    s1 = _window_sum(centered, window)
+    s2 = _window_sum(centered * centered, window)
+    return np.sqrt(np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0))
+
+
+def _diff(x):
+    out = np.full_like(x, np.nan)
+    out[1:] = x[1:] - x[:-1]
+    return out
+
+
+def _rsi(close, window):
+    delta = _diff(close)
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+    gain[0] = loss[0] = np.nan
+
+    avg_gain = _ema(gain, 1 / window, start=1, min_periods=window)
+    avg_loss = _ema(loss, 1 / window, start=1, min_periods=window)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return 100 - 100 / (1 + avg_gain / avg_loss)
+
+
+def _atr(high, low, close, window):
+    prev_close = np.full_like(close, np.nan)
+    prev_close[1:] = close[:-1]
+
+    true_range = np.fmax(
+        high - low,
+        np.fmax(np.abs(high - prev_close), np.abs(low - prev_close))
+    )
+
+    return _ema(true_range, 1 / window, min_periods=window)
+
+
+# --------------------------------------------------
+# ENGINE
+# --------------------------------------------------
+def _compute(name, close, high, low):
+    """
+    Columns produced by one requested indicator: {column_name: array}.
+    """
+
+    if name == "Log_Return":
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return {name: _diff(np.log(close))}
+
+    if name == "MACD":
+        macd = _ema(close, 2 / 13) - _ema(close, 2 / 27)
+        signal = _ema(macd, 2 / 10)
+        return {"MACD": macd, "MACD_Signal": signal, "MACD_Hist": macd - signal}
+
+    match = _PATTERN.match(name)
+    if match is None:
+        raise ValueError(f"Unknown indicator: {name}")
+
+    kind, n = match.group(1), int(match.group(2))
+
+    if kind == "SMA":
+        return {name: _sma(close, n)}
+    if kind == "EMA":
+        return {name: _ema(close, 2 / (n + 1))}
+    if kind == "RSI":
+        return {name: _rsi(close, n)}
+    if kind == "BB":
+        mid = _sma(close, n)
+        band = 2 * _rolling_std(close, n)
+        return {f"BB_Mid_{n}": mid, f"BB_Upper_{n}": mid + band, f"BB_Lower_{n}": mid - band}
+
+    if high is None or low is None:
+        raise ValueError("ATR needs High and Low prices")
+    return {name: _atr(high, low, close, n)}
+
+
+def compute_indicators(close, high=None, low=None, indicators=DEFAULT_INDICATORS,
+                       index=None, symbols=None):
+    """
+    Compute the requested indicators for every coin at once.
+
+    close/high/low: (dates, coins) arrays, NaN where a coin has no bar.
+    Returns a DataFrame with (indicator, coin) columns, so
+    result["RSI_14"] is a dates x coins frame.
+    """
+
+    # Row-major copies: panel fields arrive as transposed views
+    close = np.ascontiguousarray(close, dtype=np.float64)
+    mask = ~np.isnan(close)
+    if high is not None and low is not None:
+        high = np.ascontiguousarray(high, dtype=np.float64)
+        low = np.ascontiguousarray(low, dtype=np.float64)
+        mask &= ~np.isnan(high) & ~np.isnan(low)
+
+    rows = _pack(mask)
+    packed_close = _take(close, rows)
+    packed_high = None if high is None else _take(high, rows)
+    packed_low = None if low is None else _take(low, rows)
+
+    columns = {}
+    for name in indicators:
+        for column, values in _compute(name, packed_close, packed_high, packed_low).items():
+            columns[column] = _unpack(values, rows, mask)
+
+    n_coins = close.shape[1]
+    if symbols is None:
+        symbols = list(range(n_coins))
+
+    return pd.DataFrame(
+        np.concatenate(list(columns.values()), axis=1),
+        index=index,
+        columns=pd.MultiIndex.from_product([list(columns), list(symbols)])
+    )
+
+
+def panel_indicators(panel, indicators=DEFAULT_INDICATORS):
+    """
+    Indicators for every coin of an OHLCVPanel.
+    """
+
+    return compute_indicators(
+        panel.field("Close").T,
+        panel.field("High").T,
+        panel.field("Low").T,
+        indicators=indicators,
+        index=pd.DatetimeIndex(panel.dates.astype("datetime64[ns]"), name="Date"),
+        symbols=panel.symbols
+    )
@@ -0,0 +1,184 @@
+import logging
+import random
+import time
+from contextlib import contextmanager
+
+import numpy as np
+import tensorflow as tf
+
+from tensorflow.keras.callbacks import EarlyStopping # type: ignore
+from tensorflow.keras.models import Model, Sequential # type: ignore
+from tensorflow.keras.optimizers import Adam # type: ignore
+from tensorflow.keras.layers import ( # pyright: ignore[reportMissingImports]
+    LSTM, Concatenate, Dense, Dropout, Embedding, Flatten, Input, RepeatVector
+)
+
+# Keras side of the LSTM models: architectures, training and compiled
+# inference (benchmarks only). Serving uses src.lstm_numpy.
+
+# Recorded in exported artifacts' meta (not in their keys)
+TF_VERSION = tf.__version__
+
+logger = logging.getLogger(__name__)
+
+
+def configure(options):
+    """
+    Apply the thread pool sizes (0 = TensorFlow default) of a training
+    options dict. Thread pools can only be sized before the TensorFlow
+    runtime starts; a later change is logged and skipped.
+    """
+
+    threading = tf.config.threading
+    current = (threading.get_intra_op_parallelism_threads(), threading.get_inter_op_parallelism_threads())
+    wanted = (options["intra_op_threads"], options["inter_op_threads"])
+
+    if wanted != current:
+        try:
+            threading.set_intra_op_parallelism_threads(wanted[0])
+            threading.set_inter_op_parallelism_threads(wanted[1])
+        except RuntimeError:
+            logger.warning("TensorFlow threads already fixed at intra/inter = %s, keeping them", current)
+
+
+@contextmanager
+def seeded(seed):
+    """
+    Seed Keras / TensorFlow for building and training one model (None =
+    unseeded). Keras draws its seeds through Python's and NumPy's global
+    RNGs, so their states are restored on exit: the host process (e.g.
+    Streamlit) keeps its own random state.
+    """
+
+    if seed is None:
+        yield
+        return
+
+    python_state, numpy_state = random.getstate(), np.random.get_state()
+    tf.keras.utils.set_random_seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(python_state)
+        np.random.set_state(numpy_state)
+
+
+def train_model(model, train_ds, n_samples, options, val_ds=None, label="LSTM"):
+    """
+    Fit with early stopping on val_ds (when given and patience is set),
+    restoring the best weights. Returns (and logs at INFO) epochs, wall
+    time and throughput.
+    """
+
+    callbacks = []
+    if val_ds is not None and options["patience"]:
+        callbacks.append(EarlyStopping(
+            monitor="val_loss", patience=options["patience"], restore_best_weights=True
+        ))
+
+    started = time.perf_counter()
+    history = model.fit(
+        train_ds,
+        validation_data=val_ds,
+        epochs=options["epochs"],
+        callbacks=callbacks,
+        verbose=0
+    )
+    wall_seconds = time.perf_counter() - started
+
+    epochs = len(history.history["loss"])
+    stats = {
+        "epochs": epochs,
+        "samples": int(n_samples),
+        "wall_seconds": round(wall_seconds, 3),
+        "samples_per_sec": round(n_samples * epochs / wall_seconds, 1),
+    }
+    if "val_loss" in history.history:
+        stats["best_val_loss"] = float(min(history.history["val_loss"]))
+
+    logger.info("⏱️ %s: %d epochs x %s samples in %.1f s (%s samples/s)",
+                label, epochs, f"{n_samples:,}", wall_seconds, f"{stats['samples_per_sec']:,.0f}")
+    return stats
+
+
+def _lstm_stack(units, layers, dropout):
+    """
+    `layers` LSTM(units) layers, each followed by Dropout(dropout) when
+    dropout > 0 (kept active for Monte Carlo dropout intervals).
+    """
+
+    stack = []
+    for n in range(layers):
+        stack.append(LSTM(units, return_sequences=n < layers - 1))
+        if dropout:
+            stack.append(Dropout(dropout))
+    return stack
+
+
+def build_model(lookback, horizon=1, units=50, layers=2, learning_rate=0.001, dropout=0.0):
+    """
+    `layers` stacked LSTM(units) layers and a Dense head with one unit per
+    horizon (defaults: two LSTM(50) layers, Adam's default learning rate,
+    no dropout).
+    """
+
+    model = Sequential(
+        [Input(shape=(lookback, 1))] + _lstm_stack(units, layers, dropout) + [Dense(horizon)]
+    )
+
+    model.compile(optimizer=Adam(learning_rate=learning_rate), loss="mse")
+    return model
+
+
+def build_global_model(lookback, n_coins, horizon, embedding_dim, dropout=0.0):
+    """
+    Direct multi-horizon LSTM shared by all coins. A learned coin embedding
+    is repeated along the window and fed next to the (per-coin scaled)
+    prices.
+    """
+
+    window = Input(shape=(lookback, 1))
+    coin_id = Input(shape=(1,), dtype="int32")
+
+    coin_vector = Flatten()(Embedding(n_coins, embedding_dim)(coin_id))
+    x = Concatenate()([window, RepeatVector(lookback)(coin_vector)])
+    for layer in _lstm_stack(50, 2, dropout):
+        x = layer(x)
+
+    model = Model(inputs=[window, coin_id], outputs=Dense(horizon)(x))
+    model.compile(optimizer="adam", loss="mse")
+    return model
+
+
+def compile_rollout(model):
+    """
+    Compiled recursive forecast for one one-step model: feeds the model its
+    own predictions for `steps` days inside one graph (no per-step
+    predict() call or window reallocation). The model is closed over, so
+    build this once per model and reuse it; each call takes a
+    (1, lookback, 1) float32 window and returns (steps,) scaled predictions.
+    """
+
+    @tf.function(reduce_retracing=True)
+    def rollout(window, steps):
+        predictions = tf.TensorArray(tf.float32, size=steps)
+        for i in tf.range(steps):
+            next_value = model(window, training=False)
+            predictions = predictions.write(i, next_value[0, 0])
+            window = tf.concat([window[:, 1:, :], next_value[:, tf.newaxis, :]], axis=1)
+        return predictions.stack()
+
+    return rollout
+
+
+def compile_forecast(model):
+    """
+    Compiled forward pass of one model (all horizons for a batch of
+    inputs), closed over like compile_rollout.
+    """
+
+    @tf.function(reduce_retracing=True)
+    def forecast(inputs):
+        return model(inputs, training=False)
+
+    return forecast
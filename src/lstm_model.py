@@ -1,66 +1,310 @@
+import hashlib
+import json
+import logging
+import shutil
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
 
 from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import Sequential # type: ignore
-from tensorflow.keras.layers import LSTM, Dense, Input # pyright: ignore[reportMissingImports]
 
-def lstm_forecast(df, lookback=60):
+from src.atomic_files import write_text_atomic
+from src.lstm_numpy import EXPORT_VERSION, NumpyLSTM
+from src.model_cache import MODEL_CACHE, series_fingerprint
+from src.windowing import (
+    BATCH_SIZE, multi_window_bounds, multi_window_dataset, sliding_windows, window_dataset
+)
+
+# TensorFlow is imported only to train (src.lstm_keras); trained weights
+# are exported to NumPy and every forecast runs on src.lstm_numpy
+
+logger = logging.getLogger(__name__)
+
+# Exported weights + scaler parameters, one directory per coin
+LSTM_MODEL_DIR = Path("data/models/lstm")
+
+# Per-coin hyperparameters written by src.lstm_search
+CONFIGS_PATH = Path("data/models/lstm_configs.json")
+
+# Baseline hyperparameters (used when a coin has no searched config)
+DEFAULT_LSTM_CONFIG = {
+    "lookback": 60,
+    "units": 50,
+    "layers": 2,
+    "learning_rate": 0.001,
+    "dropout": 0.0,
+}
+
+# Monte Carlo dropout intervals: models trained without dropout get a
+# separate "<role>-mc" variant with this rate; bands are these quantiles
+# of MC_SAMPLES passes (cost grows linearly with the sample count)
+MC_DROPOUT = 0.1
+INTERVAL_QUANTILES = (0.05, 0.95)
+MC_SAMPLES = 100
+MC_SEED = 0
+
+# Training settings. validation_fraction holds out the latest training
+# windows for early stopping (patience epochs); 0 threads = TF default.
+DEFAULT_TRAINING_OPTIONS = {
+    "epochs": 5,
+    "batch_size": BATCH_SIZE,
+    "validation_fraction": 0.0,
+    "patience": None,
+    "seed": 42,
+    "intra_op_threads": 0,
+    "inter_op_threads": 0,
+}
+
+TRAINING_MODES = {
+    "default": {},
+    # Large batches, up to 30 epochs, stop when the last 10% stops improving
+    "throughput": {"batch_size": 256, "epochs": 30, "validation_fraction": 0.1, "patience": 3},
+}
+
+# Thread pools change speed, not the trained weights
+_RUNTIME_OPTIONS = ("intra_op_threads", "inter_op_threads")
+
+# Global multi-coin model: artifact directory name, coin embedding size and
+# the coins it is trained on (the dashboard's coin list)
+GLOBAL_MODEL_NAME = "global"
+EMBEDDING_DIM = 4
+GLOBAL_COINS = [
+    "BTC", "ETH", "BNB", "ADA", "SOL",
+    "XRP", "DOGE", "DOT", "AVAX", "MATIC",
+    "LTC", "BCH", "TRX", "LINK", "UNI"
+]
+
+# 30-day forecast modes:
+#   recursive: one-step model, fed its own predictions
+#   direct:    multi-output head, all horizons in one forward pass
+#   global:    the prebuilt direct model shared by all coins (coin
+#              embedding); falls back to "direct" until it is built
+FORECAST_MODES = ("recursive", "direct", "global")
+
+
+# -----------------------------
+# Per-coin hyperparameters
+# -----------------------------
+def load_lstm_configs(path=CONFIGS_PATH):
     """
-    Train LSTM model and return fitted values for comparison.
+    Saved search results: {symbol: {"config": {...}, ...}}.
     """
 
-    # -----------------------------
-    # Prepare data
-    # -----------------------------
-    close_prices = df["Close"].values.reshape(-1, 1)
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_lstm_configs(results, path=CONFIGS_PATH):
+    """
+    Merge {symbol: result} into the saved configs (atomic write).
+    """
+
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    configs = load_lstm_configs(path)
+    configs.update(results)
+
+    write_text_atomic(path, json.dumps(configs, indent=2, sort_keys=True))
+
+
+def get_lstm_config(symbol=None, path=CONFIGS_PATH):
+    """
+    Saved hyperparameters for a coin, or DEFAULT_LSTM_CONFIG.
+    """
+
+    if symbol is None:
+        return dict(DEFAULT_LSTM_CONFIG)
+
+    result = load_lstm_configs(path).get(symbol)
+    if result is None:
+        return dict(DEFAULT_LSTM_CONFIG)
+    return dict(DEFAULT_LSTM_CONFIG, **result["config"])
+
 
+def _architecture(config):
+    return {name: config[name] for name in ["units", "layers", "learning_rate", "dropout"]}
+
+
+def training_options(training="default"):
+    """
+    Resolve a mode name (see TRAINING_MODES) or an options dict.
+    """
+
+    options = TRAINING_MODES[training] if isinstance(training, str) else training
+    unknown = set(options) - set(DEFAULT_TRAINING_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown LSTM training options: {sorted(unknown)}")
+
+    return dict(DEFAULT_TRAINING_OPTIONS, **options)
+
+
+def _training_settings(options):
+    return {name: value for name, value in options.items() if name not in _RUNTIME_OPTIONS}
+
+
+def _fit_key(close_prices, lookback, horizon, train_windows, options, architecture):
+    """
+    Fingerprint of the training prices, hyperparameters and export format.
+    The TensorFlow version is not part of it: exported NumPy weights serve
+    the same under any (or no) TensorFlow install.
+    """
+
+    settings = json.dumps({
+        "lookback": lookback,
+        "horizon": horizon,
+        "train_windows": train_windows,
+        "architecture": architecture,
+        "training": _training_settings(options),
+        "export": EXPORT_VERSION,
+    }, sort_keys=True)
+
+    data = series_fingerprint(close_prices)
+    return hashlib.blake2b((data + settings).encode(), digest_size=16).hexdigest()
+
+
+def _scaler_from_range(data_min, data_max):
     scaler = MinMaxScaler(feature_range=(0, 1))
-    scaled_data = scaler.fit_transform(close_prices)
+    return scaler.fit(np.array([[data_min], [data_max]]))
+
+
+def _read_meta(path):
+    if path is None or not path.exists():
+        return None
+    return json.loads(path.read_text())
 
-    X, y = [], []
 
-    for i in range(lookback, len(scaled_data)):
-        X.append(scaled_data[i - lookback:i, 0])
-        y.append(scaled_data[i, 0])
+def _save_artifact(coin_dir, role, key, engine, meta):
+    coin_dir.mkdir(parents=True, exist_ok=True)
 
-    X, y = np.array(X), np.array(y)
+    # Weights first: the meta file (and its key) is the commit point
+    engine.save(coin_dir / f"{role}.npz")
 
-    # Reshape for LSTM: (samples, timesteps, features)
-    X = X.reshape((X.shape[0], X.shape[1], 1))
+    write_text_atomic(coin_dir / f"{role}.json", json.dumps({"key": key, **meta}))
+
+
+def invalidate_lstm_models(symbol=None, model_dir=LSTM_MODEL_DIR):
+    """
+    Delete saved LSTM artifacts of one coin (or all coins) and drop the
+    in-process copies, forcing a retrain on the next call.
+    """
+
+    target = Path(model_dir) / symbol if symbol is not None else Path(model_dir)
+    shutil.rmtree(target, ignore_errors=True)
+
+    for key, _ in MODEL_CACHE.items():
+        if key[0] == "lstm" and (symbol is None or key[1] == symbol):
+            MODEL_CACHE.discard(key)
+
+
+def fit_lstm(close_prices, role, lookback=60, horizon=1, train_windows=None,
+             symbol=None, model_dir=LSTM_MODEL_DIR, training="default", architecture=None):
+    """
+    (NumpyLSTM engine, fitted MinMaxScaler) for a close-price series,
+    trained on its first `train_windows` windows (all of them by default)
+    with `training` options (see training_options). architecture: units /
+    layers / learning_rate / dropout (DEFAULT_LSTM_CONFIG by default).
+
+    Reuses an in-process engine, then (with `symbol`) the coin's exported
+    `role` weights if their data + hyperparameter key matches; neither
+    imports TensorFlow. Otherwise trains with Keras, exports and
+    overwrites the stale artifact.
+    """
+
+    if train_windows is not None and train_windows < 1:
+        raise ValueError(f"train_windows must be at least 1, got {train_windows}")
+
+    close_prices = np.asarray(close_prices, dtype=np.float64).reshape(-1, 1)
+    options = training_options(training)
+    architecture = _architecture(dict(DEFAULT_LSTM_CONFIG, **(architecture or {})))
+    key = _fit_key(close_prices, lookback, horizon, train_windows, options, architecture)
+
+    def fit():
+        coin_dir = Path(model_dir) / symbol if symbol is not None else None
+        meta = _read_meta(coin_dir / f"{role}.json") if coin_dir is not None else None
+
+        if meta is not None and meta.get("key") == key:
+            engine = NumpyLSTM.load(coin_dir / f"{role}.npz")
+            if engine is not None:
+                return engine, _scaler_from_range(meta["data_min"], meta["data_max"])
+
+        from src.lstm_keras import TF_VERSION, build_model, configure, seeded, train_model
+
+        configure(options)
+
+        scaler = MinMaxScaler(feature_range=(0, 1))
+        scaled_data = scaler.fit_transform(close_prices)
+
+        # Chronological split: the latest training windows validate
+        if train_windows is None:
+            n_windows = len(close_prices) - lookback - horizon + 1
+        else:
+            n_windows = train_windows
+        n_fit = n_windows - int(n_windows * options["validation_fraction"])
+
+        with seeded(options["seed"]):
+            model = build_model(lookback, horizon, **architecture)
+
+            dataset_options = {"horizon": horizon, "batch_size": options["batch_size"]}
+            train_ds = window_dataset(
+                scaled_data, lookback, stop=n_fit, shuffle=True, seed=options["seed"], **dataset_options
+            )
+            val_ds = None
+            if n_fit < n_windows:
+                val_ds = window_dataset(scaled_data, lookback, start=n_fit, stop=n_windows, **dataset_options)
+
+            stats = train_model(model, train_ds, n_fit, options, val_ds, label=f"LSTM {symbol or ''}/{role}")
+        engine = NumpyLSTM.from_keras(model)
+
+        if coin_dir is not None:
+            _save_artifact(coin_dir, role, key, engine, {
+                "data_min": float(scaler.data_min_[0]),
+                "data_max": float(scaler.data_max_[0]),
+                "training": stats,
+                "tensorflow": TF_VERSION,
+            })
+        return engine, scaler
+
+    return MODEL_CACHE.get_or_fit(("lstm", symbol, role, key), fit)
+
+
+def lstm_forecast(df, lookback=None, symbol=None, training="default"):
+    """
+    Train LSTM model and return fitted values for comparison.
+    Uses the coin's searched hyperparameters when `symbol` is given.
+    """
+
+    config = get_lstm_config(symbol)
+    lookback = lookback or config["lookback"]
 
     # -----------------------------
     # Train-test split
     # -----------------------------
-    train_size = int(len(X) * 0.8)
+    close_prices = df["Close"].values.reshape(-1, 1)
 
-    X_train, X_test = X[:train_size], X[train_size:]
-    y_train, y_test = y[:train_size], y[train_size:]
+    n_windows = len(close_prices) - lookback
+    train_size = int(n_windows * 0.8)
 
     # -----------------------------
-    # Build LSTM model
+    # Load or train LSTM model
     # -----------------------------
-    model = Sequential([
-        Input(shape=(lookback, 1)),
-        LSTM(50, return_sequences=True),
-        LSTM(50),
-        Dense(1)
-    ])
-
-    model.compile(optimizer="adam", loss="mse")
-
-    model.fit(
-        X_train,
-        y_train,
-        epochs=5,
-        batch_size=32,
-        verbose=0
+    engine, scaler = fit_lstm(
+        close_prices, "eval", lookback, train_windows=train_size, symbol=symbol,
+        training=training, architecture=_architecture(config)
     )
+    scaled_data = scaler.transform(close_prices)[:, 0]
+
+    # Strided view of the test windows (no (samples, lookback) copy)
+    X_test = sliding_windows(scaled_data, lookback)[train_size:]
+    y_test = scaled_data[train_size + lookback:]
 
     # -----------------------------
     # Predict (test set)
     # -----------------------------
-    predictions = model.predict(X_test, verbose=0)
+    predictions = engine.predict(X_test)
 
     predictions = scaler.inverse_transform(predictions.reshape(-1, 1))
     y_test_actual = scaler.inverse_transform(y_test.reshape(-1, 1))
@@ -79,8 +323,8 @@ def lstm_forecast(df, lookback=60):
 
 # ---------------- TEST ----------------
 if __name__ == "__main__":
-    from data_loader import load_crypto_data
-    from preprocessing import preprocess_crypto_data
+    from src.data_loader import load_crypto_data
+    from src.preprocessing import preprocess_crypto_data
 
     df = load_crypto_data("BTC", "2016-01-01")
     df = preprocess_crypto_data(df)
@@ -89,67 +333,97 @@ if __name__ == "__main__":
     print(lstm_df.head())
 
 
+def _quantile_bands(paths, scaler):
+    """
+    (lower, upper) price bands from (n_samples, steps) scaled paths.
+    """
 
-import numpy as np
-import pandas as pd
-from sklearn.preprocessing import MinMaxScaler
-from tensorflow.keras.models import Sequential # pyright: ignore[reportMissingImports]
-from tensorflow.keras.layers import LSTM, Dense, Input # pyright: ignore[reportMissingImports]
+    prices = scaler.inverse_transform(paths.reshape(-1, 1)).reshape(paths.shape)
+    return np.quantile(prices, INTERVAL_QUANTILES, axis=0)
 
 
-def lstm_forecast_30_days(df, lookback=60, steps=30):
+def lstm_forecast_30_days(df, lookback=None, steps=30, mode="recursive", symbol=None,
+                          training="default", samples=0):
     """
-    Recursive LSTM forecasting for future prices AFTER last available date.
+    LSTM forecasting for future prices AFTER last available date.
+
+    mode (see FORECAST_MODES): "recursive" rolls a one-step model forward;
+    "direct" trains a `steps`-output head and predicts in one pass;
+    "global" serves the coin from the prebuilt multi-coin model (needs
+    `symbol`; see global_lstm_forecast) and never trains it, falling back
+    to "direct" until scripts/train_global_lstm.py has built it.
+    training: see training_options (per-coin models only).
+
+    samples > 0 adds Lower / Upper columns (INTERVAL_QUANTILES) from that
+    many Monte Carlo dropout passes, run as one batch; Forecast still
+    comes from the deterministic model. Per-coin bands come from the
+    "<mode>-mc" variant (trained if needed, so meant for offline use);
+    "global" only adds them from a prebuilt direct-mc artifact, and its
+    per-coin fallback has none.
     """
 
-    # -----------------------------
-    # Prepare data
-    # -----------------------------
-    data = df[["Close"]].values
+    if mode not in FORECAST_MODES:
+        raise ValueError(f"Unknown LSTM forecast mode: {mode}")
 
-    scaler = MinMaxScaler(feature_range=(0, 1))
-    scaled_data = scaler.fit_transform(data)
+    if mode == "global":
+        if symbol is None:
+            raise ValueError("The global LSTM model needs a symbol")
+
+        forecast_df = global_lstm_forecast(df, symbol, steps, samples)
+        if forecast_df is not None:
+            return forecast_df
 
-    # Create sequences
-    X = []
-    for i in range(lookback, len(scaled_data)):
-        X.append(scaled_data[i - lookback:i, 0])
+        # Not built yet (or without this coin): the per-coin direct model,
+        # without bands (they would train a second model in the request)
+        mode, samples = "direct", 0
 
-    X = np.array(X)
-    X = X.reshape((X.shape[0], X.shape[1], 1))
+    # Per-coin models use the coin's searched hyperparameters
+    config = get_lstm_config(symbol)
+    lookback = lookback or config["lookback"]
 
     # -----------------------------
-    # Build & train LSTM
+    # Load or train LSTM
     # -----------------------------
-    model = Sequential([
-        Input(shape=(lookback, 1)),
-        LSTM(50, return_sequences=True),
-        LSTM(50),
-        Dense(1)
-    ])
+    horizon = steps if mode == "direct" else 1
 
-    model.compile(optimizer="adam", loss="mse")
-    model.fit(X, scaled_data[lookback:], epochs=5, batch_size=32, verbose=0)
+    architecture = _architecture(config)
+    engine, scaler = fit_lstm(
+        df[["Close"]].values, mode, lookback, horizon, symbol=symbol,
+        training=training, architecture=architecture
+    )
+    scaled_data = scaler.transform(df[["Close"]].values)
+
+    mc_engine = engine
+    if samples and not architecture["dropout"]:
+        # Intervals need a model trained with dropout
+        mc_engine, _ = fit_lstm(
+            df[["Close"]].values, f"{mode}-mc", lookback, horizon, symbol=symbol,
+            training=training, architecture=dict(architecture, dropout=MC_DROPOUT)
+        )
 
     # -----------------------------
-    # Recursive forecasting
+    # Forecast
     # -----------------------------
-    last_sequence = scaled_data[-lookback:].reshape(1, lookback, 1)
-
-    future_predictions = []
-
-    for _ in range(steps):
-        next_scaled = model.predict(last_sequence, verbose=0)[0, 0]
-        future_predictions.append(next_scaled)
-
-        last_sequence = np.append(
-            last_sequence[:, 1:, :],
-            [[[next_scaled]]],
-            axis=1
-        )
+    last_sequence = scaled_data[-lookback:].reshape(1, lookback)
+
+    if mode == "direct":
+        future_predictions = engine.predict(last_sequence)[0]
+    else:
+        future_predictions = engine.rollout(last_sequence, steps)[0]
+
+    if samples:
+        # K dropout passes as one (K, lookback) batch; recursive mode
+        # re-runs the whole (K, lookback) window at each of the steps
+        if mode == "direct":
+            paths = mc_engine.sample(last_sequence, samples, seed=MC_SEED)[:, 0]
+        else:
+            paths = mc_engine.rollout(
+                np.repeat(last_sequence, samples, axis=0), steps, rng=np.random.default_rng(MC_SEED)
+            )
+        lower, upper = _quantile_bands(paths, scaler)
 
     future_predictions = scaler.inverse_transform(
-        np.array(future_predictions).reshape(-1, 1)
+        future_predictions.reshape(-1, 1)
     )
 
     # -----------------------------
@@ -166,5 +440,248 @@ def lstm_forecast_30_days(df, lookback=60, steps=30):
         "Date": future_dates,
         "Forecast": future_predictions.flatten()
     })
+    if samples:
+        forecast_df["Lower"] = lower
+        forecast_df["Upper"] = upper
 
     return forecast_df
+
+
+# ---------------- GLOBAL MULTI-COIN MODEL ----------------
+def load_global_frames(coins=None, start_date="2016-01-01"):
+    """
+    {coin: preprocessed frame} to train the global model on (GLOBAL_COINS
+    by default), loaded in one batch. Coins that fail to load are reported
+    and left out.
+    """
+
+    from src.batch_loader import load_many
+    from src.preprocessing import preprocess_crypto_data
+
+    frames, errors = load_many(coins or GLOBAL_COINS, start_date)
+    for coin, error in errors.items():
+        logger.warning("⚠️ %s left out of the global LSTM: %s", coin, error)
+
+    return {coin: preprocess_crypto_data(df) for coin, df in frames.items()}
+
+
+def _global_fit_key(closes, lookback, horizon, options, dropout):
+    """
+    Fingerprint of every coin's prices (in order), hyperparameters and
+    export format (see _fit_key).
+    """
+
+    settings = json.dumps({
+        "coins": list(closes),
+        "lookback": lookback,
+        "horizon": horizon,
+        "training": _training_settings(options),
+        "embedding_dim": EMBEDDING_DIM,
+        "dropout": dropout,
+        "export": EXPORT_VERSION,
+    }, sort_keys=True)
+
+    data = "".join(series_fingerprint(values) for values in closes.values())
+    return hashlib.blake2b((data + settings).encode(), digest_size=16).hexdigest()
+
+
+def fit_global_lstm(frames, lookback=60, steps=30, model_dir=LSTM_MODEL_DIR, training="default",
+                    dropout=0.0):
+    """
+    (global NumpyLSTM engine, {coin: fitted MinMaxScaler}) for {coin: frame}.
+
+    One training job over every coin's windows (shuffled together), each
+    coin min-max scaled on its own range. The validation split is the
+    latest windows of every coin. Saved as
+    data/models/lstm/global/direct.* (direct-mc.* with dropout) and reused
+    while the key matches; any new bar changes the key, so this is the
+    offline (re)build step. Pages serve through global_lstm_forecast.
+    """
+
+    closes = {
+        coin: np.asarray(df["Close"].values, dtype=np.float64).reshape(-1, 1)
+        for coin, df in frames.items()
+    }
+    options = training_options(training)
+    key = _global_fit_key(closes, lookback, steps, options, dropout)
+    role = "direct-mc" if dropout else "direct"
+
+    def fit():
+        model_path = Path(model_dir) / GLOBAL_MODEL_NAME
+        meta = _read_meta(model_path / f"{role}.json")
+
+        if meta is not None and meta.get("key") == key:
+            engine = NumpyLSTM.load(model_path / f"{role}.npz")
+            if engine is not None:
+                scalers = {
+                    coin: _scaler_from_range(*meta["ranges"][coin]) for coin in closes
+                }
+                return engine, scalers
+
+        scalers = {coin: MinMaxScaler(feature_range=(0, 1)).fit(values) for coin, values in closes.items()}
+        scaled = [scalers[coin].transform(values) for coin, values in closes.items()]
+
+        from src.lstm_keras import TF_VERSION, build_global_model, configure, seeded, train_model
+
+        configure(options)
+
+        split = 1.0 - options["validation_fraction"]
+        first, stop = multi_window_bounds([len(values) for values in scaled], lookback, steps, (0.0, split))
+        dataset_options = {"horizon": steps, "batch_size": options["batch_size"]}
+
+        with seeded(options["seed"]):
+            model = build_global_model(lookback, len(closes), steps, EMBEDDING_DIM, dropout)
+
+            train_ds = multi_window_dataset(
+                scaled, lookback, shuffle=True, seed=options["seed"], window_range=(0.0, split), **dataset_options
+            )
+            val_ds = None
+            if split < 1.0:
+                val_ds = multi_window_dataset(scaled, lookback, window_range=(split, 1.0), **dataset_options)
+
+            stats = train_model(model, train_ds, (stop - first).sum(), options, val_ds,
+                                label=f"LSTM {GLOBAL_MODEL_NAME}/{role}")
+        engine = NumpyLSTM.from_keras(model)
+
+        _save_artifact(model_path, role, key, engine, {
+            "coins": list(closes),
+            "lookback": lookback,
+            "ranges": {
+                coin: [float(scaler.data_min_[0]), float(scaler.data_max_[0])]
+                for coin, scaler in scalers.items()
+            },
+            "training": stats,
+            "tensorflow": TF_VERSION,
+        })
+        return engine, scalers
+
+    return MODEL_CACHE.get_or_fit(("lstm", GLOBAL_MODEL_NAME, role, key), fit)
+
+
+def load_global_lstm(model_dir=LSTM_MODEL_DIR, dropout=0.0):
+    """
+    (NumpyLSTM engine, meta) of the prebuilt global model (the direct-mc
+    artifact with dropout), or None if it has not been built. Never
+    trains: the last build is served even after newer bars arrive.
+    """
+
+    role = "direct-mc" if dropout else "direct"
+    model_path = Path(model_dir) / GLOBAL_MODEL_NAME
+
+    # Weights are written before the meta file: re-read the meta if a
+    # rebuild landed while the weights were loading
+    for _ in range(3):
+        meta = _read_meta(model_path / f"{role}.json")
+        if meta is None:
+            return None
+
+        cache_key = ("lstm", GLOBAL_MODEL_NAME, role, "served", meta["key"])
+        served = MODEL_CACHE.get(cache_key)
+        if served is not None:
+            return served
+
+        engine = NumpyLSTM.load(model_path / f"{role}.npz")
+        if engine is None:
+            return None
+
+        if _read_meta(model_path / f"{role}.json") == meta:
+            MODEL_CACHE.put(cache_key, (engine, meta))
+            return engine, meta
+
+    return None
+
+
+def global_lstm_forecast(df, symbol, steps=30, samples=0, model_dir=LSTM_MODEL_DIR):
+    """
+    30-day forecast frame for one coin from the prebuilt global model,
+    windowed on `df` (the coin's current data). None if the model has not
+    been built, does not include the coin, or has another horizon.
+    samples > 0 adds Lower / Upper columns from the prebuilt direct-mc
+    build when there is one (see has_global_intervals).
+    """
+
+    def prepare(dropout):
+        served = load_global_lstm(model_dir, dropout)
+        if served is None:
+            return None
+
+        engine, meta = served
+        if symbol not in meta["coins"] or engine.horizon != steps:
+            return None
+
+        lookback = meta.get("lookback", DEFAULT_LSTM_CONFIG["lookback"])
+        scaler = _scaler_from_range(*meta["ranges"][symbol])
+        window = scaler.transform(df[["Close"]].values)[-lookback:].reshape(1, lookback)
+        return engine, scaler, window, np.array([meta["coins"].index(symbol)])
+
+    prepared = prepare(0.0)
+    if prepared is None:
+        return None
+
+    engine, scaler, window, coin_ids = prepared
+    prediction = engine.predict(window, coin_ids=coin_ids)[0]
+
+    last_date = pd.to_datetime(df["Date"].iloc[-1])
+    forecast_df = pd.DataFrame({
+        "Date": pd.date_range(start=last_date + pd.Timedelta(days=1), periods=steps, freq="D"),
+        "Forecast": scaler.inverse_transform(prediction.reshape(-1, 1)).flatten()
+    })
+
+    prepared = prepare(MC_DROPOUT) if samples else None
+    if prepared is not None:
+        engine, scaler, window, coin_ids = prepared
+        paths = engine.sample(window, samples, coin_ids=coin_ids, seed=MC_SEED)[:, 0]
+        forecast_df["Lower"], forecast_df["Upper"] = _quantile_bands(paths, scaler)
+
+    return forecast_df
+
+
+def has_global_intervals(model_dir=LSTM_MODEL_DIR):
+    """
+    True if the direct-mc global model has been built, i.e. the "global"
+    mode can add Lower / Upper bands without training.
+    """
+
+    return load_global_lstm(model_dir, MC_DROPOUT) is not None
+
+
+def global_lstm_forecasts(frames, lookback=60, steps=30, model_dir=LSTM_MODEL_DIR,
+                          training="default", samples=0):
+    """
+    {coin: 30-day forecast frame} for every coin in `frames`, all from one
+    batched NumPy forward pass of the global model. samples > 0 also
+    builds the direct-mc model and adds Lower / Upper columns from a
+    (samples x coins) Monte Carlo dropout batch, also one forward pass.
+    """
+
+    engine, scalers = fit_global_lstm(frames, lookback, steps, model_dir, training)
+    coins = list(frames)
+
+    # -----------------------------
+    # One batch: every coin's last window
+    # -----------------------------
+    windows = np.stack([
+        scalers[coin].transform(frames[coin][["Close"]].values)[-lookback:]
+        for coin in coins
+    ])
+    coin_ids = np.arange(len(coins))
+    predictions = engine.predict(windows, coin_ids=coin_ids)
+    if samples:
+        # Same data and ranges, so the same scaled windows
+        mc_engine, _ = fit_global_lstm(frames, lookback, steps, model_dir, training, MC_DROPOUT)
+        paths = mc_engine.sample(windows, samples, coin_ids=coin_ids, seed=MC_SEED)
+
+    # -----------------------------
+    # Per-coin frames
+    # -----------------------------
+    forecasts = {}
+    for i, coin in enumerate(coins):
+        last_date = pd.to_datetime(frames[coin]["Date"].iloc[-1])
+        forecasts[coin] = pd.DataFrame({
+            "Date": pd.date_range(start=last_date + pd.Timedelta(days=1), periods=steps, freq="D"),
+            "Forecast": scalers[coin].inverse_transform(predictions[i].reshape(-1, 1)).flatten()
+        })
+        if samples:
+            forecasts[coin]["Lower"], forecasts[coin]["Upper"] = _quantile_bands(paths[:, i], scalers[coin])
+
+    return forecasts
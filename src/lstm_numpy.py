@@ -0,0 +1,217 @@
+from pathlib import Path
+
+import numpy as np
+
+from src.atomic_files import atomic_path
+
+# Bump when the exported array layout changes
+EXPORT_VERSION = 1
+
+
+def _gate_scaled(kernel, recurrent_kernel, bias):
+    """
+    Weights with the i, f, o columns halved, so one tanh gives every gate:
+    sigmoid(z) = 0.5 * tanh(z / 2) + 0.5, and c~ = tanh(z) directly.
+    """
+
+    units = recurrent_kernel.shape[0]
+    scale = np.full(4 * units, 0.5, dtype=np.float32)
+    scale[2 * units:3 * units] = 1.0
+    return kernel * scale, recurrent_kernel * scale, bias * scale
+
+
+def _lstm_sequence(projected, recurrent_kernel, return_sequences):
+    """
+    Keras LSTM (tanh / sigmoid, gate order i, f, c, o) over a precomputed,
+    gate-scaled (batch, time, 4 * units) input projection.
+    """
+
+    units = recurrent_kernel.shape[0]
+    batch, steps = projected.shape[:2]
+    h = np.zeros((batch, units), dtype=np.float32)
+    c = np.zeros((batch, units), dtype=np.float32)
+    outputs = np.empty((batch, steps, units), dtype=np.float32) if return_sequences else None
+
+    for t in range(steps):
+        gates = np.tanh(projected[:, t] + h @ recurrent_kernel)
+        gates[:, :2 * units] += 1.0
+        gates[:, 3 * units:] += 1.0
+
+        # 0.5 * (tanh + 1) = sigmoid for i, f, o
+        c = 0.5 * (gates[:, units:2 * units] * c + gates[:, :units] * gates[:, 2 * units:3 * units])
+        h = 0.5 * gates[:, 3 * units:] * np.tanh(c)
+        if return_sequences:
+            outputs[:, t] = h
+
+    return outputs if return_sequences else h
+
+
+class NumpyLSTM:
+    """
+    Float32 NumPy forward pass of the LSTM models in src.lstm_model:
+    [coin embedding] -> stacked LSTMs (each with optional dropout) ->
+    Dense(horizon). No TensorFlow.
+    """
+
+    def __init__(self, lstm_layers, dense_kernel, dense_bias, embedding=None, dropout=0.0):
+        self.lstm_layers = [
+            tuple(np.asarray(weights, dtype=np.float32) for weights in layer)
+            for layer in lstm_layers
+        ]
+        self.dense_kernel = np.asarray(dense_kernel, dtype=np.float32)
+        self.dense_bias = np.asarray(dense_bias, dtype=np.float32)
+        self.embedding = None if embedding is None else np.asarray(embedding, dtype=np.float32)
+        self.dropout = float(dropout)
+        self._scaled_layers = [_gate_scaled(*layer) for layer in self.lstm_layers]
+
+    @property
+    def horizon(self):
+        return self.dense_bias.shape[0]
+
+    # -----------------------------
+    # Export / load
+    # -----------------------------
+    @classmethod
+    def from_keras(cls, model):
+        """
+        Copy the weights of a trained Keras model (Sequential or the global
+        functional model) into a NumPy engine.
+        """
+
+        lstm_layers, embedding, dense, dropout = [], None, None, 0.0
+        for layer in model.layers:
+            kind = type(layer).__name__
+            if kind == "LSTM":
+                lstm_layers.append(layer.get_weights())
+            elif kind == "Embedding":
+                embedding = layer.get_weights()[0]
+            elif kind == "Dense":
+                dense = layer.get_weights()
+            elif kind == "Dropout":
+                dropout = layer.rate
+
+        return cls(lstm_layers, dense[0], dense[1], embedding, dropout)
+
+    def save(self, path):
+        """
+        Write all weights as one .npz (atomic).
+        """
+
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        arrays = {
+            "version": np.array(EXPORT_VERSION),
+            "dense_kernel": self.dense_kernel,
+            "dense_bias": self.dense_bias,
+            "dropout": np.array(self.dropout),
+        }
+        for n, (kernel, recurrent_kernel, bias) in enumerate(self.lstm_layers):
+            arrays[f"lstm_{n}_kernel"] = kernel
+            arrays[f"lstm_{n}_recurrent_kernel"] = recurrent_kernel
+            arrays[f"lstm_{n}_bias"] = bias
+        if self.embedding is not None:
+            arrays["embedding"] = self.embedding
+
+        with atomic_path(path, suffix=".tmp.npz") as tmp_path:
+            np.savez(tmp_path, **arrays)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Engine from an exported .npz, or None if missing / from another
+        export version.
+        """
+
+        path = Path(path)
+        if not path.exists():
+            return None
+
+        with np.load(path) as arrays:
+            if int(arrays["version"]) != EXPORT_VERSION:
+                return None
+
+            n_layers = sum(name.endswith("_recurrent_kernel") for name in arrays.files)
+            lstm_layers = [
+                tuple(arrays[f"lstm_{n}_{part}"] for part in ["kernel", "recurrent_kernel", "bias"])
+                for n in range(n_layers)
+            ]
+            embedding = arrays["embedding"] if "embedding" in arrays.files else None
+            dropout = float(arrays["dropout"]) if "dropout" in arrays.files else 0.0
+            return cls(lstm_layers, arrays["dense_kernel"], arrays["dense_bias"], embedding, dropout)
+
+    # -----------------------------
+    # Inference
+    # -----------------------------
+    def _drop(self, hidden, rng):
+        """
+        Inverted dropout (as Keras' Dropout layer in training mode).
+        """
+
+        keep = 1.0 - self.dropout
+        return hidden * (rng.random(hidden.shape, dtype=np.float32) < keep) / np.float32(keep)
+
+    def _forward(self, windows, coin_ids=None, rng=None, repeats=1):
+        x = np.asarray(windows, dtype=np.float32).reshape(len(windows), -1)
+
+        # First layer: the input projection of every timestep at once
+        kernel, recurrent_kernel, bias = self._scaled_layers[0]
+        projected = x[..., np.newaxis] * kernel[0] + bias
+        if self.embedding is not None:
+            coin_vectors = self.embedding[np.asarray(coin_ids).reshape(-1)]
+            projected += (coin_vectors @ kernel[1:])[:, np.newaxis, :]
+
+        hidden = None
+        for n, (kernel, recurrent_kernel, bias) in enumerate(self._scaled_layers):
+            last = n == len(self._scaled_layers) - 1
+            if n > 0:
+                projected = hidden @ kernel + bias
+            hidden = _lstm_sequence(projected, recurrent_kernel, return_sequences=not last)
+
+            # Everything before the first dropout is deterministic: repeat
+            # the batch only from here on
+            if n == 0 and repeats > 1:
+                hidden = np.tile(hidden, (repeats,) + (1,) * (hidden.ndim - 1))
+            if rng is not None and self.dropout:
+                hidden = self._drop(hidden, rng)
+
+        return hidden @ self.dense_kernel + self.dense_bias
+
+    def predict(self, windows, coin_ids=None, rng=None):
+        """
+        (batch, horizon) predictions for (batch, lookback[, 1]) scaled
+        windows (plus one coin id per window for the global model).
+        With an np.random.Generator `rng`, dropout stays active (one
+        Monte Carlo pass; each row gets its own masks).
+        """
+
+        return self._forward(windows, coin_ids, rng)
+
+    def sample(self, windows, n_samples, coin_ids=None, seed=None):
+        """
+        (n_samples, batch, horizon) Monte Carlo dropout predictions from
+        ONE forward pass: the first LSTM layer runs once per window, then
+        the batch is tiled n_samples times with independent masks.
+        """
+
+        predictions = self._forward(
+            windows, coin_ids, rng=np.random.default_rng(seed), repeats=n_samples
+        )
+        return predictions.reshape(n_samples, len(windows), -1)
+
+    def rollout(self, windows, steps, coin_ids=None, rng=None):
+        """
+        Recursive one-step forecast of a batch of windows: feed the model
+        its own predictions for `steps` days. Returns (batch, steps) scaled
+        predictions (with `rng`, every row is a Monte Carlo dropout path).
+        """
+
+        windows = np.asarray(windows, dtype=np.float32).reshape(len(windows), -1).copy()
+        predictions = np.empty((len(windows), steps), dtype=np.float32)
+
+        for step in range(steps):
+            predictions[:, step] = self.predict(windows, coin_ids, rng)[:, 0]
+            windows[:, :-1] = windows[:, 1:]
+            windows[:, -1] = predictions[:, step]
+
+        return predictions
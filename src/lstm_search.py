@@ -0,0 +1,246 @@
+import argparse
+import multiprocessing
+import time
+from concurrent.futures import ProcessPoolExecutor
+from itertools import product
+
+import numpy as np
+import pandas as pd
+from sklearn.preprocessing import MinMaxScaler
+
+from src.lstm_model import DEFAULT_LSTM_CONFIG, save_lstm_configs
+
+# --------------------------------------------------
+# SEARCH SETTINGS
+# --------------------------------------------------
+SEARCH_SPACE = {
+    "lookback": [30, 60, 90],
+    "units": [32, 50, 64],
+    "layers": [1, 2],
+    "learning_rate": [0.0005, 0.001, 0.003],
+}
+
+# Random sample of the grid (the baseline config is always included)
+N_CANDIDATES = 12
+
+# Successive halving: every rung trains the survivors ETA x longer
+# (in total epochs) and keeps the best 1 / ETA by validation loss
+MIN_EPOCHS = 1
+ETA = 3
+MAX_EPOCHS = 9
+
+# Tuning uses only the windows lstm_forecast trains on (first 80%); the
+# latest VALIDATION_FRACTION of those target days score the candidates
+TRAIN_FRACTION = 0.8
+VALIDATION_FRACTION = 0.15
+
+BATCH_SIZE = 32
+SEED = 42
+
+# CPU budget: worker processes x TF threads per worker, and wall-clock
+# time per coin (the best config found so far is kept)
+MAX_WORKERS = 2
+THREADS_PER_WORKER = 1
+MAX_SECONDS_PER_COIN = 600.0
+
+
+def candidate_configs(n_candidates=N_CANDIDATES, seed=SEED):
+    """
+    Baseline config + a seeded random sample of SEARCH_SPACE.
+    """
+
+    names = list(SEARCH_SPACE)
+    grid = [dict(DEFAULT_LSTM_CONFIG, **dict(zip(names, values))) for values in product(*SEARCH_SPACE.values())]
+    grid = [config for config in grid if config != DEFAULT_LSTM_CONFIG]
+
+    rng = np.random.default_rng(seed)
+    picked = rng.choice(len(grid), size=min(n_candidates - 1, len(grid)), replace=False)
+    return [dict(DEFAULT_LSTM_CONFIG)] + [grid[i] for i in sorted(picked)]
+
+
+def _init_worker(threads):
+    """
+    Size TF's thread pools before the worker runs anything.
+    """
+
+    import tensorflow as tf
+
+    tf.config.threading.set_intra_op_parallelism_threads(threads)
+    tf.config.threading.set_inter_op_parallelism_threads(1)
+
+
+def _train_candidate(scaled, config, weights, epochs, val_start, val_stop, seed):
+    """
+    Train one candidate for `epochs` more epochs (resuming from `weights`)
+    and return (validation loss, weights, seconds).
+
+    Windows are addressed by target day so every lookback is validated on
+    the same days: targets before val_start train, val_start..val_stop-1
+    validate.
+    """
+
+    import tensorflow as tf
+
+    from src.lstm_keras import build_model
+    from src.windowing import window_dataset
+
+    started = time.perf_counter()
+    tf.keras.utils.set_random_seed(seed)
+
+    lookback = config["lookback"]
+    model = build_model(
+        lookback, units=config["units"], layers=config["layers"],
+        learning_rate=config["learning_rate"], dropout=config["dropout"]
+    )
+    if weights is not None:
+        model.set_weights(weights)
+
+    train_ds = window_dataset(scaled, lookback, stop=val_start - lookback, shuffle=True,
+                              seed=seed, batch_size=BATCH_SIZE)
+    val_ds = window_dataset(scaled, lookback, start=val_start - lookback, stop=val_stop - lookback,
+                            batch_size=BATCH_SIZE)
+
+    history = model.fit(train_ds, validation_data=val_ds, epochs=epochs, verbose=0)
+    val_loss = float(history.history["val_loss"][-1])
+    if not np.isfinite(val_loss):
+        val_loss = np.inf
+
+    return val_loss, model.get_weights(), time.perf_counter() - started
+
+
+def search_lstm_config(values, executor, n_candidates=N_CANDIDATES,
+                       max_seconds=MAX_SECONDS_PER_COIN, seed=SEED):
+    """
+    Pick the LSTM hyperparameters for one close series.
+
+    Every candidate trains MIN_EPOCHS epochs; each rung keeps the best
+    1 / ETA by validation loss and trains them up to ETA x the epochs
+    (resuming from their weights; the optimizer state restarts), until
+    MAX_EPOCHS or a single winner. Poor configs are therefore dropped after
+    an epoch or two. `max_seconds` is checked after every candidate fit:
+    once it runs out, fits that have not started are cancelled and the best
+    candidate trained in the current rung wins (complete=False). Returns a
+    JSON-ready result dict.
+    """
+
+    started = time.perf_counter()
+    values = np.asarray(values, dtype=np.float64).reshape(-1, 1)
+
+    # Same scaling as lstm_forecast; target days [val_start, val_stop)
+    # validate, earlier ones train, the last 20% are never seen
+    scaled = MinMaxScaler(feature_range=(0, 1)).fit_transform(values)[:, 0]
+    val_stop = int(len(scaled) * TRAIN_FRACTION)
+    val_start = val_stop - int(val_stop * VALIDATION_FRACTION)
+
+    configs = candidate_configs(n_candidates, seed)
+    alive = {i: {"weights": None, "loss": np.inf} for i in range(len(configs))}
+
+    epochs_done, target_epochs, rungs, train_seconds = 0, MIN_EPOCHS, [], 0.0
+    while True:
+        futures = {
+            i: executor.submit(
+                _train_candidate, scaled, configs[i], state["weights"],
+                target_epochs - epochs_done, val_start, val_stop, seed
+            )
+            for i, state in alive.items()
+        }
+        trained, out_of_time = {}, False
+        for i, future in futures.items():
+            if future.cancelled():
+                continue
+            trained[i] = alive[i]
+            trained[i]["loss"], trained[i]["weights"], seconds = future.result()
+            train_seconds += seconds
+
+            # Past the budget: drop every fit that has not started yet (the
+            # pool has already handed up to one extra per worker to a process)
+            if not out_of_time and time.perf_counter() - started > max_seconds:
+                out_of_time = True
+                for pending in futures.values():
+                    pending.cancel()
+
+        # Candidates cut from this rung have fewer epochs than the rest,
+        # so their losses are not comparable; only the trained ones go on
+        cut = len(trained) < len(futures)
+        alive = trained
+        epochs_done = target_epochs
+        rungs.append({"candidates": len(alive), "epochs": epochs_done})
+
+        if epochs_done >= MAX_EPOCHS or out_of_time:
+            break
+
+        keep = max(1, len(alive) // ETA)
+        alive = dict(sorted(alive.items(), key=lambda item: item[1]["loss"])[:keep])
+        if keep == 1:
+            break
+        target_epochs = min(epochs_done * ETA, MAX_EPOCHS)
+
+    best = min(alive, key=lambda i: alive[i]["loss"])
+    val_loss = alive[best]["loss"]
+
+    return {
+        "config": configs[best],
+        "val_loss": val_loss if np.isfinite(val_loss) else None,
+        "candidates": len(configs),
+        "rungs": rungs,
+        "complete": not cut and (epochs_done >= MAX_EPOCHS or len(alive) == 1),
+        "seconds": round(time.perf_counter() - started, 2),
+        # Worker time summed over candidates (~ CPU seconds at 1 thread each)
+        "train_seconds": round(train_seconds, 2),
+        "searched_at": str(pd.Timestamp.today().date()),
+    }
+
+
+def search_configs(closes, workers=MAX_WORKERS, threads=THREADS_PER_WORKER,
+                   n_candidates=N_CANDIDATES, max_seconds=MAX_SECONDS_PER_COIN, save=True):
+    """
+    Search hyperparameters for {symbol: close values}, candidates trained
+    in parallel across a process pool (workers x threads CPUs), and (by
+    default) save them for lstm_forecast / lstm_forecast_30_days.
+    """
+
+    # spawn: TensorFlow is not fork-safe
+    context = multiprocessing.get_context("spawn")
+
+    results = {}
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_init_worker, initargs=(threads,)) as executor:
+        for symbol, values in closes.items():
+            result = search_lstm_config(values, executor, n_candidates, max_seconds)
+            results[symbol] = result
+
+            config = result["config"]
+            loss = "n/a" if result["val_loss"] is None else f"{result['val_loss']:.2e}"
+            print(f"✅ {symbol}: lookback {config['lookback']}, {config['layers']}x{config['units']} units, "
+                  f"lr {config['learning_rate']} (val MSE {loss}, {result['seconds']}s)")
+
+            if save:
+                save_lstm_configs({symbol: result})
+
+    return results
+
+
+if __name__ == "__main__":
+    from src.data_loader import load_crypto_data
+    from src.data_sources import CSV_DIR
+    from src.preprocessing import preprocess_crypto_data
+
+    parser = argparse.ArgumentParser(description="Search and save LSTM hyperparameters per coin.")
+    parser.add_argument("coins", nargs="*", help="Coins to search (default: all bundled coins)")
+    parser.add_argument("--workers", type=int, default=MAX_WORKERS)
+    parser.add_argument("--threads", type=int, default=THREADS_PER_WORKER,
+                        help="TensorFlow threads per worker")
+    parser.add_argument("--candidates", type=int, default=N_CANDIDATES)
+    parser.add_argument("--max-seconds", type=float, default=MAX_SECONDS_PER_COIN,
+                        help="Time budget per coin")
+    args = parser.parse_args()
+
+    coins = args.coins or [p.stem for p in sorted(CSV_DIR.glob("*.csv"))]
+    # Same series the LSTM pages and lstm_forecast_30_days train on
+    closes = {
+        coin: preprocess_crypto_data(load_crypto_data(coin, "2016-01-01"))["Close"].values
+        for coin in coins
+    }
+
+    search_configs(closes, workers=args.workers, threads=args.threads,
+                   n_candidates=args.candidates, max_seconds=args.max_seconds)
@@ -1,8 +1,8 @@
 import matplotlib.pyplot as plt
 
-from data_loader import load_crypto_data
-from preprocessing import preprocess_crypto_data
-from lstm_model import lstm_forecast
+from src.data_loader import load_crypto_data
+from src.preprocessing import preprocess_crypto_data
+from src.lstm_model import lstm_forecast
 
 # ----------------------------------
 # LOAD & PREPROCESS DATA
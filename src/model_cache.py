@@ -0,0 +1,117 @@
+import hashlib
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+
+# Fitted models kept in memory per process (shared by all pages and reruns)
+MAX_CACHED_MODELS = 32
+
+
+def series_fingerprint(values):
+    """
+    Stable hash of a numeric series (length + float64 bytes).
+    """
+
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16)
+    digest.update(str(values.shape).encode())
+    return digest.hexdigest()
+
+
+class FittedModelCache:
+    """
+    Thread-safe, size-bounded LRU cache of fitted model results.
+    """
+
+    def __init__(self, maxsize=MAX_CACHED_MODELS):
+        self.maxsize = maxsize
+        self._items = OrderedDict()
+        self._lock = threading.Lock()
+        # key -> Future of a fit in progress (see get_or_fit)
+        self._pending = {}
+
+    def get(self, key):
+        with self._lock:
+            if key not in self._items:
+                return None
+            self._items.move_to_end(key)
+            return self._items[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+
+    def get_or_fit(self, key, fit):
+        """
+        Return the cached value for key, or call fit() once and cache it.
+
+        Streamlit sessions are threads of one process: while one of them
+        runs fit() for a key, the others asking for that key wait for its
+        result (or its exception) instead of fitting the model again.
+        """
+
+        with self._lock:
+            if key in self._items:
+                self._items.move_to_end(key)
+                return self._items[key]
+
+            pending = self._pending.get(key)
+            if pending is None:
+                pending = self._pending[key] = Future()
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return pending.result()
+
+        try:
+            value = fit()
+        except BaseException as error:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(error)
+            raise
+
+        with self._lock:
+            self._items[key] = value
+            self._items.move_to_end(key)
+            while len(self._items) > self.maxsize:
+                self._items.popitem(last=False)
+            del self._pending[key]
+        pending.set_result(value)
+
+        return value
+
+    def items(self):
+        """
+        Snapshot of (key, value) pairs, least recently used first.
+        """
+
+        with self._lock:
+            return list(self._items.items())
+
+    def discard(self, key):
+        with self._lock:
+            self._items.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._items.clear()
+
+    def __contains__(self, key):
+        with self._lock:
+            return key in self._items
+
+    def __len__(self):
+        with self._lock:
+            return len(self._items)
+
+
+# Process-wide cache used by the model modules
+MODEL_CACHE = FittedModelCache()
@@ -23,7 +23,7 @@ def evaluate_models():
     # ----------------------------------
     # ARIMA
     # ----------------------------------
-    arima_df = arima_forecast(df)
+    arima_df = arima_forecast(df, symbol="BTC")
     arima_pred = arima_df["ARIMA_Fitted"].values
 
     min_len = min(len(actual_prices), len(arima_pred))
@@ -39,13 +39,13 @@ def evaluate_models():
     # ----------------------------------
     # PROPHET
     # ----------------------------------
-    prophet_df = prophet_forecast(df)
+    prophet_df = prophet_forecast(df, symbol="BTC")
     prophet_pred = prophet_df["Prophet_Forecast"].values[-min_len:]
 
     # ----------------------------------
     # LSTM
     # ----------------------------------
-    lstm_df = lstm_forecast(df)
+    lstm_df = lstm_forecast(df, symbol="BTC")
     lstm_pred = lstm_df["LSTM_Prediction"].values[-min_len:]
     actual_lstm = lstm_df["Actual_Price"].values[-min_len:]
 
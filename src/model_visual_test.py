@@ -1,9 +1,9 @@
 import matplotlib.pyplot as plt
 
-from data_loader import load_crypto_data
-from preprocessing import preprocess_crypto_data
-from arima_model import arima_forecast
-from sarima_model import sarima_forecast
+from src.data_loader import load_crypto_data
+from src.preprocessing import preprocess_crypto_data
+from src.arima_model import arima_forecast
+from src.sarima_model import sarima_forecast
 
 # ----------------------------------
 # LOAD & PREPROCESS DATA
@@ -0,0 +1,195 @@
+import json
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from src.atomic_files import write_text_atomic
+
+PANEL_DIR = Path("data/panel")
+
+FIELDS = ["Open", "High", "Low", "Close", "Volume"]
+
+# Each build lives in its own PANEL_DIR/<build id>/ directory; CURRENT
+# names the live one and is swapped in with a single rename
+CURRENT_FILE = "CURRENT"
+
+# Builds kept on disk (older ones may still be mapped by running readers)
+KEEP_BUILDS = 2
+
+
+class OHLCVPanel:
+    """
+    Date-aligned multi-coin price panel.
+
+    values : (coins, dates, fields) float array, NaN where a coin has no bar
+    mask   : (coins, dates) bool array, True where a coin has a bar
+    dates  : shared datetime64 date index
+    """
+
+    def __init__(self, symbols, dates, values, mask):
+        self.symbols = list(symbols)
+        self.dates = dates
+        self.values = values
+        self.mask = mask
+        self._positions = {symbol: i for i, symbol in enumerate(self.symbols)}
+
+    # -----------------------------
+    # Construction
+    # -----------------------------
+    @classmethod
+    def from_frames(cls, frames, dtype=np.float64, out=None):
+        """
+        Align {symbol: DataFrame(Date + OHLCV)} on the union of their dates.
+        `out` lets build_panel write straight into a memory-mapped array.
+        """
+
+        symbols = list(frames)
+        frame_dates = [pd.to_datetime(frames[s]["Date"]).values.astype("datetime64[D]") for s in symbols]
+        dates = np.unique(np.concatenate(frame_dates))
+
+        shape = (len(symbols), len(dates), len(FIELDS))
+        values = np.empty(shape, dtype=dtype) if out is None else out(shape, dtype)
+        values[...] = np.nan
+        mask = np.zeros(shape[:2], dtype=bool)
+
+        for i, symbol in enumerate(symbols):
+            rows = np.searchsorted(dates, frame_dates[i])
+            values[i, rows, :] = frames[symbol][FIELDS].to_numpy(dtype=dtype)
+            mask[i, rows] = True
+
+        return cls(symbols, dates, values, mask)
+
+    @classmethod
+    def open(cls, path=PANEL_DIR, mmap_mode="r"):
+        """
+        Memory-map a saved panel. Processes opening the same files share
+        one physical copy through the OS page cache.
+        """
+
+        path = Path(path)
+        build = path / (path / CURRENT_FILE).read_text().strip()
+        meta = json.loads((build / "panel.json").read_text())
+
+        values = np.load(build / "values.npy", mmap_mode=mmap_mode)
+        mask = np.load(build / "mask.npy", mmap_mode=mmap_mode)
+        dates = np.load(build / "dates.npy")
+
+        return cls(meta["symbols"], dates, values, mask)
+
+    # -----------------------------
+    # Per-coin access (no copies)
+    # -----------------------------
+    def _valid_rows(self, i):
+        rows = np.flatnonzero(self.mask[i])
+        if len(rows) == 0:
+            return slice(0, 0)
+        return slice(rows[0], rows[-1] + 1)
+
+    def view(self, symbol):
+        """
+        (dates, fields) view of one coin, from its first to its last bar.
+        """
+
+        i = self._positions[symbol]
+        return self.values[i, self._valid_rows(i)]
+
+    def frame(self, symbol):
+        """
+        One coin as a Date-indexed OHLCV DataFrame backed by the panel memory.
+        """
+
+        i = self._positions[symbol]
+        rows = self._valid_rows(i)
+
+        return pd.DataFrame(
+            self.values[i, rows],
+            index=pd.DatetimeIndex(self.dates[rows].astype("datetime64[ns]"), name="Date"),
+            columns=FIELDS,
+            copy=False
+        )
+
+    # -----------------------------
+    # Cross-coin access
+    # -----------------------------
+    def field(self, name):
+        """
+        (coins, dates) view of one OHLCV field for every coin.
+        """
+
+        return self.values[:, :, FIELDS.index(name)]
+
+    def field_frame(self, name):
+        """
+        Dates x coins DataFrame of one field (e.g. for .corr() across coins).
+        """
+
+        return pd.DataFrame(
+            self.field(name).T,
+            index=pd.DatetimeIndex(self.dates.astype("datetime64[ns]"), name="Date"),
+            columns=self.symbols,
+            copy=False
+        )
+
+
+def build_panel(frames, path=PANEL_DIR, dtype=np.float64):
+    """
+    Build the panel from {symbol: DataFrame} and save it as .npy files
+    that OHLCVPanel.open() memory-maps.
+
+    Files go to a fresh build directory and the CURRENT pointer is swapped
+    last, so a reader always sees the values, mask, dates and metadata of
+    one build together.
+    """
+
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+    # Unique per writer (sessions share a pid); names still sort by time
+    build = Path(tempfile.mkdtemp(dir=path, prefix=f"build-{time.time_ns()}-"))
+    build.chmod(0o755)
+    build_id = build.name
+
+    def memmap(shape, dtype):
+        return np.lib.format.open_memmap(
+            build / "values.npy", mode="w+", dtype=dtype, shape=shape
+        )
+
+    panel = OHLCVPanel.from_frames(frames, dtype=dtype, out=memmap)
+    panel.values.flush()
+    del panel.values
+
+    np.save(build / "mask.npy", panel.mask)
+    np.save(build / "dates.npy", panel.dates)
+    (build / "panel.json").write_text(json.dumps({
+        "symbols": panel.symbols,
+        "dtype": np.dtype(dtype).name,
+        "fields": FIELDS
+    }))
+
+    # Swap the pointer; already-open memory maps keep the old build
+    write_text_atomic(path / CURRENT_FILE, build_id)
+
+    builds = sorted(p for p in path.glob("build-*") if p.is_dir())
+    for old in builds[:-KEEP_BUILDS]:
+        shutil.rmtree(old, ignore_errors=True)
+
+    return OHLCVPanel.open(path)
+
+
+# ---------------- BUILD ----------------
+if __name__ == "__main__":
+    from src.data_sources import CSVDirectorySource, CSV_DIR
+
+    source = CSVDirectorySource()
+    start, end = pd.Timestamp("2016-01-01"), pd.Timestamp.today().normalize()
+
+    frames = {
+        csv_path.stem: source.fetch(csv_path.stem, start, end)
+        for csv_path in sorted(CSV_DIR.glob("*.csv"))
+    }
+
+    panel = build_panel(frames)
+    print("Panel:", panel.values.shape, "saved to", PANEL_DIR)
@@ -1,9 +1,12 @@
 import pandas as pd
 import numpy as np
 
-def preprocess_crypto_data(df):
+from src.indicators import compute_indicators
+
+def preprocess_crypto_data(df, indicators=None):
     """
     Clean and enrich crypto price data for analysis and modeling.
+    indicators: optional extra columns from src.indicators, e.g. ["RSI_14", "MACD"].
     """
 
     # Sort by date (important for time series)
@@ -19,6 +22,17 @@ def preprocess_crypto_data(df):
     df["MA_7"] = df["Close"].rolling(window=7).mean()
     df["MA_30"] = df["Close"].rolling(window=30).mean()
 
+    # Extra technical indicators (same engine as the multi-coin path)
+    if indicators:
+        extra = compute_indicators(
+            df[["Close"]].to_numpy(),
+            df[["High"]].to_numpy(),
+            df[["Low"]].to_numpy(),
+            indicators=indicators
+        )
+        for column in extra.columns.get_level_values(0).unique():
+            df[column] = extra[column].to_numpy()[:, 0]
+
     # Drop initial NaN rows
     df = df.dropna().reset_index(drop=True)
 
@@ -26,7 +40,7 @@ def preprocess_crypto_data(df):
 
 
 if __name__ == "__main__":
-    from data_loader import load_crypto_data
+    from src.data_loader import load_crypto_data
 
     df = load_crypto_data("BTC", "2016-01-01")
     df = preprocess_crypto_data(df)
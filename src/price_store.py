@@ -0,0 +1,103 @@
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.atomic_files import atomic_path
+
+# Local columnar store: one Parquet file per coin
+STORE_DIR = Path("data/store")
+
+PRICE_COLUMNS = ["Date", "Open", "High", "Low", "Close", "Volume"]
+
+# Schema metadata keys recording which date range has already been
+# requested from the remote source (inclusive on both ends)
+_COVERAGE_START = b"coverage_start"
+_COVERAGE_END = b"coverage_end"
+
+
+def store_path(symbol, store_dir=STORE_DIR):
+    return Path(store_dir) / f"{symbol}.parquet"
+
+
+def read_store(symbol, store_dir=STORE_DIR):
+    """
+    Read a coin's stored prices.
+    Returns (df, coverage) where coverage is a (start, end) tuple of
+    Timestamps, or (None, None) if the coin is not in the store.
+    """
+
+    path = store_path(symbol, store_dir)
+    if not path.exists():
+        return None, None
+
+    table = pq.read_table(path)
+    metadata = table.schema.metadata or {}
+
+    df = table.to_pandas()
+    df["Date"] = pd.to_datetime(df["Date"]).astype("datetime64[ns]")
+
+    if _COVERAGE_START in metadata and _COVERAGE_END in metadata:
+        coverage = (
+            pd.Timestamp(metadata[_COVERAGE_START].decode()),
+            pd.Timestamp(metadata[_COVERAGE_END].decode())
+        )
+    elif not df.empty:
+        coverage = (df["Date"].min(), df["Date"].max())
+    else:
+        coverage = None
+
+    return df, coverage
+
+
+def write_store(symbol, df, coverage, store_dir=STORE_DIR):
+    """
+    Atomically write a coin's prices together with its coverage range.
+    Returns the sorted, de-duplicated frame that was written.
+    """
+
+    path = store_path(symbol, store_dir)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    df = df[PRICE_COLUMNS].sort_values("Date")
+    df = df.drop_duplicates(subset="Date", keep="last").reset_index(drop=True)
+
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    metadata = dict(table.schema.metadata or {})
+    metadata[_COVERAGE_START] = str(coverage[0].date()).encode()
+    metadata[_COVERAGE_END] = str(coverage[1].date()).encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write next to the target and rename, so readers never see a partial file
+    with atomic_path(path) as tmp_path:
+        pq.write_table(table, tmp_path)
+
+    return df
+
+
+def missing_ranges(coverage, start, end):
+    """
+    Date ranges to fetch so the store covers [start, end].
+
+    Coverage is one contiguous range, so gaps always reach it: a request
+    entirely before or after the stored range also fetches the days in
+    between, which would otherwise be recorded as covered without data.
+    """
+
+    if start > end:
+        return []
+
+    if coverage is None:
+        return [(start, end)]
+
+    cov_start, cov_end = coverage
+    one_day = pd.Timedelta(days=1)
+
+    gaps = []
+    if start < cov_start:
+        gaps.append((start, cov_start - one_day))
+    if end > cov_end:
+        gaps.append((cov_end + one_day, end))
+
+    return gaps
@@ -1,96 +1,223 @@
+import hashlib
+import json
+import threading
+from pathlib import Path
+
 import numpy as np
 import pandas as pd
+import prophet
 from prophet import Prophet
+from prophet.serialize import model_from_json, model_to_json
+
+from src.atomic_files import write_text_atomic
+from src.model_cache import MODEL_CACHE, series_fingerprint
+
+PROPHET_CONFIG = {
+    "daily_seasonality": True,
+    "yearly_seasonality": True,
+    "weekly_seasonality": False,
+}
+
+# Serialized fitted models, one file per coin
+PROPHET_CACHE_DIR = Path("data/models/prophet")
+
+# Prediction modes: yhat is the same in all of them, only the uncertainty
+# intervals (posterior samples of trend changes and noise) differ
+PREDICTION_MODES = {
+    "point": {"uncertainty_samples": 0, "vectorized": True},    # yhat only
+    "fast": {"uncertainty_samples": 200, "vectorized": True},   # rough intervals
+    "full": {"uncertainty_samples": 1000, "vectorized": True},  # Prophet defaults
+}
+
+# Fitted models are shared, and the sample count is set on the model
+_PREDICT_LOCK = threading.Lock()
 
-def prophet_forecast(df):
+
+def _prophet_frame(df):
     """
-    Prophet forecast using log-transformed prices
-    (prevents negative predictions).
+    ds / y frame with log prices (prevents negative predictions).
     """
 
-    # -----------------------------
-    # Prepare data
-    # -----------------------------
     prophet_df = pd.DataFrame()
     prophet_df["ds"] = pd.to_datetime(df["Date"])
 
     # 🔥 LOG TRANSFORM (KEY FIX)
     prophet_df["y"] = np.log(df["Close"].values.astype(float))
 
-    prophet_df = prophet_df.dropna().reset_index(drop=True)
+    return prophet_df.dropna().reset_index(drop=True)
 
-    # -----------------------------
-    # Build & fit Prophet
-    # -----------------------------
-    model = Prophet(
-        daily_seasonality=True,
-        yearly_seasonality=True,
-        weekly_seasonality=False
-    )
 
-    model.fit(prophet_df)
+def _config_key(config):
+    """
+    Fingerprint of the Prophet config and Prophet version.
+    """
 
-    # In-sample prediction
-    forecast = model.predict(prophet_df)
+    settings = json.dumps({"config": config, "prophet": prophet.__version__}, sort_keys=True)
+    return hashlib.blake2b(settings.encode(), digest_size=16).hexdigest()
 
-    # -----------------------------
-    # Convert back to price scale
-    # -----------------------------
-    forecast_df = pd.DataFrame()
-    forecast_df["Date"] = forecast["ds"]
-    forecast_df["Prophet_Forecast"] = np.exp(forecast["yhat"])
 
-    return forecast_df
+def _fit_key(prophet_df, config):
+    """
+    Fingerprint of the training data, Prophet config and Prophet version.
+    """
 
+    days = prophet_df["ds"].values.astype("datetime64[D]").astype(np.float64)
+    data = series_fingerprint(np.concatenate([days, prophet_df["y"].values]))
 
-# ---------------- TEST ----------------
-if __name__ == "__main__":
-    from data_loader import load_crypto_data
-    from preprocessing import preprocess_crypto_data
+    return hashlib.blake2b((data + _config_key(config)).encode(), digest_size=16).hexdigest()
 
-    df = load_crypto_data("BTC", "2016-01-01")
-    df = preprocess_crypto_data(df)
 
-    print("Last date in dataset:", df["Date"].max())
+def warm_start_params(model):
+    """
+    Optimized parameters of a fitted model (JSON-ready; Prophet.fit(init=...)
+    wants the vectors back as arrays).
+    """
 
-    prophet_df = prophet_forecast(df)
-    print(prophet_df.head())
+    init = {name: float(model.params[name][0][0]) for name in ["k", "m", "sigma_obs"]}
+    for name in ["delta", "beta"]:
+        init[name] = model.params[name][0].tolist()
+    return init
 
 
-import pandas as pd
-import numpy as np
-from prophet import Prophet
+def _read_cache(path):
+    if path is None or not path.exists():
+        return None
+    return json.loads(path.read_text())
 
-def prophet_forecast_30_days(df, steps=30):
+
+def _save_cached_model(path, key, config_key, model):
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    cached = {
+        "key": key,
+        "config_key": config_key,
+        "start": str(model.start),
+        "init": warm_start_params(model),
+        "model": model_to_json(model),
+    }
+
+    write_text_atomic(path, json.dumps(cached))
+
+
+def fit_prophet(prophet_df, symbol=None, config=PROPHET_CONFIG, cache_dir=PROPHET_CACHE_DIR,
+                warm_start=True):
     """
-    Forecast future prices AFTER the last available date using Prophet.
-    Uses log-transform to avoid negative prices.
+    Fitted Prophet for a ds / y frame. Reuses an in-process fit, then (with
+    `symbol`) the coin's serialized model if its data + config key matches.
+
+    Otherwise, with warm_start=True the coin's previous optimized parameters
+    initialize the fit (after a data refresh the optimizer starts near the
+    answer). A changed config or history start gets a cold start.
     """
 
-    # Prepare data for Prophet
-    prophet_df = pd.DataFrame()
-    prophet_df["ds"] = pd.to_datetime(df["Date"])
-    prophet_df["y"] = np.log(df["Close"].values)
+    key = _fit_key(prophet_df, config)
+    config_key = _config_key(config)
 
-    model = Prophet(
-        daily_seasonality=True,
-        yearly_seasonality=True,
-        weekly_seasonality=False
-    )
+    def fit():
+        path = Path(cache_dir) / f"{symbol}.json" if symbol is not None else None
+        cached = _read_cache(path)
 
-    model.fit(prophet_df)
+        if cached is not None and cached.get("key") == key:
+            return model_from_json(cached["model"])
 
-    # Create future dataframe
-    future = model.make_future_dataframe(periods=steps, freq="D")
+        model = Prophet(**config)
 
-    forecast = model.predict(future)
+        if (warm_start and cached is not None
+                and cached.get("config_key") == config_key
+                and pd.Timestamp(cached["start"]) == prophet_df["ds"].min()):
+            init = {name: np.asarray(value) for name, value in cached["init"].items()}
+            model.fit(prophet_df, init=init)
+        else:
+            model.fit(prophet_df)
+
+        if path is not None:
+            _save_cached_model(path, key, config_key, model)
+        return model
+
+    return MODEL_CACHE.get_or_fit(("prophet", key), fit)
+
+
+def prophet_forecast_with_history(df, steps=30, symbol=None, mode="point"):
+    """
+    One Prophet fit and one predict call over history + the next `steps`
+    days. Returns (historical fit frame, future forecast frame).
+
+    mode (see PREDICTION_MODES): "point" skips uncertainty sampling;
+    "fast" and "full" add interval columns to both frames.
+    """
+
+    settings = PREDICTION_MODES[mode]
+    prophet_df = _prophet_frame(df)
+    key = ("prophet-predict", _fit_key(prophet_df, PROPHET_CONFIG), steps, mode)
+
+    def predict():
+        model = fit_prophet(prophet_df, symbol=symbol)
+
+        # History dates followed by the future ones
+        future = model.make_future_dataframe(periods=steps, freq="D")
+
+        with _PREDICT_LOCK:
+            model.uncertainty_samples = settings["uncertainty_samples"]
+            return model.predict(future, vectorized=settings["vectorized"])
+
+    forecast = MODEL_CACHE.get_or_fit(key, predict)
+    n_history = len(forecast) - steps
+    intervals = settings["uncertainty_samples"] > 0
+
+    # -----------------------------
+    # Convert back to price scale
+    # -----------------------------
+    history_df = pd.DataFrame()
+    history_df["Date"] = forecast["ds"].iloc[:n_history]
+    history_df["Prophet_Forecast"] = np.exp(forecast["yhat"].iloc[:n_history])
+    if intervals:
+        history_df["Prophet_Lower"] = np.exp(forecast["yhat_lower"].iloc[:n_history])
+        history_df["Prophet_Upper"] = np.exp(forecast["yhat_upper"].iloc[:n_history])
 
     # Extract ONLY future dates
-    future_forecast = forecast.tail(steps)
+    future_forecast = forecast.iloc[n_history:]
 
-    forecast_df = pd.DataFrame({
+    future_df = pd.DataFrame({
         "Date": future_forecast["ds"],
         "Forecast": np.exp(future_forecast["yhat"])
     })
+    if intervals:
+        future_df["Lower"] = np.exp(future_forecast["yhat_lower"])
+        future_df["Upper"] = np.exp(future_forecast["yhat_upper"])
+
+    return history_df, future_df
+
+
+def prophet_forecast(df, symbol=None, mode="point"):
+    """
+    Prophet forecast using log-transformed prices
+    (prevents negative predictions).
+    """
+
+    # Shares its fit and predict call with prophet_forecast_30_days
+    history_df, _ = prophet_forecast_with_history(df, symbol=symbol, mode=mode)
+    return history_df
+
+
+# ---------------- TEST ----------------
+if __name__ == "__main__":
+    from src.data_loader import load_crypto_data
+    from src.preprocessing import preprocess_crypto_data
+
+    df = load_crypto_data("BTC", "2016-01-01")
+    df = preprocess_crypto_data(df)
+
+    print("Last date in dataset:", df["Date"].max())
+
+    prophet_df = prophet_forecast(df)
+    print(prophet_df.head())
+
+
+def prophet_forecast_30_days(df, steps=30, symbol=None, mode="point"):
+    """
+    Forecast future prices AFTER the last available date using Prophet.
+    Uses log-transform to avoid negative prices.
+    """
 
+    _, forecast_df = prophet_forecast_with_history(df, steps=steps, symbol=symbol, mode=mode)
     return forecast_df
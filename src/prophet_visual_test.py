@@ -1,8 +1,8 @@
 import matplotlib.pyplot as plt
 
-from data_loader import load_crypto_data
-from preprocessing import preprocess_crypto_data
-from prophet_model import prophet_forecast
+from src.data_loader import load_crypto_data
+from src.preprocessing import preprocess_crypto_data
+from src.prophet_model import prophet_forecast
 
 # ----------------------------------
 # LOAD & PREPROCESS DATA
@@ -40,8 +40,8 @@ def sarima_forecast(df):
 
 # ---------------- TEST ----------------
 if __name__ == "__main__":
-    from data_loader import load_crypto_data
-    from preprocessing import preprocess_crypto_data
+    from src.data_loader import load_crypto_data
+    from src.preprocessing import preprocess_crypto_data
 
     df = load_crypto_data("BTC", "2016-01-01")
     df = preprocess_crypto_data(df)
@@ -53,29 +53,380 @@ if __name__ == "__main__":
     
     
     
+import json
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
 from statsmodels.tsa.statespace.sarimax import SARIMAX
 
-def sarima_forecast_30_days(df, steps=30):
+from src.atomic_files import atomic_path
+from src.model_cache import MODEL_CACHE, series_fingerprint
+
+# Forecast model orders
+SARIMA_ORDER = (1, 1, 1)
+SARIMA_SEASONAL_ORDER = (1, 1, 1, 12)
+
+# Per-coin filter-state checkpoints
+CHECKPOINT_DIR = Path("data/models/sarima")
+CHECKPOINT_VERSION = 1
+
+# New bars filtered from a checkpoint before the model is refitted
+REFIT_AFTER_BARS = 30
+
+# -----------------------------
+# Fit modes
+# -----------------------------
+# concentrate_scale   : profile sigma2 out of the likelihood (one fewer
+#                       parameter for the optimizer)
+# simple_differencing : difference the data up front and fit a smaller
+#                       ARMA state space (first d + D*s bars are dropped)
+# filter              : "conventional" or "univariate" Kalman recursion
+# low_memory          : keep no smoothed states or per-step filter output;
+#                       forecasting still works, in-sample results do not
+DEFAULT_FIT_OPTIONS = {
+    "concentrate_scale": False,
+    "simple_differencing": False,
+    "filter": "conventional",
+    "low_memory": False,
+}
+
+FIT_MODES = {
+    "default": {},
+    "concentrated": {"concentrate_scale": True},
+    "simple_diff": {"simple_differencing": True},
+    "univariate": {"filter": "univariate"},
+    "low_memory": {"low_memory": True},
+    "fast": {"concentrate_scale": True, "simple_differencing": True, "low_memory": True},
+}
+
+
+def fit_options(fit_mode="default"):
     """
-    Forecast future prices AFTER the last available date using SARIMA.
+    Resolve a mode name (see FIT_MODES) or an options dict.
     """
 
-    series = df["Close"].values
+    options = FIT_MODES[fit_mode] if isinstance(fit_mode, str) else fit_mode
+    unknown = set(options) - set(DEFAULT_FIT_OPTIONS)
+    if unknown:
+        raise ValueError(f"Unknown SARIMA fit options: {sorted(unknown)}")
+
+    return dict(DEFAULT_FIT_OPTIONS, **options)
 
-    # Use same SARIMA order as your fitted model
+
+def _fit_sarima(values, options, order=SARIMA_ORDER,
+                seasonal_order=SARIMA_SEASONAL_ORDER):
     model = SARIMAX(
-        series,
-        order=(1, 1, 1),
-        seasonal_order=(1, 1, 1, 12),
+        values,
+        order=order,
+        seasonal_order=seasonal_order,
         enforce_stationarity=False,
-        enforce_invertibility=False
+        enforce_invertibility=False,
+        concentrate_scale=options["concentrate_scale"],
+        simple_differencing=options["simple_differencing"]
     )
 
-    model_fit = model.fit(disp=False)
+    if options["filter"] == "univariate":
+        model.ssm.filter_univariate = True
+    elif options["filter"] != "conventional":
+        raise ValueError(f"Unknown SARIMA filter: {options['filter']}")
+
+    return model.fit(disp=False, low_memory=options["low_memory"])
+
+
+def fit_sarima(values, fit_mode="default", order=SARIMA_ORDER,
+               seasonal_order=SARIMA_SEASONAL_ORDER):
+    """
+    Fit the forecast SARIMA on a close series (cached per series + mode).
+    """
+
+    values = np.asarray(values, dtype=np.float64)
+    options = fit_options(fit_mode)
+    key = (
+        "sarima", tuple(order), tuple(seasonal_order),
+        tuple(sorted(options.items())), series_fingerprint(values)
+    )
+
+    return MODEL_CACHE.get_or_fit(
+        key, lambda: _fit_sarima(values, options, order, seasonal_order)
+    )
+
+
+def _difference_poly(d, seasonal_d, period):
+    """
+    Coefficients (in L) of (1-L)^d (1-L^s)^D.
+    """
+
+    poly = np.array([1.0])
+    for _ in range(d):
+        poly = np.convolve(poly, [1.0, -1.0])
+    for _ in range(seasonal_d):
+        seasonal = np.zeros(period + 1)
+        seasonal[0], seasonal[-1] = 1.0, -1.0
+        poly = np.convolve(poly, seasonal)
+    return poly
+
+
+def undifference(forecast, history, d, seasonal_d, period):
+    """
+    Map forecasts of the (1-L)^d (1-L^s)^D differenced series back to
+    price levels, given the price history they continue.
+    """
+
+    poly = _difference_poly(d, seasonal_d, period)
+    lags = len(poly) - 1
+    levels = list(np.asarray(history, dtype=np.float64)[-lags:]) if lags else []
+    out = np.empty(len(forecast))
+
+    for h, w in enumerate(forecast):
+        out[h] = w - sum(poly[k] * levels[-k] for k in range(1, lags + 1))
+        levels.append(out[h])
+
+    return out
+
+
+# -----------------------------
+# Filter-state checkpoints
+# -----------------------------
+# A checkpoint holds the fitted parameters and the one-step-ahead state
+# mean / covariance after the last observation. New bars are filtered
+# from that state, so a daily update is a few Kalman steps instead of a
+# refit (and a refilter of the history since 2016).
+
+def _state_model(values, options, order, seasonal_order):
+    """
+    State-space model that continues a fit: the full SARIMAX on prices,
+    or (with simple differencing) the ARMA part on differenced prices.
+    """
+
+    if options["simple_differencing"]:
+        order = (order[0], 0, order[2])
+        seasonal_order = (seasonal_order[0], 0, seasonal_order[2], seasonal_order[3])
+
+    model = SARIMAX(
+        values,
+        order=order,
+        seasonal_order=seasonal_order,
+        enforce_stationarity=False,
+        enforce_invertibility=False,
+        concentrate_scale=options["concentrate_scale"]
+    )
+    if options["filter"] == "univariate":
+        model.ssm.filter_univariate = True
+    return model
+
+
+def _final_state(model_fit):
+    """
+    Predicted state mean / covariance for the bar after the last one.
+    Covariances are reported times the estimated scale when the scale is
+    concentrated out; the filter itself runs at scale 1.
+    """
+
+    results = model_fit.filter_results
+    state = np.array(results.predicted_state[:, -1])
+    state_cov = np.array(results.predicted_state_cov[:, :, -1]) / results.scale
+    return state, state_cov
+
+
+def make_sarima_checkpoint(model_fit, series, last_date, options,
+                           order=SARIMA_ORDER, seasonal_order=SARIMA_SEASONAL_ORDER):
+    state, state_cov = _final_state(model_fit)
+    lags = order[1] + seasonal_order[1] * seasonal_order[3]
+
+    return {
+        "params": np.asarray(model_fit.params, dtype=np.float64),
+        "state": state,
+        "state_cov": state_cov,
+        "tail": np.asarray(series, dtype=np.float64)[-max(lags, 1):],
+        "meta": {
+            "version": CHECKPOINT_VERSION,
+            "order": list(order),
+            "seasonal_order": list(seasonal_order),
+            "options": options,
+            "last_date": str(pd.Timestamp(last_date).date()),
+            "nobs": len(series),
+            "bars_since_fit": 0,
+        },
+    }
+
+
+def save_sarima_checkpoint(symbol, checkpoint, checkpoint_dir=CHECKPOINT_DIR):
+    """
+    Write a coin's checkpoint as one .npz (atomic).
+    """
+
+    path = Path(checkpoint_dir) / f"{symbol}.npz"
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    with atomic_path(path, suffix=".tmp.npz") as tmp_path:
+        np.savez(
+            tmp_path,
+            params=checkpoint["params"],
+            state=checkpoint["state"],
+            state_cov=checkpoint["state_cov"],
+            tail=checkpoint["tail"],
+            meta=np.array(json.dumps(checkpoint["meta"]))
+        )
+
+
+def load_sarima_checkpoint(symbol, checkpoint_dir=CHECKPOINT_DIR):
+    """
+    A coin's checkpoint, or None if missing / from another format version.
+    """
+
+    path = Path(checkpoint_dir) / f"{symbol}.npz"
+    if not path.exists():
+        return None
+
+    with np.load(path) as data:
+        meta = json.loads(str(data["meta"]))
+        if meta.get("version") != CHECKPOINT_VERSION:
+            return None
+        checkpoint = {name: data[name] for name in ["params", "state", "state_cov", "tail"]}
+
+    checkpoint["meta"] = meta
+    return checkpoint
+
+
+def resume_sarima_checkpoint(checkpoint, new_values, last_date):
+    """
+    Filter new bars from the checkpointed state (parameters unchanged)
+    and return the updated checkpoint.
+    """
+
+    meta = checkpoint["meta"]
+    options = meta["options"]
+    order, seasonal_order = meta["order"], meta["seasonal_order"]
+    new_values = np.asarray(new_values, dtype=np.float64)
+
+    if options["simple_differencing"]:
+        poly = _difference_poly(order[1], seasonal_order[1], seasonal_order[3])
+        history = np.concatenate([checkpoint["tail"], new_values])
+        endog = np.convolve(history, poly, mode="valid")[-len(new_values):]
+    else:
+        endog = new_values
+
+    model = _state_model(endog, options, order, seasonal_order)
+    model.initialize_known(checkpoint["state"], checkpoint["state_cov"])
+    state, state_cov = _final_state(model.filter(checkpoint["params"], low_memory=True))
+
+    tail = np.concatenate([checkpoint["tail"], new_values])[-len(checkpoint["tail"]):]
+    return {
+        "params": checkpoint["params"],
+        "state": state,
+        "state_cov": state_cov,
+        "tail": tail,
+        "meta": dict(
+            meta,
+            last_date=str(pd.Timestamp(last_date).date()),
+            nobs=meta["nobs"] + len(new_values),
+            bars_since_fit=meta["bars_since_fit"] + len(new_values)
+        ),
+    }
+
+
+def forecast_sarima_checkpoint(checkpoint, steps=30):
+    """
+    Price forecasts from a checkpoint's state (no filtering needed).
+    """
+
+    meta = checkpoint["meta"]
+    options = meta["options"]
+    order, seasonal_order = meta["order"], meta["seasonal_order"]
+
+    # Only the (time-invariant) system matrices are needed
+    model = _state_model(np.zeros(2), options, order, seasonal_order)
+    model.update(checkpoint["params"])
+    design = model.ssm["design"][0]
+    transition = model.ssm["transition"]
+
+    state = checkpoint["state"]
+    out = np.empty(steps)
+    for h in range(steps):
+        out[h] = design @ state
+        state = transition @ state
+
+    if options["simple_differencing"]:
+        out = undifference(out, checkpoint["tail"], order[1], seasonal_order[1], seasonal_order[3])
+    return out
+
+
+def _new_bars(checkpoint, df, options):
+    """
+    Closes after the checkpoint, or None when the checkpoint does not
+    continue this history (other settings, revised or unknown prices).
+    """
+
+    if checkpoint is None:
+        return None
+
+    meta = checkpoint["meta"]
+    if (meta["options"] != options or tuple(meta["order"]) != SARIMA_ORDER
+            or tuple(meta["seasonal_order"]) != SARIMA_SEASONAL_ORDER):
+        return None
+
+    dates = pd.to_datetime(df["Date"]).reset_index(drop=True)
+    matches = np.flatnonzero(dates == pd.Timestamp(meta["last_date"]))
+    if len(matches) == 0:
+        return None
+
+    end = matches[0] + 1
+    series = df["Close"].to_numpy(dtype=np.float64)
+    tail = checkpoint["tail"]
+    if end < len(tail) or not np.array_equal(series[end - len(tail):end], tail):
+        return None
+
+    return series[end:]
+
+
+def _checkpoint_forecast(df, symbol, fit_mode, steps, checkpoint_dir):
+    options = fit_options(fit_mode)
+    series = df["Close"].values
+    last_date = pd.to_datetime(df["Date"].iloc[-1])
+
+    checkpoint = load_sarima_checkpoint(symbol, checkpoint_dir)
+    new_values = _new_bars(checkpoint, df, options)
+
+    if new_values is None or checkpoint["meta"]["bars_since_fit"] + len(new_values) > REFIT_AFTER_BARS:
+        model_fit = fit_sarima(series, options)
+        checkpoint = make_sarima_checkpoint(model_fit, series, last_date, options)
+        save_sarima_checkpoint(symbol, checkpoint, checkpoint_dir)
+    elif len(new_values):
+        checkpoint = resume_sarima_checkpoint(checkpoint, new_values, last_date)
+        save_sarima_checkpoint(symbol, checkpoint, checkpoint_dir)
+
+    return forecast_sarima_checkpoint(checkpoint, steps)
+
+
+def sarima_forecast_30_days(df, steps=30, fit_mode="default", symbol=None,
+                            checkpoint_dir=CHECKPOINT_DIR):
+    """
+    Forecast future prices AFTER the last available date using SARIMA.
+
+    fit_mode picks the estimation settings (see FIT_MODES); "fast" is
+    meant for forecast-only calls like this one. With `symbol`, the coin's
+    filter-state checkpoint is reused: new bars are filtered from it and
+    the model is only refitted every REFIT_AFTER_BARS bars.
+    """
+
+    series = df["Close"].values
+
+    if symbol is not None:
+        forecast_values = _checkpoint_forecast(df, symbol, fit_mode, steps, checkpoint_dir)
+    else:
+        # Use same SARIMA order as your fitted model
+        model_fit = fit_sarima(series, fit_mode)
+
+        forecast_values = np.asarray(model_fit.forecast(steps=steps))
 
-    forecast = model_fit.get_forecast(steps=steps)
-    forecast_values = forecast.predicted_mean
+        # Simple differencing forecasts the differenced series
+        model = model_fit.model
+        if model.simple_differencing:
+            forecast_values = undifference(
+                forecast_values, series, model.k_diff, model.k_seasonal_diff,
+                model.seasonal_periods
+            )
 
     last_date = pd.to_datetime(df["Date"].iloc[-1])
 
@@ -0,0 +1,107 @@
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+# Training batch size used by the LSTM models
+BATCH_SIZE = 32
+
+
+def sliding_windows(values, lookback):
+    """
+    (N - lookback, lookback) read-only view of every input window of a 1-D
+    series (window i covers values[i:i + lookback] and predicts
+    values[i + lookback]). No data is copied.
+    """
+
+    values = np.asarray(values).reshape(-1)
+    return sliding_window_view(values, lookback)[:-1]
+
+
+def window_dataset(values, lookback, start=0, stop=None, targets=True,
+                   batch_size=BATCH_SIZE, shuffle=False, seed=None, horizon=1):
+    """
+    Streaming tf.data pipeline over windows start..stop-1 of a 1-D series.
+
+    Only the float32 series and the window start indices are held in
+    memory (O(N)); each batch gathers its (batch, lookback, 1) inputs on the
+    fly and is prefetched while the previous one trains. With targets=True
+    the elements are (inputs, next `horizon` values) pairs; windows without
+    a full horizon after them are dropped.
+    """
+
+    import tensorflow as tf
+
+    series = tf.constant(np.asarray(values, dtype=np.float32).reshape(-1))
+    n_windows = int(series.shape[0]) - lookback - (horizon - 1 if targets else 0)
+    stop = n_windows if stop is None else min(stop, n_windows)
+    offsets = tf.range(lookback, dtype=tf.int64)
+    target_offsets = tf.range(lookback, lookback + horizon, dtype=tf.int64)
+
+    def gather(window_starts):
+        inputs = tf.gather(series, window_starts[:, tf.newaxis] + offsets)[..., tf.newaxis]
+        if not targets:
+            return inputs
+        return inputs, tf.gather(series, window_starts[:, tf.newaxis] + target_offsets)
+
+    dataset = tf.data.Dataset.range(start, stop)
+    if shuffle:
+        dataset = dataset.shuffle(stop - start, seed=seed, reshuffle_each_iteration=True)
+
+    return (
+        dataset
+        .batch(batch_size)
+        .map(gather, num_parallel_calls=tf.data.AUTOTUNE)
+        .prefetch(tf.data.AUTOTUNE)
+    )
+
+
+def multi_window_bounds(lengths, lookback, horizon=1, window_range=(0.0, 1.0)):
+    """
+    (first, stop) window index per series for the fraction `window_range`
+    of each series' windows (e.g. (0.9, 1.0) = the latest 10%).
+    """
+
+    n_windows = np.maximum(np.asarray(lengths) - lookback - horizon + 1, 0)
+    return (n_windows * window_range[0]).astype(int), (n_windows * window_range[1]).astype(int)
+
+
+def multi_window_dataset(series_list, lookback, horizon=1, batch_size=BATCH_SIZE,
+                         shuffle=False, seed=None, window_range=(0.0, 1.0)):
+    """
+    Streaming pipeline over the windows of several 1-D series (one per
+    coin), held as one concatenated float32 buffer. Windows never cross
+    series boundaries. Elements are ((inputs, coin ids), next `horizon`
+    values), where series i has coin id i. window_range selects the same
+    chronological fraction of every series' windows.
+    """
+
+    import tensorflow as tf
+
+    arrays = [np.asarray(values, dtype=np.float32).reshape(-1) for values in series_list]
+    lengths = np.array([len(values) for values in arrays])
+    first, stop = multi_window_bounds(lengths, lookback, horizon, window_range)
+    buffer_offsets = np.concatenate([[0], np.cumsum(lengths)[:-1]])
+
+    window_starts = np.concatenate([
+        offset + np.arange(lo, hi) for offset, lo, hi in zip(buffer_offsets, first, stop)
+    ]).astype(np.int64)
+    coin_ids = np.repeat(np.arange(len(arrays), dtype=np.int32), stop - first)
+
+    series = tf.constant(np.concatenate(arrays))
+    offsets = tf.range(lookback, dtype=tf.int64)
+    target_offsets = tf.range(lookback, lookback + horizon, dtype=tf.int64)
+
+    def gather(starts, ids):
+        inputs = tf.gather(series, starts[:, tf.newaxis] + offsets)[..., tf.newaxis]
+        targets = tf.gather(series, starts[:, tf.newaxis] + target_offsets)
+        return (inputs, ids[:, tf.newaxis]), targets
+
+    dataset = tf.data.Dataset.from_tensor_slices((window_starts, coin_ids))
+    if shuffle:
+        dataset = dataset.shuffle(len(window_starts), seed=seed, reshuffle_each_iteration=True)
+
+    return (
+        dataset
+        .batch(batch_size)
+        .map(gather, num_parallel_calls=tf.data.AUTOTUNE)
+        .prefetch(tf.data.AUTOTUNE)
+    )
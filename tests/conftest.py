@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Same `from src.x import` layout as the app and scripts
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
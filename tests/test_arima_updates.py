@@ -0,0 +1,65 @@
+import json
+
+import numpy as np
+import pytest
+
+from src import arima_model
+from src.arima_model import REFIT_AFTER_BARS, _fit_cold, fit_arima
+from src.model_cache import MODEL_CACHE
+
+ORDER = (1, 1, 0)
+
+
+@pytest.fixture
+def closes():
+    rng = np.random.default_rng(0)
+    return 100 + np.cumsum(rng.normal(0, 1, 400))
+
+
+def _no_full_fit(values, order):
+    raise AssertionError("unexpected full fit")
+
+
+def test_restart_resumes_from_checkpoint_without_estimation(closes, tmp_path, monkeypatch):
+    MODEL_CACHE.clear()
+    fit_arima(closes[:-5], ORDER, symbol="BTC", checkpoint_dir=tmp_path)
+    expected = _fit_cold(closes[:-5], ORDER).append(closes[-5:], refit=False)
+
+    # Restart / eviction: only the checkpoint is left
+    MODEL_CACHE.clear()
+    monkeypatch.setattr(arima_model, "_fit_cold", _no_full_fit)
+    model_fit = fit_arima(closes, ORDER, symbol="BTC", checkpoint_dir=tmp_path)
+
+    np.testing.assert_allclose(model_fit.params, expected.params)
+    np.testing.assert_allclose(model_fit.forecast(30), expected.forecast(30))
+    np.testing.assert_allclose(model_fit.fittedvalues, expected.fittedvalues)
+    assert model_fit.estimated_nobs == len(closes) - 5
+
+    checkpoint = json.loads((tmp_path / "BTC.json").read_text())
+    assert checkpoint["nobs"] == len(closes)
+    assert checkpoint["estimated_nobs"] == len(closes) - 5
+
+
+def test_refit_after_refit_after_bars(closes, tmp_path, monkeypatch):
+    MODEL_CACHE.clear()
+    monkeypatch.setattr(arima_model, "_fit_cold", _no_full_fit)
+    split = len(closes) - REFIT_AFTER_BARS - 1
+    prefix_fit = arima_model.ARIMA(closes[:split], order=ORDER).fit()
+    arima_model.save_arima_checkpoint("BTC", prefix_fit, closes[:split], ORDER, tmp_path)
+
+    model_fit = fit_arima(closes, ORDER, symbol="BTC", checkpoint_dir=tmp_path)
+
+    assert model_fit.estimated_nobs == len(closes)
+    assert model_fit.nobs == len(closes)
+    assert not np.allclose(model_fit.params, prefix_fit.params)
+
+
+def test_changed_history_or_order_refits_cold(closes, tmp_path):
+    MODEL_CACHE.clear()
+    fit_arima(closes[:-5], ORDER, symbol="BTC", checkpoint_dir=tmp_path)
+
+    revised = closes.copy()
+    revised[10] += 1.0
+    assert arima_model.load_arima_checkpoint("BTC", revised, ORDER, tmp_path) is None
+    assert arima_model.load_arima_checkpoint("BTC", closes, (2, 1, 0), tmp_path) is None
+    assert arima_model.load_arima_checkpoint("BTC", closes, ORDER, tmp_path) is not None
@@ -0,0 +1,44 @@
+import threading
+
+import pytest
+
+from src.atomic_files import atomic_path, write_text_atomic
+
+
+def test_concurrent_writers_never_share_a_temp_file(tmp_path):
+    path = tmp_path / "orders.json"
+    barrier = threading.Barrier(8)
+    errors = []
+
+    def write(i):
+        try:
+            barrier.wait(5)
+            for _ in range(50):
+                write_text_atomic(path, str(i) * 1000)
+        except Exception as error:  # noqa: BLE001
+            errors.append(error)
+
+    threads = [threading.Thread(target=write, args=(i,)) for i in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(30)
+
+    assert errors == []
+    text = path.read_text()
+    assert len(text) == 1000 and len(set(text)) == 1
+    assert [p.name for p in tmp_path.iterdir()] == ["orders.json"]
+
+
+def test_failed_write_keeps_the_old_file(tmp_path):
+    path = tmp_path / "BTC.npz"
+    path.write_bytes(b"old")
+
+    with pytest.raises(OSError):
+        with atomic_path(path, suffix=".tmp.npz") as tmp:
+            assert tmp.name.endswith(".tmp.npz")
+            tmp.write_bytes(b"half")
+            raise OSError("disk full")
+
+    assert path.read_bytes() == b"old"
+    assert [p.name for p in tmp_path.iterdir()] == ["BTC.npz"]
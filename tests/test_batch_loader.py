@@ -0,0 +1,113 @@
+import importlib.util
+import threading
+from http.server import ThreadingHTTPServer
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from aiohttp import ClientResponseError
+
+from src.batch_loader import load_many
+from src.data_loader import load_crypto_data
+from src.data_sources import CachedSource, InMemorySource, ParquetStoreSource, YahooChartSource
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "benchmark_batch_loading.py"
+spec = importlib.util.spec_from_file_location("benchmark_batch_loading", SCRIPT)
+benchmark = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(benchmark)
+
+START_DATE = "2024-01-01"
+
+
+@pytest.fixture
+def chart_server():
+    """
+    The benchmark's stand-in chart API on a free local port.
+    Yields (base_url, canned frames, log of requested symbols).
+    """
+
+    dates = pd.date_range("2023-06-01", "2026-01-31", freq="D", name="Date")
+    frames = {
+        symbol: pd.DataFrame({
+            "Open": price, "High": price + 1, "Low": price - 1, "Close": price, "Volume": 1e6,
+        }, index=dates)
+        for symbol, price in [("BTC", 100.0), ("ETH", 50.0), ("SOL", 10.0)]
+    }
+    log = []
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), benchmark.make_handler(frames, 0.0, log))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}/v8/finance/chart", frames, log
+    server.shutdown()
+
+
+def test_batch_fills_and_reuses_the_store(chart_server, tmp_path):
+    base_url, frames, log = chart_server
+    source = ParquetStoreSource(tmp_path, remote=YahooChartSource(base_url))
+
+    loaded, errors = load_many(list(frames), START_DATE, source)
+
+    assert errors == {}
+    assert sorted(log) == sorted(frames)
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["BTC.parquet", "ETH.parquet", "SOL.parquet"]
+
+    # Same frames as the single-coin path, which now needs no requests
+    log.clear()
+    for symbol, df in loaded.items():
+        pd.testing.assert_frame_equal(df, load_crypto_data(symbol, START_DATE, source))
+        assert df["Date"].iloc[0] == pd.Timestamp(START_DATE)
+        assert df["Date"].iloc[-1] == pd.Timestamp("2025-12-31")
+    assert log == []
+
+    again, _ = load_many(list(frames), START_DATE, source)
+    assert log == []
+    assert again.keys() == loaded.keys()
+
+
+def test_bad_symbol_does_not_fail_the_batch(chart_server, tmp_path):
+    base_url, frames, _ = chart_server
+    source = ParquetStoreSource(tmp_path, remote=YahooChartSource(base_url))
+
+    loaded, errors = load_many(["BTC", "NOPE", "ETH"], START_DATE, source)
+
+    assert sorted(loaded) == ["BTC", "ETH"]
+    assert list(errors) == ["NOPE"]
+    assert isinstance(errors["NOPE"], ClientResponseError) and errors["NOPE"].status == 404
+
+
+def test_store_only_batch_never_fetches(chart_server, tmp_path):
+    base_url, frames, log = chart_server
+    load_many(["BTC"], START_DATE, ParquetStoreSource(tmp_path, remote=YahooChartSource(base_url)))
+    log.clear()
+
+    loaded, errors = load_many(["BTC", "ETH"], START_DATE, ParquetStoreSource(tmp_path))
+
+    assert log == []
+    assert list(loaded) == ["BTC"]
+    assert isinstance(errors["ETH"], ValueError)
+
+
+class RecordingSource(InMemorySource):
+    def __init__(self, frames):
+        super().__init__(frames)
+        self.calls = []
+
+    def fetch(self, symbol, start, end):
+        self.calls.append(symbol)
+        return super().fetch(symbol, start, end)
+
+
+def test_batch_uses_the_configured_remote(chart_server, tmp_path):
+    _, frames, log = chart_server
+    remote = RecordingSource({symbol: df.reset_index() for symbol, df in frames.items()})
+    source = ParquetStoreSource(tmp_path / "store", remote=CachedSource(remote, tmp_path / "cache"))
+
+    loaded, errors = load_many(list(frames), START_DATE, source)
+
+    assert errors == {}
+    assert log == []
+    assert sorted(remote.calls) == sorted(frames)
+    assert len(list((tmp_path / "cache").iterdir())) == len(frames)
+    for symbol, df in loaded.items():
+        assert df["Date"].iloc[0] == pd.Timestamp(START_DATE)
+        assert df["Close"].iloc[-1] == frames[symbol]["Close"].iloc[-1]
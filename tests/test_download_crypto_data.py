@@ -0,0 +1,108 @@
+import importlib.util
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "download_crypto_data.py"
+spec = importlib.util.spec_from_file_location("download_crypto_data", SCRIPT)
+download = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(download)
+
+
+def _bars(start, end):
+    dates = pd.date_range(start, end, freq="D", inclusive="left")
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": 1.0, "High": 2.0, "Low": 0.5, "Close": 1.5, "Volume": 100.0,
+    })
+
+
+class CannedFetch:
+    """
+    Stand-in for fetch_yfinance: serves bars for [start, end) and can fail
+    the first `failures` calls.
+    """
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.calls = []
+
+    def __call__(self, symbol, start, end):
+        self.calls.append((symbol, start, end))
+        if len(self.calls) <= self.failures:
+            raise ConnectionError("stand-in outage")
+        return _bars(start, end)
+
+
+@pytest.fixture
+def saved_csv(tmp_path):
+    today = pd.Timestamp.today().normalize()
+    history = _bars(today - pd.Timedelta(days=30), today - pd.Timedelta(days=5))
+    path = tmp_path / "BTC.csv"
+    history.to_csv(path, index=False)
+    return path, history
+
+
+def test_incremental_refresh_appends_after_last_saved_date(saved_csv):
+    path, history = saved_csv
+    fetch = CannedFetch()
+
+    written = download.refresh_coin("BTC", "BTC-USD", fetch=fetch, output_dir=path.parent,
+                                    incremental=True, backoff=0)
+
+    _, start, end = fetch.calls[0]
+    assert start == history["Date"].iloc[-1] + pd.Timedelta(days=1)
+    assert end == pd.Timestamp.today().normalize()
+
+    df = pd.read_csv(path, parse_dates=["Date"])
+    assert written == 5
+    assert len(df) == len(history) + 5
+    assert df["Date"].is_monotonic_increasing and df["Date"].is_unique
+    assert download.last_saved_date(path) == end - pd.Timedelta(days=1)
+
+
+def test_refresh_retries_with_backoff(saved_csv, monkeypatch):
+    path, history = saved_csv
+    sleeps = []
+    monkeypatch.setattr(download.time, "sleep", sleeps.append)
+    fetch = CannedFetch(failures=2)
+
+    written = download.refresh_coin("BTC", "BTC-USD", fetch=fetch, output_dir=path.parent,
+                                    incremental=True, retries=3, backoff=1.0)
+
+    assert written == 5
+    assert len(fetch.calls) == 3
+    # Exponential backoff with up to 100% jitter
+    assert 1.0 <= sleeps[0] < 2.0
+    assert 2.0 <= sleeps[1] < 4.0
+
+
+def test_failed_fetch_leaves_csv_intact(saved_csv, monkeypatch):
+    path, _ = saved_csv
+    before = path.read_bytes()
+    monkeypatch.setattr(download.time, "sleep", lambda seconds: None)
+    fetch = CannedFetch(failures=10)
+
+    results = download.refresh_all({"BTC": "BTC-USD"}, fetch=fetch, output_dir=path.parent,
+                                   incremental=True, retries=2)
+
+    assert isinstance(results["BTC"], ConnectionError)
+    assert len(fetch.calls) == 3
+    assert path.read_bytes() == before
+    assert sorted(p.name for p in path.parent.iterdir()) == ["BTC.csv"]
+
+
+def test_interrupted_write_leaves_csv_intact(saved_csv):
+    path, _ = saved_csv
+    before = path.read_bytes()
+
+    class Unwritable(pd.DataFrame):
+        def to_csv(self, *args, **kwargs):
+            raise OSError("disk full")
+
+    with pytest.raises(OSError):
+        download.write_csv_atomic(Unwritable(_bars("2030-01-01", "2030-01-03")), path, append=True)
+
+    assert path.read_bytes() == before
+    assert sorted(p.name for p in path.parent.iterdir()) == ["BTC.csv"]
@@ -0,0 +1,62 @@
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+from src.data_loader import load_crypto_data
+from src.data_sources import CSVDirectorySource
+from src.feature_engine import FeatureEngine
+from src.preprocessing import preprocess_crypto_data
+
+CSV_DIR = Path(__file__).resolve().parents[1] / "data" / "eda"
+COINS = sorted(path.stem for path in CSV_DIR.glob("*.csv"))
+
+
+def _history(symbol):
+    return load_crypto_data(symbol, "2016-01-01", CSVDirectorySource(CSV_DIR))
+
+
+@pytest.mark.parametrize("symbol", COINS)
+def test_bulk_matches_preprocess_exactly(symbol):
+    df = _history(symbol)
+
+    _, features = FeatureEngine.from_history(df)
+
+    pd.testing.assert_frame_equal(features, preprocess_crypto_data(df), check_exact=True)
+
+
+@pytest.mark.parametrize("symbol", ["BTC", "DOGE", "SOL"])
+def test_incremental_after_state_round_trip_matches_bulk(symbol, tmp_path):
+    df = _history(symbol)
+    expected = preprocess_crypto_data(df)
+    split = len(df) - 100
+
+    engine, head = FeatureEngine.from_history(df.iloc[:split])
+    engine.save(symbol, tmp_path)
+    assert FeatureEngine.load(symbol, tmp_path).to_state() == engine.to_state()
+
+    # Resume in a "new process": 99 bars as a batch, then one at a time
+    engine = FeatureEngine.load(symbol, tmp_path)
+    tail = engine.append(df.iloc[split:-1])
+    last = engine.append(df.iloc[-1:])
+    assert len(last) == 1
+
+    incremental = pd.concat([head, tail, last], ignore_index=True)
+    pd.testing.assert_frame_equal(incremental, expected, check_exact=True)
+
+
+def test_already_processed_bars_are_ignored():
+    df = _history("ETH")
+    engine, features = FeatureEngine.from_history(df)
+
+    assert engine.append(df.iloc[-5:]).empty
+    assert engine.last_date == df["Date"].iloc[-1]
+    assert len(features) == len(preprocess_crypto_data(df))
+
+
+def test_unknown_state_version_is_rejected():
+    state = FeatureEngine().to_state()
+    state["version"] = -1
+
+    with pytest.raises(ValueError):
+        FeatureEngine.from_state(state)
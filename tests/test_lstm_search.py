@@ -0,0 +1,48 @@
+from concurrent.futures import Future
+
+import numpy as np
+
+from src import lstm_search
+
+
+class InlineExecutor:
+    """
+    Runs the first `run` submissions at once and leaves the rest queued
+    (cancellable), like a busy process pool. The i-th candidate config
+    scores validation loss i.
+    """
+
+    def __init__(self, run, n_candidates):
+        self.run = run
+        self.configs = lstm_search.candidate_configs(n_candidates)
+        self.submitted = []
+
+    def submit(self, fn, scaled, config, weights, epochs, *args):
+        future = Future()
+        if len(self.submitted) < self.run:
+            future.set_result((float(self.configs.index(config)), weights, 0.0))
+        self.submitted.append(future)
+        return future
+
+
+def test_budget_is_checked_between_candidate_fits():
+    executor = InlineExecutor(run=1, n_candidates=6)
+
+    result = lstm_search.search_lstm_config(np.arange(400.0), executor, n_candidates=6,
+                                            max_seconds=0.0)
+
+    # Out of time after the first fit: the queued ones never run
+    assert sum(f.cancelled() for f in executor.submitted) == 5
+    assert result["rungs"] == [{"candidates": 1, "epochs": lstm_search.MIN_EPOCHS}]
+    assert result["config"] == lstm_search.candidate_configs(6)[0]
+    assert result["complete"] is False
+
+
+def test_search_within_budget_completes():
+    executor = InlineExecutor(run=100, n_candidates=9)
+
+    result = lstm_search.search_lstm_config(np.arange(400.0), executor, n_candidates=9)
+
+    assert [rung["candidates"] for rung in result["rungs"]] == [9, 3]
+    assert result["val_loss"] == 0.0
+    assert result["complete"] is True
@@ -0,0 +1,168 @@
+import sys
+import types
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.lstm_model import (
+    DEFAULT_LSTM_CONFIG,
+    EMBEDDING_DIM,
+    GLOBAL_MODEL_NAME,
+    MC_DROPOUT,
+    MODEL_CACHE,
+    _architecture,
+    _fit_key,
+    _save_artifact,
+    fit_lstm,
+    global_lstm_forecast,
+    has_global_intervals,
+    load_global_lstm,
+    training_options
+)
+from src.lstm_numpy import NumpyLSTM
+
+UNITS, STEPS, LOOKBACK = 8, 30, 20
+
+
+def _engine(n_coins, seed=0, dropout=0.0):
+    rng = np.random.default_rng(seed)
+    layer = lambda inputs: (  # noqa: E731
+        rng.normal(0, 0.3, (inputs, 4 * UNITS)),
+        rng.normal(0, 0.3, (UNITS, 4 * UNITS)),
+        np.zeros(4 * UNITS),
+    )
+    return NumpyLSTM(
+        [layer(1 + EMBEDDING_DIM), layer(UNITS)],
+        rng.normal(0, 0.3, (UNITS, STEPS)), np.zeros(STEPS),
+        embedding=rng.normal(0, 0.3, (n_coins, EMBEDDING_DIM)),
+        dropout=dropout
+    )
+
+
+def _frame(days, price):
+    return pd.DataFrame({
+        "Date": pd.date_range("2025-01-01", periods=days, freq="D"),
+        "Close": np.linspace(price, 2 * price, days),
+    })
+
+
+def _build(model_dir, coins, key="k1", seed=0, role="direct", dropout=0.0):
+    _save_artifact(model_dir / GLOBAL_MODEL_NAME, role, key, _engine(len(coins), seed, dropout), {
+        "coins": coins,
+        "lookback": LOOKBACK,
+        "ranges": {coin: [100.0, 200.0] for coin in coins},
+    })
+
+
+def test_unbuilt_model_is_not_served(tmp_path):
+    assert load_global_lstm(tmp_path) is None
+    assert global_lstm_forecast(_frame(90, 100.0), "BTC", model_dir=tmp_path) is None
+
+
+def test_prebuilt_model_serves_new_bars_without_training(tmp_path):
+    MODEL_CACHE.clear()
+    _build(tmp_path, ["BTC", "ETH"])
+
+    forecast = global_lstm_forecast(_frame(90, 100.0), "ETH", model_dir=tmp_path)
+    later = global_lstm_forecast(_frame(91, 100.0), "ETH", model_dir=tmp_path)
+
+    assert list(forecast.columns) == ["Date", "Forecast"] and len(forecast) == STEPS
+    assert later["Date"].iloc[0] == forecast["Date"].iloc[0] + pd.Timedelta(days=1)
+    assert "src.lstm_keras" not in sys.modules
+
+    # Coins outside the model, or another horizon, are not served
+    assert global_lstm_forecast(_frame(90, 100.0), "SOL", model_dir=tmp_path) is None
+    assert global_lstm_forecast(_frame(90, 100.0), "BTC", steps=7, model_dir=tmp_path) is None
+
+
+def test_rebuild_is_picked_up(tmp_path):
+    MODEL_CACHE.clear()
+    _build(tmp_path, ["BTC"], key="k1", seed=0)
+    before = global_lstm_forecast(_frame(90, 100.0), "BTC", model_dir=tmp_path)
+
+    _build(tmp_path, ["BTC"], key="k2", seed=1)
+    after = global_lstm_forecast(_frame(90, 100.0), "BTC", model_dir=tmp_path)
+
+    assert not np.allclose(before["Forecast"], after["Forecast"])
+
+
+def test_band_only_from_prebuilt_mc_model(tmp_path):
+    MODEL_CACHE.clear()
+    _build(tmp_path, ["BTC"])
+    point = global_lstm_forecast(_frame(90, 100.0), "BTC", model_dir=tmp_path)
+
+    # No -mc artifact: the point forecast alone, nothing trained
+    assert not has_global_intervals(tmp_path)
+    unbanded = global_lstm_forecast(_frame(90, 100.0), "BTC", samples=50, model_dir=tmp_path)
+    assert list(unbanded.columns) == ["Date", "Forecast"]
+    assert "src.lstm_keras" not in sys.modules
+
+    _build(tmp_path, ["BTC"], seed=1, role="direct-mc", dropout=MC_DROPOUT)
+    assert has_global_intervals(tmp_path)
+    banded = global_lstm_forecast(_frame(90, 100.0), "BTC", samples=50, model_dir=tmp_path)
+
+    # Forecast stays the deterministic model's; only the band is sampled
+    np.testing.assert_array_equal(banded["Forecast"], point["Forecast"])
+    assert (banded["Lower"] < banded["Upper"]).all()
+
+
+class Retrain(Exception):
+    pass
+
+
+@pytest.fixture
+def no_training(monkeypatch):
+    """
+    Stand-in for src.lstm_keras: any attempt to train raises Retrain.
+    """
+
+    def train(*args, **kwargs):
+        raise Retrain
+
+    keras = types.ModuleType("src.lstm_keras")
+    keras.TF_VERSION = "none"
+    keras.build_model = keras.configure = keras.seeded = keras.train_model = train
+    monkeypatch.setitem(sys.modules, "src.lstm_keras", keras)
+
+
+def _coin_engine(seed=0):
+    rng = np.random.default_rng(seed)
+    layer = lambda inputs: (  # noqa: E731
+        rng.normal(0, 0.3, (inputs, 4 * UNITS)),
+        rng.normal(0, 0.3, (UNITS, 4 * UNITS)),
+        np.zeros(4 * UNITS),
+    )
+    return NumpyLSTM([layer(1), layer(UNITS)], rng.normal(0, 0.3, (UNITS, 1)), np.zeros(1))
+
+
+def _export_coin(model_dir, closes, role="recursive", config=DEFAULT_LSTM_CONFIG):
+    closes = np.asarray(closes, dtype=np.float64).reshape(-1, 1)
+    key = _fit_key(closes, LOOKBACK, 1, None, training_options(), _architecture(config))
+    _save_artifact(model_dir / "BTC", role, key, _coin_engine(), {
+        "data_min": float(closes.min()),
+        "data_max": float(closes.max()),
+    })
+
+
+def test_per_coin_artifact_is_served_only_for_its_key(tmp_path, no_training):
+    MODEL_CACHE.clear()
+    closes = _frame(120, 100.0)["Close"].values
+    _export_coin(tmp_path, closes)
+
+    engine, scaler = fit_lstm(closes, "recursive", LOOKBACK, symbol="BTC", model_dir=tmp_path)
+    np.testing.assert_array_equal(engine.dense_kernel, _coin_engine().dense_kernel)
+    assert scaler.data_max_[0] == closes.max()
+
+    # A new bar, a revised price, another config or another role: retrain
+    MODEL_CACHE.clear()
+    revised = closes.copy()
+    revised[5] += 1.0
+    for series, role, config in [
+        (np.append(closes, closes[-1]), "recursive", None),
+        (revised, "recursive", None),
+        (closes, "recursive", {"units": 64}),
+        (closes, "direct", None),
+    ]:
+        with pytest.raises(Retrain):
+            fit_lstm(series, role, LOOKBACK, symbol="BTC", model_dir=tmp_path, architecture=config)
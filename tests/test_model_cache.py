@@ -0,0 +1,81 @@
+import threading
+
+from src.model_cache import FittedModelCache
+
+
+def _in_threads(n, target):
+    results, errors = [None] * n, [None] * n
+
+    def run(i):
+        try:
+            results[i] = target()
+        except Exception as error:  # noqa: BLE001
+            errors[i] = error
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(n)]
+    for thread in threads:
+        thread.start()
+    return threads, results, errors
+
+
+def test_concurrent_requests_share_one_fit():
+    cache = FittedModelCache()
+    started, release = threading.Event(), threading.Event()
+    calls = []
+
+    def fit():
+        calls.append(1)
+        started.set()
+        release.wait(5)
+        return "model"
+
+    first, first_results, _ = _in_threads(1, lambda: cache.get_or_fit("BTC", fit))
+    started.wait(5)
+    others, other_results, _ = _in_threads(3, lambda: cache.get_or_fit("BTC", fit))
+
+    release.set()
+    for thread in first + others:
+        thread.join(5)
+
+    assert len(calls) == 1
+    assert first_results + other_results == ["model"] * 4
+    assert cache.get("BTC") == "model"
+
+
+def test_failed_fit_reaches_waiters_and_is_not_cached():
+    cache = FittedModelCache()
+    started, release = threading.Event(), threading.Event()
+
+    def fit():
+        started.set()
+        release.wait(5)
+        raise ValueError("did not converge")
+
+    first, _, first_errors = _in_threads(1, lambda: cache.get_or_fit("BTC", fit))
+    started.wait(5)
+    waiter, _, waiter_errors = _in_threads(1, lambda: cache.get_or_fit("BTC", fit))
+
+    release.set()
+    for thread in first + waiter:
+        thread.join(5)
+
+    assert isinstance(first_errors[0], ValueError)
+    assert isinstance(waiter_errors[0], ValueError)
+    assert "BTC" not in cache
+
+    # The next request fits again
+    assert cache.get_or_fit("BTC", lambda: "model") == "model"
+
+
+def test_other_keys_do_not_wait():
+    cache = FittedModelCache()
+    release = threading.Event()
+
+    started = threading.Event()
+    slow, _, _ = _in_threads(1, lambda: cache.get_or_fit("BTC", lambda: started.set() or release.wait(5)))
+    started.wait(5)
+    assert cache.get_or_fit("ETH", lambda: "model") == "model"
+
+    release.set()
+    slow[0].join(5)
+    assert cache.get("BTC") is True
@@ -0,0 +1,36 @@
+import numpy as np
+import pandas as pd
+
+from src.panel import CURRENT_FILE, KEEP_BUILDS, OHLCVPanel, build_panel
+
+
+def _frame(start, periods, price):
+    return pd.DataFrame({
+        "Date": pd.date_range(start, periods=periods, freq="D"),
+        "Open": price, "High": price, "Low": price, "Close": price, "Volume": price,
+    })
+
+
+def test_rebuild_swaps_whole_build(tmp_path):
+    build_panel({"BTC": _frame("2020-01-01", 5, 1.0)}, tmp_path)
+    old = OHLCVPanel.open(tmp_path)
+
+    new = build_panel({"BTC": _frame("2020-01-01", 8, 2.0), "ETH": _frame("2020-01-03", 6, 3.0)}, tmp_path)
+
+    # The reader opened before the rebuild still sees one consistent build
+    assert old.symbols == ["BTC"] and old.values.shape == (1, 5, 5)
+    assert old.mask.shape == (1, 5) and len(old.dates) == 5
+    assert np.all(old.values == 1.0)
+
+    assert new.symbols == ["BTC", "ETH"] and new.values.shape == (2, 8, 5)
+    assert new.mask.sum() == 14
+    assert new.frame("ETH")["Close"].eq(3.0).all()
+
+
+def test_old_builds_are_pruned(tmp_path):
+    for n in range(KEEP_BUILDS + 2):
+        build_panel({"BTC": _frame("2020-01-01", 3 + n, float(n))}, tmp_path)
+
+    builds = sorted(p.name for p in tmp_path.glob("build-*"))
+    assert len(builds) == KEEP_BUILDS
+    assert (tmp_path / CURRENT_FILE).read_text() == builds[-1]
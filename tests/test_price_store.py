@@ -0,0 +1,89 @@
+import pandas as pd
+
+from src.data_sources import DataSource, InMemorySource, ParquetStoreSource
+from src.price_store import read_store
+
+
+def _prices(start, end):
+    dates = pd.date_range(start, end, freq="D")
+    return pd.DataFrame({
+        "Date": dates,
+        "Open": 1.0, "High": 1.0, "Low": 1.0, "Close": 1.0, "Volume": 1.0,
+    })
+
+
+class FlakySource(DataSource):
+    """
+    Answers empty (as yfinance does on a network error) until `fail` is False.
+    """
+
+    def __init__(self, frames):
+        self.source = InMemorySource(frames)
+        self.fail = False
+        self.calls = []
+
+    def fetch(self, symbol, start, end):
+        self.calls.append((start, end))
+        if self.fail:
+            return self.source.fetch("", start, end)
+        return self.source.fetch(symbol, start, end)
+
+
+def test_failed_leading_gap_is_retried(tmp_path):
+    remote = FlakySource({"BTC": _prices("2020-01-01", "2020-12-31")})
+    store = ParquetStoreSource(tmp_path, remote=remote)
+
+    store.fetch("BTC", pd.Timestamp("2020-06-01"), pd.Timestamp("2020-12-31"))
+
+    remote.fail = True
+    store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-12-31"))
+    _, coverage = read_store("BTC", tmp_path)
+    assert coverage[0] == pd.Timestamp("2020-06-01")
+
+    remote.fail = False
+    df = store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-12-31"))
+    _, coverage = read_store("BTC", tmp_path)
+    assert df["Date"].min() == pd.Timestamp("2020-01-01")
+    assert coverage[0] == pd.Timestamp("2020-01-01")
+
+
+def test_pre_listing_gap_is_covered_once_confirmed(tmp_path):
+    remote = FlakySource({"SOL": _prices("2020-04-10", "2020-12-31")})
+    store = ParquetStoreSource(tmp_path, remote=remote)
+
+    store.fetch("SOL", pd.Timestamp("2020-04-10"), pd.Timestamp("2020-12-31"))
+    df = store.fetch("SOL", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-12-31"))
+    assert df["Date"].min() == pd.Timestamp("2020-04-10")
+
+    # The source returned bars up to the stored ones but nothing earlier:
+    # the range before listing is covered and never asked for again
+    calls = len(remote.calls)
+    store.fetch("SOL", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-12-31"))
+    assert len(remote.calls) == calls
+
+
+def test_non_adjacent_request_fills_the_gap(tmp_path):
+    remote = FlakySource({"BTC": _prices("2020-01-01", "2022-12-31")})
+    store = ParquetStoreSource(tmp_path, remote=remote)
+
+    store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-06-30"))
+    store.fetch("BTC", pd.Timestamp("2022-01-01"), pd.Timestamp("2022-12-31"))
+
+    # The later request also fetched the days between the two ranges
+    assert remote.calls[-1] == (pd.Timestamp("2020-07-01"), pd.Timestamp("2022-12-31"))
+
+    df = store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2022-12-31"))
+    assert len(df) == 1096
+    assert df["Date"].diff().dropna().eq(pd.Timedelta(days=1)).all()
+
+
+def test_request_before_the_store_fills_the_gap(tmp_path):
+    remote = FlakySource({"BTC": _prices("2020-01-01", "2022-12-31")})
+    store = ParquetStoreSource(tmp_path, remote=remote)
+
+    store.fetch("BTC", pd.Timestamp("2022-01-01"), pd.Timestamp("2022-12-31"))
+    store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2020-06-30"))
+
+    df = store.fetch("BTC", pd.Timestamp("2020-01-01"), pd.Timestamp("2022-12-31"))
+    assert len(df) == 1096
+    assert read_store("BTC", tmp_path)[1] == (pd.Timestamp("2020-01-01"), pd.Timestamp("2022-12-31"))
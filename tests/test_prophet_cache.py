@@ -0,0 +1,77 @@
+import numpy as np
+import pandas as pd
+import pytest
+from prophet import Prophet
+
+from src import prophet_model
+from src.model_cache import MODEL_CACHE
+from src.prophet_model import PROPHET_CONFIG, fit_prophet
+
+
+class RecordingProphet(Prophet):
+    """
+    Prophet that records the `init` of every fit (None = cold start).
+    """
+
+    fits = []
+
+    def fit(self, df, **kwargs):
+        RecordingProphet.fits.append(kwargs.get("init"))
+        return super().fit(df, **kwargs)
+
+
+@pytest.fixture
+def fits(monkeypatch):
+    MODEL_CACHE.clear()
+    RecordingProphet.fits = []
+    monkeypatch.setattr(prophet_model, "Prophet", RecordingProphet)
+    return RecordingProphet.fits
+
+
+def _frame(days, start="2024-01-01"):
+    rng = np.random.default_rng(0)
+    ds = pd.date_range(start, periods=days, freq="D")
+    return pd.DataFrame({"ds": ds, "y": np.log(100 + np.cumsum(rng.normal(0, 1, days)))})
+
+
+def _restart():
+    # Only the on-disk cache survives a restart
+    MODEL_CACHE.clear()
+
+
+def test_exact_key_hit_loads_without_fitting(fits, tmp_path):
+    df = _frame(200)
+    model = fit_prophet(df, symbol="BTC", cache_dir=tmp_path)
+    _restart()
+
+    loaded = fit_prophet(df, symbol="BTC", cache_dir=tmp_path)
+
+    assert fits == [None]
+    np.testing.assert_array_equal(loaded.params["k"], model.params["k"])
+
+
+def test_new_bar_warm_starts_from_saved_params(fits, tmp_path):
+    model = fit_prophet(_frame(200), symbol="BTC", cache_dir=tmp_path)
+    expected = prophet_model.warm_start_params(model)
+    _restart()
+
+    fit_prophet(_frame(201), symbol="BTC", cache_dir=tmp_path)
+
+    assert len(fits) == 2 and fits[0] is None
+    assert set(fits[1]) == set(expected)
+    for name, value in expected.items():
+        np.testing.assert_allclose(fits[1][name], value)
+
+
+@pytest.mark.parametrize("change", ["config", "start"])
+def test_changed_config_or_start_fits_cold(fits, tmp_path, change):
+    fit_prophet(_frame(200), symbol="BTC", cache_dir=tmp_path)
+    _restart()
+
+    if change == "config":
+        fit_prophet(_frame(201), symbol="BTC", cache_dir=tmp_path,
+                    config=dict(PROPHET_CONFIG, weekly_seasonality=True))
+    else:
+        fit_prophet(_frame(201).iloc[1:].reset_index(drop=True), symbol="BTC", cache_dir=tmp_path)
+
+    assert fits == [None, None]
@@ -0,0 +1,109 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src import sarima_model
+from src.model_cache import MODEL_CACHE
+from src.sarima_model import (
+    CHECKPOINT_VERSION,
+    fit_options,
+    fit_sarima,
+    forecast_sarima_checkpoint,
+    load_sarima_checkpoint,
+    make_sarima_checkpoint,
+    resume_sarima_checkpoint,
+    sarima_forecast_30_days,
+    save_sarima_checkpoint,
+    undifference
+)
+
+NEW_BARS = 5
+
+
+@pytest.fixture
+def prices():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        "Date": pd.date_range("2024-01-01", periods=300, freq="D"),
+        "Close": 100 + np.cumsum(rng.normal(0, 1, 300)),
+    })
+
+
+@pytest.fixture
+def fits(monkeypatch):
+    """
+    Lengths of the series given to full SARIMA fits.
+    """
+
+    MODEL_CACHE.clear()
+    calls = []
+
+    def counting_fit(values, fit_mode="default"):
+        calls.append(len(values))
+        return fit_sarima(values, fit_mode)
+
+    monkeypatch.setattr(sarima_model, "fit_sarima", counting_fit)
+    return calls
+
+
+@pytest.mark.parametrize("fit_mode", ["default", "fast"])
+def test_resume_matches_append_without_refit(prices, fit_mode):
+    MODEL_CACHE.clear()
+    series = prices["Close"].to_numpy()
+    head, new = series[:-NEW_BARS], series[-NEW_BARS:]
+
+    model_fit = fit_sarima(head, fit_mode)
+    checkpoint = make_sarima_checkpoint(model_fit, head, prices["Date"].iloc[-NEW_BARS - 1], fit_options(fit_mode))
+    resumed = resume_sarima_checkpoint(checkpoint, new, prices["Date"].iloc[-1])
+
+    # statsmodels appending the same bars with the parameters kept
+    appended = model_fit.append(new, refit=False)
+    expected = np.asarray(appended.forecast(30))
+    model = appended.model
+    if model.simple_differencing:
+        expected = undifference(expected, series, model.k_diff, model.k_seasonal_diff, model.seasonal_periods)
+
+    np.testing.assert_allclose(forecast_sarima_checkpoint(resumed, 30), expected, rtol=1e-12)
+    assert resumed["meta"]["bars_since_fit"] == NEW_BARS
+    assert resumed["meta"]["nobs"] == len(series)
+
+
+def test_new_bars_resume_from_the_saved_checkpoint(prices, fits, tmp_path):
+    sarima_forecast_30_days(prices.iloc[:-NEW_BARS], fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+    assert fits == [len(prices) - NEW_BARS]
+
+    forecast = sarima_forecast_30_days(prices, fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+
+    assert fits == [len(prices) - NEW_BARS]
+    assert load_sarima_checkpoint("BTC", tmp_path)["meta"]["bars_since_fit"] == NEW_BARS
+    assert forecast["Date"].iloc[0] == prices["Date"].iloc[-1] + pd.Timedelta(days=1)
+
+
+def test_revised_tail_refits(prices, fits, tmp_path):
+    sarima_forecast_30_days(prices.iloc[:-NEW_BARS], fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+
+    revised = prices.copy()
+    revised.loc[len(prices) - NEW_BARS - 1, "Close"] += 1.0
+    sarima_forecast_30_days(revised, fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+
+    assert fits == [len(prices) - NEW_BARS, len(prices)]
+    assert load_sarima_checkpoint("BTC", tmp_path)["meta"]["bars_since_fit"] == 0
+
+
+@pytest.mark.parametrize("change", ["version", "order", "options"])
+def test_other_version_order_or_options_refit(prices, fits, tmp_path, change):
+    sarima_forecast_30_days(prices.iloc[:-NEW_BARS], fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+
+    checkpoint = load_sarima_checkpoint("BTC", tmp_path)
+    if change == "version":
+        checkpoint["meta"]["version"] = CHECKPOINT_VERSION + 1
+    elif change == "order":
+        checkpoint["meta"]["order"] = [2, 1, 1]
+    else:
+        checkpoint["meta"]["options"] = fit_options("default")
+    save_sarima_checkpoint("BTC", checkpoint, tmp_path)
+
+    sarima_forecast_30_days(prices, fit_mode="fast", symbol="BTC", checkpoint_dir=tmp_path)
+
+    assert fits == [len(prices) - NEW_BARS, len(prices)]
+    assert load_sarima_checkpoint("BTC", tmp_path)["meta"]["order"] == list(sarima_model.SARIMA_ORDER)